@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the output built from several pages: the DataFrame of each page concatenated then converted,
+against the records accumulated in a list and converted once.
+
+Usage: python benchmarks/bench_pager.py [nb_of_rows]
+"""
+
+import sys
+import tracemalloc
+import pandas as pd
+from time import perf_counter
+from cardano_explorer.blockfrost.query import format_records
+
+def synthetic_pages(nb_of_rows: int) -> list:
+    "Pages of 100 records shaped like the stake rewards history"
+    records = [{'epoch': i, 'amount': str(i * 1000000), 'pool_id': 'pool1pu5jlj4q9w9jlxeu370a3c9myx47md5j5m2str0naunn2q3lkdy'} for i in range(nb_of_rows)]
+    return [records[i:i + 100] for i in range(0, nb_of_rows, 100)]
+
+def concat_dataframes(pages: list, pandas: bool) -> object:
+    "Previous pager: a DataFrame per page, concatenated and converted in a dictionary, converted again in a DataFrame for pandas=True"
+    dataframes = [pd.DataFrame.from_dict(page) for page in pages]
+    _dict = pd.concat(dataframes).reset_index(drop=True).to_dict()
+    return pd.DataFrame.from_dict(_dict) if pandas else _dict
+
+def accumulate_records(pages: list, pandas: bool) -> object:
+    "Current pager: the records of every page in a list, the output built once"
+    records = []
+    for page in pages:
+        records.extend(page)
+    return format_records(records, 'pandas' if pandas else 'dict')
+
+def measure(function, pages: list, pandas: bool) -> tuple:
+    "Get the time in seconds and the peak of memory allocated in MB"
+    tracemalloc.start()
+    start_time = perf_counter()
+    function(pages, pandas)
+    elapsed_time = perf_counter() - start_time
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed_time, peak / 1024 / 1024
+
+if __name__ == '__main__':
+    nb_of_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    pages = synthetic_pages(nb_of_rows)
+
+    print('{} rows, {} pages'.format(nb_of_rows, len(pages)))
+    print('{:<20}{:<8}{:>10}{:>14}'.format('pager', 'output', 'time (s)', 'peak (MB)'))
+
+    for pandas in (False, True):
+        for function in (concat_dataframes, accumulate_records):
+            elapsed_time, peak = measure(function, pages, pandas)
+            print('{:<20}{:<8}{:>10.3f}{:>14.1f}'.format(function.__name__, 'pandas' if pandas else 'dict', elapsed_time, peak))
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+
+"""
+Offline benchmarks of the client against a local stand-in of the Blockfrost API (benchmarks/mock_server.py).
+Measure the time, the throughput, the requests and the peak of memory of the pager, assets_policy_info, epochs_history, stake_rewards_corr and portfolio.
+The results are saved in a JSON file, compared with the results of a previous run with --compare.
+
+Usage: python benchmarks/bench_suite.py [--latency 0.005] [--scale 1] [--output bench_results.json] [--compare previous.json]
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from time import perf_counter, time
+from contextlib import redirect_stderr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockBlockfrost
+from cardano_explorer import blockfrost_api
+
+# Keys of the synthetic datasets
+bf_bench_asset = 'a0028f350aaabe0545fdcb56b039bfb08e4bb4d8c4d7c3c7d481c235484f534b59'
+bf_bench_policy = 'a0028f350aaabe0545fdcb56b039bfb08e4bb4d8c4d7c3c7d481c235'
+bf_bench_stake_addresses = ['stake1u9mock{:04d}'.format(i) for i in range(1000)]
+
+def create_auth(mock: MockBlockfrost, max_concurrency: int, cache_path: str=None) -> blockfrost_api.Auth:
+    "Client of the mock, without client rate limit for measure the client itself"
+    return blockfrost_api.Auth(network=mock.url, apiKey='benchmark', max_concurrency=max_concurrency, pool_maxsize=max(10, max_concurrency),
+                               rate_limit=None, cache_path=cache_path)
+
+def pager(auth: blockfrost_api.Auth, output: str='dict', stream: bool=False) -> int:
+    "Every transaction of an asset, one page of records after another"
+    if stream:
+        return sum(1 for _ in auth.asset_transactions(bf_bench_asset, nb_of_results=None, stream=True))
+
+    response = auth.asset_transactions(bf_bench_asset, nb_of_results=None, output=output)
+
+    # The dictionary output hold a dictionary by column
+    return len(next(iter(response.values()), {})) if output == 'dict' else len(response)
+
+def assets_policy_info(auth: blockfrost_api.Auth) -> int:
+    "Informations about every asset of a policy"
+    with open(os.devnull, 'w') as devnull, redirect_stderr(devnull):
+        return len(auth.assets_policy_info(bf_bench_policy, max_workers=auth.max_concurrency))
+
+def epochs_history(auth: blockfrost_api.Auth, epochs: range) -> int:
+    "Informations about a range of epochs"
+    return len(auth.epochs_history(epochs, pandas=True))
+
+def stake_rewards_corr(auth: blockfrost_api.Auth, nb_stake_addresses: int) -> int:
+    "Rewards analysis of a batch of stake addresses"
+    return len(auth.stake_rewards_corr(bf_bench_stake_addresses[:nb_stake_addresses], pandas=True))
+
+def portfolio(auth: blockfrost_api.Auth, nb_stake_addresses: int, utxos: bool) -> int:
+    "Holdings of a batch of stake addresses"
+    return len(auth.portfolio(bf_bench_stake_addresses[:nb_stake_addresses], utxos=utxos, pandas=True))
+
+def scenarios(scale: float) -> list:
+    """
+    Get the scenarios: name, parameters of the mock, parameters of the client and function measured.
+
+    :param scale: Factor of the size of the datasets
+    :return: List of the scenarios
+    """
+    nb_transactions = int(20000 * scale)
+    nb_assets = int(500 * scale)
+    nb_stake_addresses = max(1, int(20 * scale))
+    nb_portfolios = max(1, int(200 * scale))
+
+    return [
+        ('pager', {'nb_transactions': nb_transactions}, {'max_concurrency': 1}, lambda auth: pager(auth, 'dict')),
+        ('pager', {'nb_transactions': nb_transactions}, {'max_concurrency': 8}, lambda auth: pager(auth, 'dict')),
+        ('pager', {'nb_transactions': nb_transactions}, {'max_concurrency': 8, 'output': 'pandas'}, lambda auth: pager(auth, 'pandas')),
+        ('pager', {'nb_transactions': nb_transactions}, {'max_concurrency': 8, 'stream': True}, lambda auth: pager(auth, stream=True)),
+        ('pager', {'nb_transactions': nb_transactions, 'page_size': 50}, {'max_concurrency': 8}, lambda auth: pager(auth, 'dict')),
+        ('pager_429', {'nb_transactions': nb_transactions, 'rate_limit_every': 10}, {'max_concurrency': 8}, lambda auth: pager(auth, 'dict')),
+        ('assets_policy_info', {'nb_assets': nb_assets}, {'max_concurrency': 8}, assets_policy_info),
+        ('epochs_history', {}, {'max_concurrency': 8}, lambda auth: epochs_history(auth, range(208, 451))),
+        ('epochs_history', {}, {'max_concurrency': 8, 'cache': 'warm'}, lambda auth: epochs_history(auth, range(208, 451))),
+        ('stake_rewards_corr', {}, {'max_concurrency': 8, 'nb_stake_addresses': nb_stake_addresses}, lambda auth: stake_rewards_corr(auth, nb_stake_addresses)),
+        ('portfolio', {}, {'max_concurrency': 8, 'nb_stake_addresses': nb_portfolios}, lambda auth: portfolio(auth, nb_portfolios, True)),
+        ('portfolio', {}, {'max_concurrency': 8, 'nb_stake_addresses': nb_portfolios, 'utxos': False}, lambda auth: portfolio(auth, nb_portfolios, False)),
+    ]
+
+def measure(function, mock: MockBlockfrost, client_parameters: dict, memory: bool) -> dict:
+    """
+    Run a scenario and measure it.
+
+    :param function: Function of the scenario, returning the number of records
+    :param mock: The mock server
+    :param client_parameters: Parameters of the client
+    :param memory: True for also measure the peak of memory, with a second run traced by tracemalloc
+    :return: Dictionary with the measures
+    """
+    cache_dir = tempfile.mkdtemp()
+    cache_path = os.path.join(cache_dir, 'cache.sqlite') if client_parameters.get('cache') else None
+
+    try:
+        auth = create_auth(mock, client_parameters['max_concurrency'], cache_path)
+
+        # The warm cache is filled by a first run
+        if client_parameters.get('cache') == 'warm':
+            function(auth)
+
+        mock.reset_counters()
+        auth.stats.reset()
+
+        start_time = perf_counter()
+        nb_records = function(auth)
+        elapsed_time = perf_counter() - start_time
+
+        summary = auth.stats.summary()
+        result = {'seconds': elapsed_time,
+                  'records': nb_records,
+                  'records_per_second': nb_records / elapsed_time if elapsed_time else None,
+                  'requests': mock.requests,
+                  'requests_per_second': mock.requests / elapsed_time if elapsed_time else None,
+                  'rate_limited': mock.rate_limited,
+                  'retries': summary['retries'],
+                  'cache_hits': summary['cache_hits'] + summary['memory_cache_hits'],
+                  'bytes': summary['bytes'],
+                  'peak_memory_mb': None}
+        auth.close()
+
+        if memory:
+            auth = create_auth(mock, client_parameters['max_concurrency'], cache_path)
+            tracemalloc.start()
+            function(auth)
+            result['peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            auth.close()
+
+        return result
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+def git_revision() -> str:
+    "Get the git revision of the repository, None outside a git repository"
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(latency: float, scale: float, memory: bool, names: list=None) -> dict:
+    """
+    Run the scenarios.
+
+    :param latency: Latency of the mock, in seconds
+    :param scale: Factor of the size of the datasets
+    :param memory: True for measure the peak of memory
+    :param names: Optional, names of the scenarios to run (default: every scenario)
+    :return: Dictionary with the environment, the parameters and the results
+    """
+    results = []
+
+    for name, mock_parameters, client_parameters, function in scenarios(scale):
+        if names and name not in names:
+            continue
+
+        with MockBlockfrost(latency=latency, **mock_parameters) as mock:
+            result = measure(function, mock, client_parameters, memory)
+
+        result = dict(scenario=name, mock=mock_parameters, client=client_parameters, **result)
+        results.append(result)
+
+        print('{:<20}{:<50}{:>9.3f}{:>12.0f}{:>10}{:>9}{:>12}'.format(name, json.dumps(dict(mock_parameters, **client_parameters))[:49], result['seconds'],
+                                                                     result['records_per_second'] or 0, result['requests'], result['retries'],
+                                                                     '{:.1f}'.format(result['peak_memory_mb']) if result['peak_memory_mb'] is not None else '-'))
+
+    return {'revision': git_revision(),
+            'timestamp': time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parameters': {'latency': latency, 'scale': scale},
+            'results': results}
+
+def scenario_key(result: dict) -> str:
+    "Identifier of a scenario and its parameters, for compare two runs"
+    return json.dumps([result['scenario'], result['mock'], result['client']], sort_keys=True)
+
+def compare(results: dict, previous_results: dict):
+    """
+    Print the change of time of each scenario since a previous run.
+
+    :param results: Results of the run
+    :param previous_results: Results of the previous run
+    """
+    previous = {scenario_key(result): result for result in previous_results['results']}
+
+    print('\nCompared with {} ({})'.format(previous_results.get('revision'), previous_results['parameters']))
+
+    for result in results['results']:
+        previous_result = previous.get(scenario_key(result))
+        if previous_result is None:
+            continue
+        change = (result['seconds'] - previous_result['seconds']) / previous_result['seconds'] * 100
+        print('{:<20}{:<50}{:>9.3f}{:>9.3f}{:>+9.1f}%'.format(result['scenario'], json.dumps(dict(result['mock'], **result['client']))[:49], previous_result['seconds'], result['seconds'], change))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--latency', type=float, default=0.005, help='latency of each response of the mock, in seconds (default: 0.005)')
+    parser.add_argument('--scale', type=float, default=1, help='factor of the size of the datasets (default: 1)')
+    parser.add_argument('--scenarios', nargs='*', help='names of the scenarios to run (default: every scenario)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the measure of the peak of memory')
+    parser.add_argument('--output', default='bench_results.json', help='file of the results (default: bench_results.json)')
+    parser.add_argument('--compare', help='results of a previous run to compare with')
+    args = parser.parse_args()
+
+    print('{:<20}{:<50}{:>9}{:>12}{:>10}{:>9}{:>12}'.format('scenario', 'parameters', 'time (s)', 'records/s', 'requests', 'retries', 'peak (MB)'))
+
+    results = run(args.latency, args.scale, not args.no_memory, args.scenarios)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print('\nResults saved in {}'.format(args.output))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
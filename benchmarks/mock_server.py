@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+
+"""
+Local stand-in of the Blockfrost API serving synthetic data, for the offline benchmarks.
+The latency, the size of the pages, the 429 responses, the failures and the size of the datasets are configurable.
+
+Usage: python benchmarks/mock_server.py [port]
+"""
+
+import sys
+import json
+import zlib
+import socket
+import threading
+from time import sleep, time
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# First epoch of the Shelley era, the first epoch with rewards
+bf_mock_first_epoch = 208
+
+# Duration of an epoch, in seconds
+bf_mock_epoch_duration = 432000
+
+def key_hash(key: str) -> int:
+    "Deterministic hash of a key (stake address, policy...), the synthetic data are the same at each run"
+    return zlib.crc32(key.encode())
+
+class MockBlockfrost:
+    """
+    HTTP server answering the Blockfrost endpoints used by the benchmarks with synthetic data:
+    accounts, their rewards, history, addresses and assets, pools and their history, epochs, address UTXOs and transactions, asset transactions, assets of a policy, assets, transactions with their UTXOs and metadata, and blocks.
+    """
+
+    def __init__(self, latency: float=0.0, page_size: int=100, rate_limit_every: int=0, retry_after: float=0.05, nb_transactions: int=10000, nb_assets: int=1000, nb_pools: int=20, latest_epoch: int=450, fail_from_page: int=0, missing_keys: tuple=(), port: int=0):
+        """
+        :param latency: Optional, time in seconds waited before each response (default: 0)
+        :param page_size: Optional, number of records of each page (default: 100)
+        :param rate_limit_every: Optional, answer 429 to one request out of rate_limit_every, 0 for never (default: 0)
+        :param retry_after: Optional, Retry-After header of the 429 responses, in seconds (default: 0.05)
+        :param nb_transactions: Optional, number of transactions of each address and asset (default: 10000)
+        :param nb_assets: Optional, number of assets of each policy (default: 1000)
+        :param nb_pools: Optional, number of pools paying the rewards (default: 20)
+        :param latest_epoch: Optional, current epoch (default: 450)
+        :param fail_from_page: Optional, answer 503 to the pages from this one, 0 for never (default: 0)
+        :param missing_keys: Optional, keys (address, stake address, asset...) answered with a 404 (default: none)
+        :param port: Optional, port of the server (default: a free port)
+        """
+        self.latency = latency
+        self.page_size = page_size
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.nb_transactions = nb_transactions
+        self.nb_assets = nb_assets
+        self.nb_pools = nb_pools
+        self.latest_epoch = latest_epoch
+        self.fail_from_page = fail_from_page
+        self.missing_keys = set(missing_keys)
+
+        # Number of requests received and of 429 sent
+        self.requests = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+
+        # The current epoch end in the future, the previous ones are closed
+        self._latest_epoch_start = int(time()) - bf_mock_epoch_duration // 2
+
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # Send the headers and the body without waiting for the acknowledgement of the client (Nagle)
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                mock._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        "Url of the api, to use as network of an Auth instance"
+        return 'http://127.0.0.1:{}/api/v0/'.format(self.server.server_port)
+
+    def start(self) -> 'MockBlockfrost':
+        "Start the server in a background thread"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        "Stop the server"
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.rate_limited = 0
+
+    def _send(self, handler: BaseHTTPRequestHandler, status: int, body, headers: dict=None):
+        data = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        with self._lock:
+            self.requests += 1
+            rate_limited = self.rate_limit_every > 0 and self.requests % self.rate_limit_every == 0
+            if rate_limited:
+                self.rate_limited += 1
+
+        if self.latency:
+            sleep(self.latency)
+
+        if rate_limited:
+            return self._send(handler, 429, {'status_code': 429, 'error': 'Project Over Limit', 'message': 'Usage is over limit.'}, {'Retry-After': str(self.retry_after)})
+
+        url = urlparse(handler.path)
+        query = parse_qs(url.query)
+        segments = [segment for segment in url.path.split('/') if segment][2:]
+
+        response = self._route(segments) if not self.missing_keys.intersection(segments) else None
+
+        if response is None:
+            return self._send(handler, 404, {'status_code': 404, 'error': 'Not Found', 'message': 'The requested component has not been found.'})
+
+        if callable(response):
+            # Paginated endpoint, the function return the records of an index range
+            page = int(query.get('page', ['1'])[0])
+            if self.fail_from_page and page >= self.fail_from_page:
+                return self._send(handler, 503, {'status_code': 503, 'error': 'Service Unavailable', 'message': 'The page is not available.'})
+            count = int(query.get('count', [str(self.page_size)])[0])
+            descending = query.get('order', ['asc'])[0] == 'desc'
+            response = response((page - 1) * count, page * count, descending)
+
+        self._send(handler, 200, response)
+
+    def _route(self, segments: list):
+        "Get the response of an endpoint, a function of the index range for a paginated endpoint, None if not found"
+        if len(segments) == 3 and segments[0] == 'accounts' and segments[2] == 'rewards':
+            return self._paginate(self._rewards(segments[1]))
+        if len(segments) == 3 and segments[0] == 'accounts' and segments[2] == 'history':
+            return self._paginate(self._amount_history(segments[1]))
+        if len(segments) == 3 and segments[0] == 'accounts' and segments[2] == 'addresses':
+            return self._paginate([{'address': address} for address in self._addresses(segments[1])])
+        if len(segments) == 4 and segments[0] == 'accounts' and segments[2:] == ['addresses', 'assets']:
+            return self._paginate(self._account_assets(segments[1]))
+        if len(segments) == 2 and segments[0] == 'accounts':
+            return self._account(segments[1])
+        if len(segments) == 3 and segments[0] == 'addresses' and segments[2] == 'utxos':
+            return self._paginate(self._utxos(segments[1]))
+        if segments == ['pools']:
+            return self._paginate(['pool1mock{:04d}'.format(i) for i in range(self.nb_pools)])
+        if len(segments) == 3 and segments[0] == 'pools' and segments[2] == 'history':
+            return self._paginate(self._pool_history(segments[1]))
+        if len(segments) == 3 and segments[0] == 'addresses' and segments[2] == 'transactions':
+            return self._paginate_function(self.nb_transactions, lambda i: self._transaction(segments[1], i))
+        if len(segments) == 3 and segments[0] == 'assets' and segments[2] == 'transactions':
+            return self._paginate_function(self.nb_transactions, lambda i: self._transaction(segments[1], i))
+        if len(segments) == 3 and segments[0] == 'assets' and segments[1] == 'policy':
+            return self._paginate_function(self.nb_assets, lambda i: {'asset': '{}{:08x}'.format(segments[2], i), 'quantity': '1'})
+        if len(segments) == 2 and segments[0] == 'epochs':
+            epoch = self.latest_epoch if segments[1] == 'latest' else int(segments[1])
+            return self._epoch(epoch) if 0 <= epoch <= self.latest_epoch else None
+        if len(segments) == 2 and segments[0] == 'assets':
+            return self._asset(segments[1])
+        if len(segments) == 2 and segments[0] == 'txs':
+            return self._transaction(segments[1], key_hash(segments[1]) % self.nb_transactions)
+        if len(segments) == 3 and segments[0] == 'txs' and segments[2] == 'utxos':
+            return self._transaction_utxos(segments[1])
+        if len(segments) == 3 and segments[0] == 'txs' and segments[2] == 'metadata':
+            return [{'label': '721', 'json_metadata': {'name': 'Mock #{}'.format(key_hash(segments[1]) % 10000)}}]
+        if len(segments) == 2 and segments[0] == 'blocks':
+            return self._block(segments[1])
+        return None
+
+    def _paginate(self, records: list):
+        return self._paginate_function(len(records), records.__getitem__)
+
+    def _paginate_function(self, nb_records: int, record):
+        def page(start: int, end: int, descending: bool) -> list:
+            indexes = range(start, min(end, nb_records))
+            return [record(nb_records - 1 - i if descending else i) for i in indexes]
+        return page
+
+    def _pool(self, stake_address: str, epoch: int) -> str:
+        "Pool of a stake address at an epoch, the delegators switch of pool every 50 epochs"
+        return 'pool1mock{:04d}'.format((key_hash(stake_address) + epoch // 50) % self.nb_pools)
+
+    def _rewards(self, stake_address: str) -> list:
+        "Rewards of a stake address, the delegators receive their first rewards at different epochs"
+        return [{'epoch': epoch, 'amount': str(1000000 + key_hash(stake_address) % 1000 * epoch), 'pool_id': self._pool(stake_address, epoch), 'type': 'member'}
+                for epoch in range(bf_mock_first_epoch + 2 + key_hash(stake_address) % 100, self.latest_epoch)]
+
+    def _amount_history(self, stake_address: str) -> list:
+        return [{'active_epoch': epoch, 'amount': str(1000000000 + key_hash(stake_address) % 1000000 * epoch), 'pool_id': self._pool(stake_address, epoch)}
+                for epoch in range(bf_mock_first_epoch, self.latest_epoch + 1)]
+
+    def _pool_history(self, pool_id: str) -> list:
+        return [{'epoch': epoch, 'blocks': key_hash(pool_id) % 30 + epoch % 7, 'active_stake': str(20000000000000 + epoch), 'active_size': 0.001,
+                 'delegators_count': 500 + epoch, 'rewards': str(50000000000 + epoch), 'fees': str(400000000 + epoch)}
+                for epoch in range(bf_mock_first_epoch, self.latest_epoch + 1)]
+
+    def _addresses(self, stake_address: str) -> list:
+        "Addresses of a stake address, from 1 to 5"
+        return ['addr1mock{}{:02d}'.format(stake_address[-4:], i) for i in range(1 + key_hash(stake_address) % 5)]
+
+    def _utxos(self, address: str) -> list:
+        "UTXOs of an address, from 1 to 20, each one with lovelace and up to 3 assets of 10 policies"
+        return [{'address': address, 'tx_hash': '{:064x}'.format(key_hash(address) * 1000003 + i), 'output_index': i % 3,
+                 'amount': [{'unit': 'lovelace', 'quantity': str(1000000 + key_hash(address) % 1000 * i)}] +
+                           [{'unit': '{:056x}{:08x}'.format((key_hash(address) + i + j) % 10, j), 'quantity': str(1 + j)} for j in range((key_hash(address) + i) % 4)],
+                 'block': '{:064x}'.format(i), 'data_hash': None, 'inline_datum': None, 'reference_script_hash': None}
+                for i in range(1 + key_hash(address) % 20)]
+
+    def _account_assets(self, stake_address: str) -> list:
+        "Assets of every UTXO of a stake address, summed by unit"
+        quantities = {}
+        for address in self._addresses(stake_address):
+            for utxo in self._utxos(address):
+                for amount in utxo['amount'][1:]:
+                    quantities[amount['unit']] = quantities.get(amount['unit'], 0) + int(amount['quantity'])
+        return [{'unit': unit, 'quantity': str(quantity)} for unit, quantity in quantities.items()]
+
+    def _account(self, stake_address: str) -> dict:
+        "Account of a stake address, its controlled amount is the lovelace of its UTXOs plus its rewards not withdrawn"
+        lovelace = sum(int(utxo['amount'][0]['quantity']) for address in self._addresses(stake_address) for utxo in self._utxos(address))
+        rewards = key_hash(stake_address) % 1000000
+        return {'stake_address': stake_address, 'active': True, 'active_epoch': bf_mock_first_epoch, 'controlled_amount': str(lovelace + rewards),
+                'rewards_sum': str(rewards), 'withdrawals_sum': '0', 'reserves_sum': '0', 'treasury_sum': '0',
+                'withdrawable_amount': str(rewards), 'pool_id': self._pool(stake_address, self.latest_epoch)}
+
+    def _epoch(self, epoch: int) -> dict:
+        start_time = self._latest_epoch_start - (self.latest_epoch - epoch) * bf_mock_epoch_duration
+        return {'epoch': epoch, 'start_time': start_time, 'end_time': start_time + bf_mock_epoch_duration,
+                'first_block_time': start_time + 20, 'last_block_time': start_time + bf_mock_epoch_duration - 20,
+                'block_count': 21600, 'tx_count': 300000 + epoch, 'output': str(10000000000000000 + epoch),
+                'fees': str(50000000000 + epoch), 'active_stake': str(23000000000000000 + epoch)}
+
+    def _transaction(self, address: str, index: int) -> dict:
+        return {'tx_hash': '{:064x}'.format(key_hash(address) * 1000003 + index), 'tx_index': index % 40, 'block_height': 7000000 + index, 'block_time': 1650000000 + 20 * index}
+
+    def _transaction_utxos(self, tx_hash: str) -> dict:
+        "Inputs and outputs of a transaction, an input spent from the previous transaction"
+        return {'hash': tx_hash,
+                'inputs': [{'address': 'addr1mock{:04d}'.format(key_hash(tx_hash) % 10000), 'amount': [{'unit': 'lovelace', 'quantity': '2000000'}],
+                            'tx_hash': '{:064x}'.format(key_hash(tx_hash) + 1), 'output_index': 0}],
+                'outputs': [{'address': 'addr1mock{:04d}'.format((key_hash(tx_hash) + i) % 10000), 'amount': [{'unit': 'lovelace', 'quantity': '1000000'}], 'output_index': i}
+                            for i in range(2)]}
+
+    def _block(self, block_hash_or_nb: str) -> dict:
+        "Block by hash or by number"
+        height = int(block_hash_or_nb) if block_hash_or_nb.isdigit() else 7000000 + key_hash(block_hash_or_nb) % 1000000
+        return {'hash': block_hash_or_nb if not block_hash_or_nb.isdigit() else '{:064x}'.format(height), 'height': height,
+                'time': 1650000000 + 20 * (height - 7000000), 'tx_count': height % 50}
+
+    def _asset(self, asset: str) -> dict:
+        return {'asset': asset, 'policy_id': asset[:56], 'asset_name': asset[56:], 'fingerprint': 'asset1mock{:08x}'.format(key_hash(asset)),
+                'quantity': '1', 'initial_mint_tx_hash': '{:064x}'.format(key_hash(asset)), 'mint_or_burn_count': 1,
+                'onchain_metadata': {'name': 'Mock #{}'.format(asset[56:]), 'image': 'ipfs://mock', 'attributes': {'rarity': key_hash(asset) % 5}},
+                'metadata': None}
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    mock = MockBlockfrost(port=port)
+    print('Mock Blockfrost API on {}'.format(mock.url))
+    mock.server.serve_forever()
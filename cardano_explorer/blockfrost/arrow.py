@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+
+import json
+from decimal import Decimal
+from typing import Union, Optional, List, Iterable
+
+# Amounts in lovelace, returned as strings by the api and typed as int64 (the total supply fit in an int64)
+bf_lovelace_columns = ('amount', 'fees', 'deposit', 'rewards', 'active_stake', 'live_stake', 'controlled_amount',
+                       'rewards_sum', 'withdrawals_sum', 'reserves_sum', 'treasury_sum', 'withdrawable_amount',
+                       'pledge', 'live_pledge', 'declared_pledge', 'fixed_cost', 'output')
+
+# Quantities of native assets, returned as strings by the api and typed as decimal because they can exceed an int64
+bf_quantity_columns = ('quantity',)
+
+# Column of the records which are not dictionaries (list of IDs)
+bf_value_column = '0'
+
+def import_pyarrow():
+    "Import pyarrow, an optional dependency only needed for the 'arrow' output"
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("[ERROR] The 'arrow' output need pyarrow, install it with: pip install cardano_explorer[arrow]") from e
+
+    return pyarrow
+
+def column_type(name: str):
+    """
+    Get the type of a column holding amounts.
+
+    :param name: Column name
+    :return: Arrow type or None if the column doesn't hold amounts
+    """
+    pa = import_pyarrow()
+
+    if name in bf_lovelace_columns:
+        return pa.int64()
+
+    if name in bf_quantity_columns:
+        return pa.decimal128(38, 0)
+
+    return None
+
+def amounts_type():
+    "Get the type of a column holding a list of amounts (UTXO, transaction output): list<struct<unit: string, quantity: decimal128(38, 0)>>"
+    pa = import_pyarrow()
+
+    return pa.list_(pa.struct([pa.field('unit', pa.string()), pa.field('quantity', pa.decimal128(38, 0))]))
+
+def column_array(name: str, values: list, data_type=None):
+    """
+    Convert the values of a column in an Arrow array.
+    The amounts are converted from strings to numbers, the columns mixing several types (metadata) are stored as JSON strings.
+
+    :param name: Column name
+    :param values: Values of the column
+    :param data_type: Optional, type of the column (default: inferred from the values)
+    :return: Arrow array
+    """
+    pa = import_pyarrow()
+
+    amount_type = column_type(name)
+
+    # The amount of an UTXO or a transaction is a list of {unit, quantity}, not a string
+    if amount_type is not None and any(isinstance(value, list) for value in values):
+        amount_type = amounts_type()
+        if data_type is None or data_type == amount_type:
+            return pa.array([None if value is None else [{'unit': amount['unit'], 'quantity': Decimal(amount['quantity'])} for amount in value] for value in values], type=amount_type)
+
+    if amount_type is not None and (data_type is None or data_type == amount_type):
+        return pa.array(values).cast(amount_type)
+
+    try:
+        array = pa.array(values, type=data_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if data_type is not None and not pa.types.is_string(data_type):
+            raise
+        array = pa.array([value if value is None or isinstance(value, str) else json.dumps(value) for value in values], type=pa.string())
+
+    # A column without values is typed as string, the type of the nullable fields of the api
+    return array.cast(pa.string()) if pa.types.is_null(array.type) else array
+
+def records_to_record_batch(records: list, schema=None):
+    """
+    Convert a list of records in an Arrow record batch.
+
+    :param records: List of records
+    :param schema: Optional, schema of the previous batches, its columns keep their type and are null when missing in the records, the new columns of the records are added after them (default: inferred, columns in order of first appearance)
+    :return: Arrow record batch
+    """
+    pa = import_pyarrow()
+
+    records = [record if isinstance(record, dict) else {bf_value_column: record} for record in records]
+
+    # Keys of every record, in order of first appearance
+    names = list(dict.fromkeys(str(key) for record in records for key in record))
+
+    if schema is None:
+        arrays = [column_array(name, [record.get(name) for record in records]) for name in names]
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+    arrays = [column_array(field.name, [record.get(field.name) for record in records], field.type) for field in schema]
+    fields = list(schema)
+
+    # Columns appearing in this batch for the first time (optional fields, metadata)
+    for name in names:
+        if schema.get_field_index(name) == -1:
+            array = column_array(name, [record.get(name) for record in records])
+            arrays.append(array)
+            fields.append(pa.field(name, array.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+def align_record_batch(batch, schema):
+    """
+    Give a record batch the schema of the last batch, which can have more columns, the columns missing in the batch are null.
+
+    :param batch: Arrow record batch
+    :param schema: Schema of the last batch, starting with the columns of the batch
+    :return: Arrow record batch
+    """
+    pa = import_pyarrow()
+
+    if batch.schema.equals(schema):
+        return batch
+
+    arrays = [batch.column(field.name) if batch.schema.get_field_index(field.name) != -1 else pa.nulls(batch.num_rows, field.type) for field in schema]
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def records_to_table(records: list):
+    """
+    Convert a list of records in an Arrow table.
+
+    :param records: List of records
+    :return: Arrow table
+    """
+    pa = import_pyarrow()
+
+    return pa.Table.from_batches([records_to_record_batch(records)])
+
+def iter_record_batches(pages: Iterable[list]):
+    """
+    Convert each page in an Arrow record batch, as soon as the page is received.
+    The schema is inferred from the first page and kept for the next ones, a column appearing in a later page is added to the schema of the next batches.
+
+    :param pages: Iterable of the list of records of each page
+    :return: Generator of the record batches
+    """
+    schema = None
+
+    for records in pages:
+        batch = records_to_record_batch(records, schema)
+        schema = batch.schema
+        yield batch
+
+def record_batches_to_table(batches: list):
+    """
+    Concatenate record batches in an Arrow table, the batches before a new column get it with null values.
+
+    :param batches: List of record batches, from iter_record_batches
+    :return: Arrow table
+    """
+    pa = import_pyarrow()
+
+    if not batches:
+        return pa.table({})
+
+    schema = batches[-1].schema
+
+    return pa.Table.from_batches([align_record_batch(batch, schema) for batch in batches], schema=schema)
+
+def record_batch_reader(pages: Iterable[list]):
+    """
+    Create an Arrow record batch reader over the pages, each page is requested when the reader need it.
+    The first page is requested for get the schema, which is fixed: a column appearing in a later page raise a ValueError instead of being dropped.
+
+    :param pages: Iterable of the list of records of each page
+    :return: Arrow record batch reader
+    """
+    pa = import_pyarrow()
+
+    batches = iter_record_batches(pages)
+
+    first_batch = next(batches, None)
+    if first_batch is None:
+        return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+    def all_batches():
+        yield first_batch
+        for batch in batches:
+            if not batch.schema.equals(first_batch.schema):
+                new_columns = batch.schema.names[len(first_batch.schema):]
+                raise ValueError("[ERROR] The columns {} appear after the first page, they are not in the schema of the stream. Use the output 'arrow' without stream for a table with every column.".format(new_columns))
+            yield batch
+
+    return pa.RecordBatchReader.from_batches(first_batch.schema, all_batches())
+
+def rename_columns(data, names: list):
+    """
+    Rename the columns of an Arrow table or record batch reader.
+
+    :param data: Arrow table or record batch reader
+    :param names: New names of the columns
+    :return: The data with the new names
+    """
+    pa = import_pyarrow()
+
+    if isinstance(data, pa.Table):
+        return data.rename_columns(names)
+
+    schema = pa.schema([field.with_name(name) for field, name in zip(data.schema, names)])
+
+    return pa.RecordBatchReader.from_batches(schema, (pa.RecordBatch.from_arrays(batch.columns, schema=schema) for batch in data))
+
+def to_parquet(data, path: str, compression: str='snappy') -> int:
+    """
+    Write Arrow data in a Parquet file, batch by batch.
+    With a record batch reader (stream=True), each page is written as soon as it is received and the rows are never all in memory.
+
+    :param data: Arrow table, record batch reader or iterable of record batches
+    :param path: Path of the Parquet file
+    :param compression: Optional, compression of the file (default: snappy)
+    :return: Number of rows written
+    """
+    pa = import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if isinstance(data, pa.Table):
+        pq.write_table(data, path, compression=compression)
+        return data.num_rows
+
+    batches = iter(data)
+    first_batch = next(batches, None)
+    schema = data.schema if isinstance(data, pa.RecordBatchReader) else (first_batch.schema if first_batch is not None else pa.schema([]))
+
+    nb_rows = 0
+
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        if first_batch is not None:
+            writer.write_batch(first_batch)
+            nb_rows += first_batch.num_rows
+        for batch in batches:
+            writer.write_batch(batch)
+            nb_rows += batch.num_rows
+
+    return nb_rows
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+
+import asyncio
+from time import monotonic
+from collections import deque
+from .urls import header_param_name
+from typing import Union, Optional, List, Dict, Tuple, TYPE_CHECKING
+from .util import nb_results_to_return, set_query_string_parameter
+from .rate_limit import RateLimiter
+from .errors import BlockfrostError
+from .retry import RetryPolicy, parse_retry_after
+from .query import format_records, warn_truncated, bf_outputs, bf_page_size
+from .stats import RequestStats
+from .decoder import decode_json
+
+if TYPE_CHECKING:
+    # Optional dependency, only needed by AsyncAuth
+    import aiohttp
+
+def import_aiohttp():
+    "Import aiohttp, an optional dependency only needed by AsyncAuth"
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("[ERROR] AsyncAuth need aiohttp, install it with: pip install cardano_explorer[async]") from e
+
+    return aiohttp
+
+def create_async_session(pool_maxsize: int=10, pool_maxsize_per_host: int=0, keep_alive: bool=True) -> 'aiohttp.ClientSession':
+    """
+    Create a non-blocking HTTP session holding a pool of reusable connections.
+    The session have to be created and closed inside the running event loop.
+
+    :param pool_maxsize: Maximum number of connections kept open
+    :param pool_maxsize_per_host: Maximum number of connections kept open per host (0 for no limit)
+    :param keep_alive: False for close the connection after each request
+    :return: The session
+    """
+
+    aiohttp = import_aiohttp()
+
+    connector = aiohttp.TCPConnector(limit=pool_maxsize, limit_per_host=pool_maxsize_per_host, force_close=not keep_alive)
+
+    return aiohttp.ClientSession(connector=connector)
+
+async def async_request_blockfrost(url: str, api_key: str, session: 'aiohttp.ClientSession', proxy: str=None, timeout: float=None, stats: RequestStats=None) -> dict:
+    """
+    Send a single request to Blockfrost API without blocking the event loop.
+
+    :param url: The url
+    :param api_key: Blockfrost api Key
+    :param session: Session used to send the request
+    :param proxy: Optional, proxy url of the request
+    :param timeout: Optional, maximum time in seconds to wait for the response
+    :param stats: Optional, metrics recording the request
+    :return: Dictionary or raise a BlockfrostError
+    """
+
+    aiohttp = import_aiohttp()
+    start_time = monotonic()
+
+    try:
+        async with session.get(url, proxy=proxy, headers={header_param_name:api_key}, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            status_code = response.status
+            reason = response.reason
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            body = await response.read()
+            try:
+                json = decode_json(body)
+            except ValueError:
+                json = None
+    except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+        if stats is not None:
+            stats.record_request(url, monotonic() - start_time, 0)
+        raise BlockfrostError('[ERROR] {}'.format(e), retryable=True) from e
+    except Exception as e:
+        raise BlockfrostError('[ERROR] {}'.format(e)) from e
+
+    if stats is not None:
+        stats.record_request(url, monotonic() - start_time, len(body), status_code)
+
+    if status_code == 200:
+        return json
+
+    if not isinstance(json, dict):
+        # The error doesn't come from the api (proxy, load balancer...)
+        raise BlockfrostError("[ERROR {}] {} ({}).".format(status_code, reason, url), status_code, retry_after)
+
+    raise BlockfrostError("[ERROR {}] {} ({}). {}".format(json['status_code'],
+                                                      json['error'],
+                                                      url,
+                                                      json['message']), status_code, retry_after)
+
+async def async_query_blockfrost(url: str, api_key: str, session: 'aiohttp.ClientSession', proxy: str=None, rate_limiter: RateLimiter=None, retry_policy: RetryPolicy=None, stats: RequestStats=None) -> dict:
+    """
+    Query Blockfrost API without blocking the event loop.
+    The request is retried according to the retry policy when it fails because of the rate limit, a server error or a transport error.
+
+    :param url: The url
+    :param api_key: Blockfrost api Key
+    :param session: Session used to send the request
+    :param proxy: Optional, proxy url of the request
+    :param rate_limiter: Optional, rate limiter to wait for before sending the request
+    :param retry_policy: Optional, retry policy of the failed request (default: no retry)
+    :param stats: Optional, metrics recording the requests and the retries
+    :return: Dictionary
+    """
+
+    start_time = monotonic()
+    attempt = 0
+
+    while True:
+
+        if rate_limiter is not None:
+            wait_time = rate_limiter.reserve()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+        remaining_time = retry_policy.remaining_time(start_time, monotonic()) if retry_policy is not None else None
+
+        if remaining_time is not None and remaining_time <= 0:
+            raise BlockfrostError('[ERROR] The deadline of {} seconds is reached ({}).'.format(retry_policy.deadline, url))
+
+        try:
+            return await async_request_blockfrost(url, api_key, session, proxy, remaining_time, stats)
+        except BlockfrostError as e:
+            if retry_policy is None or not retry_policy.should_retry(e, attempt):
+                raise
+
+            backoff = retry_policy.backoff(attempt, e.retry_after)
+
+            # Give up if the deadline will be reached before the next attempt
+            remaining_time = retry_policy.remaining_time(start_time, monotonic())
+            if remaining_time is not None and remaining_time <= backoff:
+                raise
+
+            if stats is not None:
+                stats.record_retry(url)
+
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+async def async_query_on_several_pages(network: str, api_key: str, data_order: str, nb_of_results: int, query_url: str, session: 'aiohttp.ClientSession', max_concurrency: int=1, proxy: str=None, rate_limiter: RateLimiter=None, retry_policy: RetryPolicy=None, output: str='dict', stats: RequestStats=None) -> Tuple[Union[dict, list], int]:
+    """
+    Get the data from several pages and the number of api calls without blocking the event loop.
+    Up to max_concurrency pages are requested at the same time, the data keep the same order as if the pages were requested one after another.
+
+    :param network: The network (mainnet|testnet|local)
+    :param api_key: Blockfrost api key
+    :param data_order: The data order
+    :param nb_of_results: The number of results wanted
+    :param query_url: Query url
+    :param session: Session used to send the requests
+    :param max_concurrency: Optional, maximum number of pages requested at the same time (default: 1)
+    :param proxy: Optional, proxy url of the requests
+    :param rate_limiter: Optional, rate limiter to wait for before sending each request
+    :param retry_policy: Optional, retry policy of each page
+    :param output: Optional, 'dict', 'pandas' or 'records' (default: 'dict', a dictionary as DataFrame.to_dict())
+    :param stats: Optional, metrics recording the requests
+    :return: The data in the output format and number of api calls
+    """
+    assert(output in bf_outputs), "[ERROR] The parameter 'output' ({}) should be one of {}.".format(output, bf_outputs)
+
+    async def query_page(nb_page: int) -> list:
+        url = network + query_url + set_query_string_parameter(nb_page, data_order)
+        return await async_query_blockfrost(url, api_key, session, proxy, rate_limiter, retry_policy, stats)
+
+    # Set the param for determinated the number of data to return
+    nb_last_page, get_all_data = nb_results_to_return(nb_of_results)
+
+    # Records of every page, in the order of the pages
+    records = []
+
+    # Requests in progress, in the order of the pages
+    pending_pages = deque()
+
+    nb_page = 0
+    count_api_calls = 0
+    last_page_size = 0
+
+    try:
+        while True:
+            # Keep max_concurrency pages requested ahead
+            while len(pending_pages) < max_concurrency and ((nb_page < nb_last_page) or get_all_data):
+                nb_page += 1
+                count_api_calls += 1
+                pending_pages.append(asyncio.ensure_future(query_page(nb_page)))
+
+            if not pending_pages:
+                # Stopped by nb_of_results, a full last page may be followed by other records
+                if last_page_size >= bf_page_size:
+                    warn_truncated(query_url, nb_of_results)
+                break
+
+            data = await pending_pages.popleft()
+
+            # Stop as soon as a page is empty
+            if not data:
+                break
+
+            last_page_size = len(data)
+            records.extend(data)
+    finally:
+        # Cancel the pages requested after the last one
+        for pending_page in pending_pages:
+            if pending_page.cancel():
+                count_api_calls -= 1
+
+    return format_records(records, output), count_api_calls
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+
+import copy
+import json
+import sqlite3
+import threading
+from time import time, monotonic
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Optional, Union, Callable
+from .decoder import decode_json
+
+# Time to live of the cached responses, in seconds
+bf_cache_forever = float('inf')
+bf_cache_disabled = 0
+
+# Time to live of the responses depending on the tip of the chain, about the time between two blocks
+bf_cache_tip_ttl = 20
+
+# Default maximum size of the cache file, in bytes
+bf_cache_max_size = 512 * 1024 * 1024
+
+def epoch_cache_ttl(epoch: dict) -> float:
+    """
+    Get the time to live of an epoch, a closed epoch never change.
+
+    :param epoch: Epoch informations
+    :return: Time to live in seconds
+    """
+    return bf_cache_forever if epoch.get('end_time') and epoch['end_time'] <= time() else bf_cache_tip_ttl
+
+class ResponseCache:
+    """
+    Persistent cache of the api responses, stored in a SQLite file and keyed by url (network included).
+    Each response have a time to live, the least recently used responses are evicted when the cache exceed its maximum size.
+    The cache can be shared by several threads and processes.
+    """
+
+    def __init__(self, path: str, max_size: int=bf_cache_max_size):
+        """
+        :param path: Path of the cache file
+        :param max_size: Optional, maximum size of the cached responses in bytes (default: 512MB)
+        """
+        assert(max_size > 0), "[ERROR] The parameter 'max_size' ({}) should be greater than 0.".format(max_size)
+
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('''CREATE TABLE IF NOT EXISTS responses (
+                                        url TEXT PRIMARY KEY,
+                                        response BLOB NOT NULL,
+                                        size INTEGER NOT NULL,
+                                        expires REAL,
+                                        accessed REAL NOT NULL)''')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+        # Size of the cached responses, updated at each write and computed again before an eviction
+        self._size = self._total_size()
+
+    def _total_size(self) -> int:
+        "Get the size of the cached responses in bytes"
+        return self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def get(self, url: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        :param url: The url
+        :return: The response or None if the url is not cached or expired
+        """
+        now = time()
+
+        with self._lock:
+            row = self._connection.execute('SELECT response, expires FROM responses WHERE url = ?', (url,)).fetchone()
+
+            if row is None:
+                return None
+
+            response, expires = row
+
+            if expires is not None and expires <= now:
+                self._connection.execute('DELETE FROM responses WHERE url = ?', (url,))
+                return None
+
+            self._connection.execute('UPDATE responses SET accessed = ? WHERE url = ?', (now, url))
+
+        return decode_json(response)
+
+    def set(self, url: str, response: Any, ttl: float=bf_cache_forever):
+        """
+        Cache a response.
+
+        :param url: The url
+        :param response: The response
+        :param ttl: Optional, time to live of the response in seconds (default: forever)
+        """
+        if ttl <= 0:
+            return
+
+        data = json.dumps(response, separators=(',', ':')).encode()
+        now = time()
+        expires = None if ttl == bf_cache_forever else now + ttl
+
+        with self._lock:
+            previous = self._connection.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            self._connection.execute('INSERT OR REPLACE INTO responses (url, response, size, expires, accessed) VALUES (?, ?, ?, ?, ?)',
+                                     (url, data, len(data), expires, now))
+
+            self._size += len(data) - (previous[0] if previous else 0)
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        "Delete the expired responses, then the least recently used ones, until the cache is 10% under its maximum size"
+
+        self._connection.execute('DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?', (time(),))
+        self._size = self._total_size()
+
+        target_size = 0.9 * self.max_size
+
+        while self._size > target_size:
+            rows = self._connection.execute('SELECT url, size FROM responses ORDER BY accessed LIMIT 1000').fetchall()
+            if not rows:
+                break
+
+            evicted_urls = []
+            for url, size in rows:
+                evicted_urls.append((url,))
+                self._size -= size
+                if self._size <= target_size:
+                    break
+
+            self._connection.executemany('DELETE FROM responses WHERE url = ?', evicted_urls)
+
+    def clear(self):
+        "Delete every cached responses"
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self):
+        "Close the cache file"
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+class MemoryCache:
+    """
+    Cache of the api responses in the memory of the process, with a time to live for each response and a least recently used eviction.
+    The identical requests in progress at the same time are collapsed into a single request.
+    """
+
+    def __init__(self, max_entries: int=1024):
+        """
+        :param max_entries: Optional, maximum number of responses in the cache (default: 1024)
+        """
+        assert(max_entries > 0), "[ERROR] The parameter 'max_entries' ({}) should be greater than 0.".format(max_entries)
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Number of requests which waited for an identical request in progress
+        self.collapsed = 0
+        self._lock = threading.Lock()
+        # Response and expiry time of each key, the least recently used first
+        self._entries = OrderedDict()
+        # Result of the requests in progress
+        self._in_flight = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        :param key: The key of the response (url)
+        :return: A copy of the response or None if the key is not cached or expired
+        """
+        with self._lock:
+            response = self._get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return copy.deepcopy(response)
+
+    def _get(self, key: str) -> Optional[Any]:
+        "Get a cached response, the lock have to be held"
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        response, expires = entry
+
+        if expires <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+
+        return response
+
+    def set(self, key: str, response: Any, ttl: float=bf_cache_forever):
+        """
+        Cache a response.
+
+        :param key: The key of the response (url)
+        :param response: The response
+        :param ttl: Optional, time to live of the response in seconds (default: forever)
+        """
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (response, monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: str, load: Callable, ttl: Union[float, Callable]=bf_cache_forever) -> Any:
+        """
+        Get a cached response, or load it and cache it.
+        If the same key is already loading in another thread, wait for its result instead of loading it again.
+
+        :param key: The key of the response (url)
+        :param load: Function returning the response
+        :param ttl: Optional, time to live of the response in seconds, or a function returning it from the response (default: forever)
+        :return: A copy of the response
+        """
+        with self._lock:
+            response = self._get(key)
+
+            if response is not None:
+                self.hits += 1
+                return copy.deepcopy(response)
+
+            in_flight = self._in_flight.get(key)
+            loading = in_flight is None
+            if loading:
+                self.misses += 1
+                in_flight = self._in_flight[key] = Future()
+            else:
+                self.collapsed += 1
+
+        if not loading:
+            return copy.deepcopy(in_flight.result())
+
+        try:
+            response = load()
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        else:
+            self.set(key, response, ttl(response) if callable(ttl) else ttl)
+            in_flight.set_result(response)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+        return copy.deepcopy(response)
+
+    def stats(self) -> dict:
+        "Get the number of hits, misses, collapsed requests and responses in the cache"
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'collapsed': self.collapsed, 'entries': len(self._entries)}
+
+    def clear(self):
+        "Delete every cached responses"
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
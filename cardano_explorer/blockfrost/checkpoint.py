@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import os
+import json
+from typing import Iterator, Iterable, Optional
+
+class Checkpoint:
+    """
+    Progress of a bulk export saved in a local JSON file, with the records already received saved in a JSON Lines file next to it.
+    An export interrupted (crash, quota reached, Ctrl-C) and started again with the same checkpoint resume from the last progress saved.
+    The records written after the last save are discarded when the checkpoint is opened again, they are requested again.
+    """
+
+    def __init__(self, path: str, key: str):
+        """
+        :param path: Path of the checkpoint file, the records are saved in the same path with the extension .jsonl
+        :param key: Identifier of the export (url, data order, number of results...), a checkpoint can't be resumed by another export
+        """
+        self.path = path
+        self.records_path = path + '.jsonl'
+        self.key = key
+
+        state = self._load()
+
+        if state is None:
+            state = {'key': key, 'last_page': 0, 'completed': [], 'items': None, 'size': 0}
+
+        assert(state['key'] == key), "[ERROR] The checkpoint '{}' belong to another export ({}), remove it or use another path.".format(path, state['key'])
+
+        # Number of the last page saved
+        self.last_page = state['last_page']
+        # Keys of the items saved (asset IDs)
+        self.completed = set(state['completed'])
+        # Optional list of the items to export, saved for not requesting it again
+        self.items = state['items']
+        # Size of the records file at the last save
+        self._size = state['size']
+
+        # Discard the records written after the last save
+        self._records_file = open(self.records_path, 'ab')
+        self._records_file.truncate(self._size)
+        self._records_file.seek(self._size)
+
+    def _load(self) -> Optional[dict]:
+        "Load the state saved in the checkpoint file, None if there is no checkpoint"
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @property
+    def resumed(self) -> bool:
+        "True if the checkpoint hold progress from a previous run"
+        return self.last_page > 0 or len(self.completed) > 0 or self.items is not None
+
+    def add_page(self, nb_page: int, records: list):
+        """
+        Save the records of a page and the progress.
+
+        :param nb_page: Number of the page
+        :param records: Records of the page
+        """
+        self._write(records)
+        self.last_page = nb_page
+        self.save()
+
+    def add_items(self, keys: Iterable[str], records: list, save: bool=True):
+        """
+        Save the records of several items (assets) and optionally the progress.
+
+        :param keys: Keys of the items
+        :param records: Records of the items
+        :param save: Optional, False for save the progress later, the records are then discarded if the export is interrupted before (default: True)
+        """
+        self._write(records)
+        self.completed.update(keys)
+
+        if save:
+            self.save()
+
+    def set_items(self, items: list):
+        """
+        Save the list of the items to export.
+
+        :param items: List of the items
+        """
+        self.items = list(items)
+        self.save()
+
+    def _write(self, records: list):
+        "Append the records to the records file, one JSON document per line"
+        self._records_file.write(b''.join(json.dumps(record, separators=(',', ':')).encode() + b'\n' for record in records))
+
+    def save(self):
+        "Save the progress, once the records are written on the disk, the checkpoint file is replaced atomically"
+        self._records_file.flush()
+        os.fsync(self._records_file.fileno())
+        self._size = self._records_file.tell()
+
+        state = {'key': self.key, 'last_page': self.last_page, 'completed': sorted(self.completed), 'items': self.items, 'size': self._size}
+
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.path)
+
+    def records(self) -> Iterator:
+        """
+        Iterate over the records saved.
+
+        :return: Generator of the records
+        """
+        self._records_file.flush()
+
+        with open(self.records_path, 'rb') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def close(self):
+        "Close the records file"
+        self._records_file.close()
+
+    def remove(self):
+        "Delete the checkpoint and the records once the export is complete"
+        self.close()
+
+        for path in (self.path, self.records_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if not self._records_file.closed:
+            self.close()
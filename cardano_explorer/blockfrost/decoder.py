@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+import json
+from typing import Any, Callable, Union
+
+def default_json_decoder() -> Callable[[Union[bytes, str]], Any]:
+    "Get the fastest JSON decoder installed, orjson (optional dependency) or the standard library"
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+
+    return orjson.loads
+
+# Decoder of the responses and of the cached responses, replaced with set_json_decoder
+bf_json_decoder = default_json_decoder()
+
+def set_json_decoder(decoder: Callable[[Union[bytes, str]], Any]=None):
+    """
+    Replace the decoder of the responses, used by every instance.
+
+    :param decoder: Optional, function decoding the bytes of a response and raising a ValueError for an invalid document (json.loads, orjson.loads...), None for the default decoder
+    """
+    global bf_json_decoder
+    bf_json_decoder = decoder if decoder is not None else default_json_decoder()
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode a response with the decoder set.
+
+    :param data: Body of the response
+    :return: The response decoded, or raise a ValueError
+    """
+    return bf_json_decoder(data)
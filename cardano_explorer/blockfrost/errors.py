@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+class BlockfrostError(Exception):
+    """
+    Error of a request to Blockfrost API.
+    The status code is None when the request failed before getting a response (connection reset, timeout...).
+    """
+
+    def __init__(self, message: str, status_code: int=None, retry_after: float=None, retryable: bool=False):
+        """
+        :param message: Error message
+        :param status_code: Optional, HTTP status code of the response
+        :param retry_after: Optional, number of seconds to wait asked by the server (Retry-After header)
+        :param retryable: Optional, True if the request failed because of a transport error
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+class TruncatedResultWarning(UserWarning):
+    """
+    Warning of a result stopped at nb_of_results while the last page received was full, the api may hold more records.
+    Ignore it with warnings.simplefilter('ignore', TruncatedResultWarning) when a partial result is expected.
+    """
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+from time import sleep
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Iterator, Tuple, Any
+from .rate_limit import RateLimiter
+
+# Default number of items queried at the same time by the batch methods, the requests per second are bounded by the rate limiter
+bf_max_workers = 8
+
+def query_in_parallel(query: Callable, items: Iterable, max_workers: int=bf_max_workers, rate_limiter: RateLimiter=None, retries: int=2, retry_delay: float=1.0) -> Iterator[Tuple[int, Any, Any, Exception]]:
+    """
+    Call the query function on each item with a pool of workers and yield the results as soon as they are available.
+    A failed item is retried, then yielded with its exception instead of stopping the other items.
+    
+    :param query: Function called with an item
+    :param items: Items to query
+    :param max_workers: Optional, number of items queried at the same time (default: 8)
+    :param rate_limiter: Optional, rate limiter shared by the workers
+    :param retries: Optional, number of retries of a failed item (default: 2)
+    :param retry_delay: Optional, delay in seconds before the first retry, doubled at each retry (default: 1)
+    :return: Generator of (index of the item, item, result or None, exception or None), in the order of completion
+    """
+    
+    assert(max_workers >= 1), "[ERROR] The parameter 'max_workers' ({}) should be greater or equal to 1.".format(max_workers)
+    
+    def query_item(item):
+        for attempt in range(retries + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                return query(item)
+            except Exception:
+                if attempt == retries:
+                    raise
+                sleep(retry_delay * 2 ** attempt)
+    
+    items = enumerate(items)
+    
+    # Items submitted and not yielded yet
+    pending = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        
+        def submit_next_item() -> bool:
+            for index, item in items:
+                pending[executor.submit(query_item, item)] = (index, item)
+                return True
+            return False
+        
+        try:
+            # Keep the workers busy without submitting every items at once
+            for _ in range(2 * max_workers):
+                if not submit_next_item():
+                    break
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    index, item = pending.pop(future)
+                    submit_next_item()
+                    
+                    try:
+                        yield index, item, future.result(), None
+                    except Exception as e:
+                        yield index, item, None, e
+        finally:
+            # Cancel the items not started if the generator is closed before the end
+            for future in pending:
+                future.cancel()
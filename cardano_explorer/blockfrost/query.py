@@ -1,88 +1,449 @@
 
 #!/usr/bin/env python
 
+import warnings
 import requests
-import pandas as pd
+from time import sleep, monotonic
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from .urls import header_param_name
-from typing import Union, Optional, List, Dict, Tuple
-from .util import nb_results_to_return, set_query_string_parameter
+from typing import Union, Optional, List, Dict, Tuple, Callable, Generator, TYPE_CHECKING
+from .util import nb_results_to_return, set_query_string_parameter, records_to_dict, import_pandas
+from .rate_limit import RateLimiter
+from .errors import BlockfrostError, TruncatedResultWarning
+from .retry import RetryPolicy, parse_retry_after
+from .cache import ResponseCache, MemoryCache, bf_cache_disabled
+from .arrow import records_to_table, iter_record_batches, record_batches_to_table, import_pyarrow
+from .checkpoint import Checkpoint
+from .stats import RequestStats, endpoint_name
+from .decoder import decode_json
 
-def query_blockfrost(url: str, api_key: str, proxies: dict=None) -> dict:
+if TYPE_CHECKING:
+    # Imported when a DataFrame is built
+    import pandas as pd
+    # Optional dependency, only needed for the 'arrow' output
+    import pyarrow
+
+# Output formats of several pages
+bf_outputs = ('dict', 'pandas', 'records', 'arrow')
+
+# Number of records of a full page, the api return 100 results at a time
+bf_page_size = 100
+
+def warn_truncated(query_url: str, nb_of_results: int):
     """
-    Query Blockfrost API.
+    Report a result stopped at nb_of_results while the last page received was full.
+    
+    :param query_url: Query url
+    :param nb_of_results: The number of results wanted
+    """
+    warnings.warn('[WARNING] The result of {} is truncated to {} records, more records may be available. Use nb_of_results=None for get all the data.'.format(endpoint_name(query_url), nb_of_results),
+                  TruncatedResultWarning, stacklevel=3)
+
+def create_session(pool_connections: int=10, pool_maxsize: int=10, pool_block: bool=False, keep_alive: bool=True, proxies: dict=None) -> requests.Session:
+    """
+    Create a HTTP session holding a pool of reusable connections.
+    Every request sent through the session reuse an open connection instead of paying a new TCP+TLS handshake.
+    
+    :param pool_connections: Number of host connection pools to keep
+    :param pool_maxsize: Maximum number of connections kept open per host
+    :param pool_block: True for wait for a free connection instead of opening one above the per host limit
+    :param keep_alive: False for close the connection after each request
+    :param proxies: Optional, proxies used by every request of the session
+    :return: The session
+    """
+    
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    
+    if proxies:
+        session.proxies.update(proxies)
+    
+    return session
+
+def request_blockfrost(url: str, api_key: str, proxies: dict=None, session: requests.Session=None, timeout: float=None, stats: RequestStats=None, raw: bool=False) -> Union[dict, list, bytes]:
+    """
+    Send a single request to Blockfrost API.
     
     :param url: The url
     :param api_key: Blockfrost api Key
-    :return: Dictionary
+    :param proxies: Optional, proxies of the request
+    :param session: Optional, session used to send the request (default: a new connection for each request)
+    :param timeout: Optional, maximum time in seconds to wait for the response
+    :param stats: Optional, metrics recording the request
+    :param raw: Optional, True for return the body of the response without decoding it (default: False)
+    :return: Dictionary, or the bytes of the response if raw, or raise a BlockfrostError
     """
+    
+    http = session if session is not None else requests
+    start_time = monotonic()
+    
     try:
-        if not proxies:
-            response = requests.get(url, headers={header_param_name:api_key})
-        else:
-            response = requests.get(url, proxies=proxies, headers={header_param_name:api_key})  
+        response = http.get(url, proxies=proxies, headers={header_param_name:api_key}, timeout=timeout)
+    except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError) as e:
+        if stats is not None:
+            stats.record_request(url, monotonic() - start_time, 0)
+        raise BlockfrostError('[ERROR] {}'.format(e), retryable=True) from e
     except Exception as e:
-        raise Exception('[ERROR] {}'.format(e))
+        raise BlockfrostError('[ERROR] {}'.format(e)) from e
+    
+    if stats is not None:
+        stats.record_request(url, monotonic() - start_time, len(response.content), response.status_code)
     
     if response.status_code == 200:
-        return response.json()
-    else:
-        json = response.json()
-        raise Exception("[ERROR {}] {} ({}). {}".format(json['status_code'],
-                                                   json['error'],
-                                                   url,
-                                                   json['message']))
+        return response.content if raw else decode_json(response.content)
+    
+    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+    
+    try:
+        json = decode_json(response.content)
+    except ValueError:
+        # The error doesn't come from the api (proxy, load balancer...)
+        raise BlockfrostError("[ERROR {}] {} ({}).".format(response.status_code, response.reason, url), response.status_code, retry_after)
+    
+    raise BlockfrostError("[ERROR {}] {} ({}). {}".format(json['status_code'],
+                                                      json['error'],
+                                                      url,
+                                                      json['message']), response.status_code, retry_after)
 
-def query_on_several_pages(network: str, api_key: str, data_order: str, nb_of_results: int, query_url: str, proxies: dict) -> Tuple[dict, int]:
+def query_blockfrost(url: str, api_key: str, proxies: dict=None, session: requests.Session=None, rate_limiter: RateLimiter=None, retry_policy: RetryPolicy=None, cache: ResponseCache=None, cache_ttl: Union[float, Callable]=bf_cache_disabled, memory_cache: MemoryCache=None, stats: RequestStats=None, raw: bool=False) -> Union[dict, list, bytes]:
     """
-    Get the data from several pages and the number of api calls.
-    The blockfrost api return max 100 results at the time, this fonction allow to concatenate the data from each pages.
+    Query Blockfrost API.
+    The request is retried according to the retry policy when it fails because of the rate limit, a server error or a transport error.
+    The memory cache is looked first, then the cache, and the identical requests in progress at the same time are sent once.
+    
+    :param url: The url
+    :param api_key: Blockfrost api Key
+    :param proxies: Optional, proxies of the request
+    :param session: Optional, session used to send the request (default: a new connection for each request)
+    :param rate_limiter: Optional, rate limiter to wait for before sending the request
+    :param retry_policy: Optional, retry policy of the failed request (default: no retry)
+    :param cache: Optional, cache of the responses
+    :param cache_ttl: Optional, time to live of the response in the cache in seconds, or a function returning it from the response (default: 0, not cached)
+    :param memory_cache: Optional, cache of the responses in memory, in front of the cache
+    :param stats: Optional, metrics recording the requests, the retries and the cache hits
+    :param raw: Optional, True for return the body of the response without decoding it, the caches are not used (default: False)
+    :return: Dictionary, or the bytes of the response if raw
+    """
+    
+    # The caches hold decoded responses
+    if raw:
+        cache_ttl = bf_cache_disabled
+    
+    if memory_cache is not None and cache_ttl != bf_cache_disabled:
+        loaded = False
+        
+        def load():
+            nonlocal loaded
+            loaded = True
+            return query_blockfrost(url, api_key, proxies, session, rate_limiter, retry_policy, cache, cache_ttl, stats=stats)
+        
+        response = memory_cache.get_or_load(url, load, cache_ttl)
+        
+        if not loaded and stats is not None:
+            stats.record_cache_hit(url, memory=True)
+        
+        return response
+    
+    use_cache = cache is not None and cache_ttl != bf_cache_disabled
+    
+    if use_cache:
+        response = cache.get(url)
+        if response is not None:
+            if stats is not None:
+                stats.record_cache_hit(url)
+            return response
+    
+    start_time = monotonic()
+    attempt = 0
+    
+    while True:
+        
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        
+        remaining_time = retry_policy.remaining_time(start_time, monotonic()) if retry_policy is not None else None
+        
+        if remaining_time is not None and remaining_time <= 0:
+            raise BlockfrostError('[ERROR] The deadline of {} seconds is reached ({}).'.format(retry_policy.deadline, url))
+        
+        try:
+            response = request_blockfrost(url, api_key, proxies, session, remaining_time, stats, raw)
+        except BlockfrostError as e:
+            if retry_policy is None or not retry_policy.should_retry(e, attempt):
+                raise
+            
+            backoff = retry_policy.backoff(attempt, e.retry_after)
+            
+            # Give up if the deadline will be reached before the next attempt
+            remaining_time = retry_policy.remaining_time(start_time, monotonic())
+            if remaining_time is not None and remaining_time <= backoff:
+                raise
+            
+            if stats is not None:
+                stats.record_retry(url)
+            
+            sleep(backoff)
+            attempt += 1
+            continue
+        
+        if use_cache:
+            cache.set(url, response, cache_ttl(response) if callable(cache_ttl) else cache_ttl)
+        
+        return response
+
+def iter_pages(network: str, api_key: str, data_order: str, nb_of_results: int, query_url: str, proxies: dict, session: requests.Session=None, max_concurrency: int=1, rate_limiter: RateLimiter=None, retry_policy: RetryPolicy=None, cache: ResponseCache=None, cache_ttl: Union[float, Callable]=bf_cache_disabled, memory_cache: MemoryCache=None, first_page: int=1, stats: RequestStats=None, raw: bool=False) -> Generator[Union[list, bytes], None, int]:
+    """
+    Iterate over the data of several pages, each page is yielded as soon as it is received.
+    Only the pages requested ahead are kept in memory, the pages already yielded are released by the generator.
+    With max_concurrency > 1, the next pages are requested while the current one is processed, they are yielded in the order of the pages.
     
     :param network: The network (mainnet|testnet|local)
     :param api_key: Blockfrost api key
     :param data_order: The data order
     :param nb_of_results: The number of results wanted 
     :param query_url: Query url
-    :return: Dictionary with the data and number of api calls
+    :param proxies: Proxies of the requests
+    :param session: Optional, session used to send the requests
+    :param max_concurrency: Optional, maximum number of pages requested at the same time (default: 1, one page after another)
+    :param rate_limiter: Optional, rate limiter to wait for before sending each request
+    :param retry_policy: Optional, retry policy of each page
+    :param cache: Optional, cache of the pages
+    :param cache_ttl: Optional, time to live of each page in the cache in seconds (default: 0, not cached)
+    :param memory_cache: Optional, cache of the pages in memory
+    :param first_page: Optional, number of the first page requested, for resume a previous query (default: 1)
+    :param stats: Optional, metrics recording the requests
+    :param raw: Optional, True for yield the body of each page without decoding it, the truncation is not checked (default: False)
+    :return: Generator of the list of data of each page, returning the number of api calls when it is exhausted, a TruncatedResultWarning is raised when nb_of_results is reached with a full last page
     """
-            
-    # List of dataframes, where each dataframe represent the data from each page
-    dataframes = []
+    
+    def query_page(nb_page: int) -> Union[list, bytes]:
+        url = network + query_url + set_query_string_parameter(nb_page, data_order)
+        data = query_blockfrost(url, api_key, proxies, session, rate_limiter, retry_policy, cache, cache_ttl, memory_cache, stats, raw)
+        # An empty page is an empty JSON array
+        return None if raw and data.strip() == b'[]' else data
     
     # Set the param for determinated the number of data to return
     nb_last_page, get_all_data = nb_results_to_return(nb_of_results)
-   
-    nb_page = 0
+    
+    nb_page = first_page - 1
     count_api_calls = 0
-
-    # Retrieve the data of each page according to the desired number of data wanted or until the page is empty
-    while (nb_page < nb_last_page) or (get_all_data==True):
-
-        nb_page+=1
-        count_api_calls =+1
-
-        api_query_string_param = set_query_string_parameter(nb_page, data_order)
-
-        url = network + query_url + api_query_string_param
-
-        data = query_blockfrost(url, api_key, proxies)
-
-        # Return the data as soon as a page is empty.
-        if not data:
-            # If no data have been found, return an empty dictionary
-            if not dataframes:
-                #print("[INFO] No data available." )
-                return {}, count_api_calls
+    last_page_size = 0
+    
+    if max_concurrency <= 1:
+        # Retrieve the data of each page according to the desired number of data wanted or until the page is empty
+        while (nb_page < nb_last_page) or get_all_data:
+            nb_page += 1
+            count_api_calls += 1
+            
+            data = query_page(nb_page)
             
-            _dict = pd.concat(dataframes).reset_index(drop=True).to_dict()
+            # Stop as soon as a page is empty
+            if not data:
+                break
             
-            return _dict, count_api_calls
+            last_page_size = len(data) if not raw else 0
+            yield data
+        else:
+            # Stopped by nb_of_results, a full last page may be followed by other records
+            if last_page_size >= bf_page_size:
+                warn_truncated(query_url, nb_of_results)
+        
+        return count_api_calls
+    
+    # Requests in progress, in the order of the pages
+    pending_pages = deque()
+    
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        try:
+            while True:
+                # Keep max_concurrency pages requested ahead
+                while len(pending_pages) < max_concurrency and ((nb_page < nb_last_page) or get_all_data):
+                    nb_page += 1
+                    count_api_calls += 1
+                    pending_pages.append(executor.submit(query_page, nb_page))
+                
+                if not pending_pages:
+                    # Stopped by nb_of_results, a full last page may be followed by other records
+                    if last_page_size >= bf_page_size:
+                        warn_truncated(query_url, nb_of_results)
+                    break
+                
+                data = pending_pages.popleft().result()
+                
+                # Stop as soon as a page is empty
+                if not data:
+                    break
+                
+                last_page_size = len(data) if not raw else 0
+                yield data
+        finally:
+            # Cancel the pages requested after the last one, or when the generator is closed
+            for pending_page in pending_pages:
+                if pending_page.cancel():
+                    count_api_calls -= 1
+    
+    return count_api_calls
 
-        # Create a dataframe with the data from each page and add them to the list of data
-        dataframes.append(pd.DataFrame.from_dict(data))
+def format_records(records: list, output: str='dict') -> Union[dict, 'pd.DataFrame', list]:
+    """
+    Build the output of several pages from the list of their records, in a single pass.
     
-    _dict = pd.concat(dataframes).reset_index(drop=True).to_dict()
+    :param records: List of records
+    :param output: Optional, 'dict' for a dictionary as DataFrame.to_dict(), 'pandas' for a DataFrame, 'records' for the list of records or 'arrow' for an Arrow table (default: 'dict')
+    :return: Dictionary, DataFrame, list or Arrow table
+    """
+    assert(output in bf_outputs), "[ERROR] The parameter 'output' ({}) should be one of {}.".format(output, bf_outputs)
+    
+    if output == 'pandas':
+        return import_pandas().DataFrame(records)
+    
+    if output == 'records':
+        return records
+    
+    if output == 'arrow':
+        return records_to_table(records)
+    
+    return records_to_dict(records)
 
-    return _dict, count_api_calls
+def query_on_several_pages(network: str, api_key: str, data_order: str, nb_of_results: int, query_url: str, proxies: dict, session: requests.Session=None, max_concurrency: int=1, rate_limiter: RateLimiter=None, retry_policy: RetryPolicy=None, cache: ResponseCache=None, cache_ttl: Union[float, Callable]=bf_cache_disabled, memory_cache: MemoryCache=None, output: str='dict', checkpoint_path: str=None, stats: RequestStats=None) -> Tuple[Union[dict, 'pd.DataFrame', list, 'pyarrow.Table'], int]:
+    """
+    Get the data from several pages and the number of api calls.
+    The blockfrost api return max 100 results at the time, this fonction allow to concatenate the data from each pages.
+    The records of the pages are accumulated in a list, the output is built once when every page is received.
+    With the 'arrow' output, each page is converted in a record batch as soon as it is received instead.
+    
+    :param network: The network (mainnet|testnet|local)
+    :param api_key: Blockfrost api key
+    :param data_order: The data order
+    :param nb_of_results: The number of results wanted 
+    :param query_url: Query url
+    :param proxies: Proxies of the requests
+    :param session: Optional, session used to send the requests
+    :param max_concurrency: Optional, maximum number of pages requested at the same time (default: 1, one page after another)
+    :param rate_limiter: Optional, rate limiter to wait for before sending each request
+    :param retry_policy: Optional, retry policy of each page, the pages already received are kept when a page is retried
+    :param cache: Optional, cache of the pages
+    :param cache_ttl: Optional, time to live of each page in the cache in seconds (default: 0, not cached)
+    :param memory_cache: Optional, cache of the pages in memory
+    :param output: Optional, 'dict', 'pandas', 'records' or 'arrow' (default: 'dict', a dictionary as DataFrame.to_dict())
+    :param checkpoint_path: Optional, file saving the pages received, an interrupted query started again with the same file resume after the last page saved (default: None)
+    :param stats: Optional, metrics recording the requests
+    :return: The data in the output format and number of api calls
+    """
+    
+    assert(output in bf_outputs), "[ERROR] The parameter 'output' ({}) should be one of {}.".format(output, bf_outputs)
+    
+    if checkpoint_path is not None:
+        return query_pages_with_checkpoint(network, api_key, data_order, nb_of_results, query_url, proxies, session, max_concurrency, rate_limiter, retry_policy, cache, cache_ttl, memory_cache, output, checkpoint_path, stats)
+    
+    # Records of every page, in the order of the pages
+    records = []
+    
+    pages = iter_pages(network, api_key, data_order, nb_of_results, query_url, proxies, session, max_concurrency, rate_limiter, retry_policy, cache, cache_ttl, memory_cache, stats=stats)
+    
+    if output == 'arrow':
+        return query_record_batches(pages)
+    
+    while True:
+        try:
+            records.extend(next(pages))
+        except StopIteration as e:
+            # The generator return the number of api calls
+            count_api_calls = e.value
+            break
+    
+    return format_records(records, output), count_api_calls
+
+def query_pages_with_checkpoint(network: str, api_key: str, data_order: str, nb_of_results: int, query_url: str, proxies: dict, session: requests.Session, max_concurrency: int, rate_limiter: RateLimiter, retry_policy: RetryPolicy, cache: ResponseCache, cache_ttl: Union[float, Callable], memory_cache: MemoryCache, output: str, checkpoint_path: str, stats: RequestStats=None) -> Tuple[Union[dict, 'pd.DataFrame', list, 'pyarrow.Table'], int]:
+    """
+    Get the data from several pages, each page received is saved with the progress in a checkpoint.
+    When the checkpoint hold the pages of a previous query interrupted, only the next pages are requested.
+    The checkpoint is removed once the last page is received.
+    
+    :param network: The network (mainnet|testnet|local)
+    :param api_key: Blockfrost api key
+    :param data_order: The data order
+    :param nb_of_results: The number of results wanted 
+    :param query_url: Query url
+    :param proxies: Proxies of the requests
+    :param session: Session used to send the requests
+    :param max_concurrency: Maximum number of pages requested at the same time
+    :param rate_limiter: Rate limiter to wait for before sending each request
+    :param retry_policy: Retry policy of each page
+    :param cache: Cache of the pages
+    :param cache_ttl: Time to live of each page in the cache in seconds
+    :param memory_cache: Cache of the pages in memory
+    :param output: 'dict', 'pandas', 'records' or 'arrow'
+    :param checkpoint_path: File saving the progress
+    :param stats: Optional, metrics recording the requests
+    :return: The data in the output format and number of api calls
+    """
+    
+    # The checkpoint can only be resumed by the same query
+    key = '{}{}|{}|{}'.format(network, query_url, data_order, nb_of_results)
+    
+    with Checkpoint(checkpoint_path, key) as checkpoint:
+        nb_page = checkpoint.last_page
+        
+        pages = iter_pages(network, api_key, data_order, nb_of_results, query_url, proxies, session, max_concurrency, rate_limiter, retry_policy, cache, cache_ttl, memory_cache, first_page=nb_page + 1, stats=stats)
+        
+        while True:
+            try:
+                data = next(pages)
+            except StopIteration as e:
+                # The generator return the number of api calls
+                count_api_calls = e.value
+                break
+            
+            nb_page += 1
+            checkpoint.add_page(nb_page, data)
+        
+        records = list(checkpoint.records())
+        checkpoint.remove()
+    
+    return format_records(records, output), count_api_calls
 
+def query_raw_pages(pages: Generator[bytes, None, int]) -> Tuple[List[bytes], int]:
+    """
+    Get the body of several pages without decoding them.
+    
+    :param pages: Generator of the body of each page, returning the number of api calls
+    :return: List of the body of each page, a JSON array of records, and number of api calls
+    """
+    raw_pages = []
+    
+    while True:
+        try:
+            raw_pages.append(next(pages))
+        except StopIteration as e:
+            # The generator return the number of api calls
+            return raw_pages, e.value
 
+def query_record_batches(pages: Generator[list, None, int]) -> Tuple['pyarrow.Table', int]:
+    """
+    Convert each page in an Arrow record batch as soon as it is received, the records of a page are released once converted.
+    
+    :param pages: Generator of the list of data of each page, returning the number of api calls
+    :return: Arrow table with the data and number of api calls
+    """
+    # Check the optional dependency before requesting the pages
+    import_pyarrow()
+    
+    count_api_calls = 0
+    
+    def pages_data():
+        nonlocal count_api_calls
+        # The generator return the number of api calls
+        count_api_calls = yield from pages
+    
+    table = record_batches_to_table(list(iter_record_batches(pages_data())))
     
+    return table, count_api_calls
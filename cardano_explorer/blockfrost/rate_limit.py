@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+import os
+import struct
+import threading
+from time import sleep, time
+
+# Blockfrost quotas: 10 requests per second, with a burst of 500 requests
+bf_rate_limit = 10
+bf_burst = 500
+
+class RateLimiter:
+    """
+    Token bucket limiting the number of requests per second, with a burst allowance.
+    The bucket is shared by every thread using the same instance, and by every process using the same file.
+    """
+
+    # Number of tokens and time of the last update, stored in the shared file
+    _state_format = 'dd'
+
+    def __init__(self, rate: float=bf_rate_limit, burst: int=1, path: str=None):
+        """
+        :param rate: Number of requests per second, rate at which the bucket is refilled
+        :param burst: Optional, maximum number of requests sent at once when the bucket is full (default: 1)
+        :param path: Optional, file storing the bucket, for share it between processes (default: bucket in memory)
+        """
+        assert(rate > 0), "[ERROR] The parameter 'rate' ({}) should be greater than 0.".format(rate)
+        assert(burst >= 1), "[ERROR] The parameter 'burst' ({}) should be greater or equal to 1.".format(burst)
+
+        self.rate = rate
+        self.burst = burst
+        self.path = path
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._time = time()
+
+        if path is not None:
+            # Lock the file between processes, only available on Unix
+            import fcntl
+            self._fcntl = fcntl
+
+    def _take(self, tokens: float, last_time: float) -> tuple:
+        """
+        Refill the bucket and take a token.
+        The token can be taken in advance, the bucket is then negative and the request have to wait.
+
+        :param tokens: Number of tokens in the bucket
+        :param last_time: Time of the last update of the bucket
+        :return: The new number of tokens, the time of the update and the time to wait
+        """
+        now = time()
+        tokens = min(self.burst, tokens + max(0, now - last_time) * self.rate) - 1
+        wait_time = -tokens / self.rate if tokens < 0 else 0
+
+        return tokens, now, wait_time
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        :return: Time to wait in seconds before sending the request
+        """
+        with self._lock:
+            if self.path is None:
+                self._tokens, self._time, wait_time = self._take(self._tokens, self._time)
+                return wait_time
+
+            return self._reserve_from_file()
+
+    def _reserve_from_file(self) -> float:
+        "Take a token from the bucket stored in the file, locked during the update"
+
+        size = struct.calcsize(self._state_format)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+
+            data = os.read(fd, size)
+            # A new file start with a full bucket
+            tokens, last_time = struct.unpack(self._state_format, data) if len(data) == size else (float(self.burst), time())
+
+            tokens, last_time, wait_time = self._take(tokens, last_time)
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, struct.pack(self._state_format, tokens, last_time))
+        finally:
+            # Closing the file release the lock
+            os.close(fd)
+
+        return wait_time
+
+    def acquire(self):
+        "Wait until a request can be sent"
+        wait_time = self.reserve()
+
+        if wait_time > 0:
+            sleep(wait_time)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Generator, Iterable, Iterator, Optional, Tuple, Type
+from .stats import endpoint_name
+
+def hex_to_bytes(value: Optional[str]) -> Optional[bytes]:
+    "Convert a hex hash in bytes, 32 bytes instead of a string of 64 characters"
+    return bytes.fromhex(value) if value is not None else None
+
+def bytes_to_hex(value: Optional[bytes]) -> Optional[str]:
+    "Convert a hash in bytes back to hex"
+    return value.hex() if value is not None else None
+
+def to_int(value) -> Optional[int]:
+    "Convert an amount in lovelace or a quantity, returned as a string by the api, in int"
+    return int(value) if value is not None else None
+
+def intern(value: Optional[str]) -> Optional[str]:
+    "Keep a single copy of the IDs repeated in many records (pool, policy, unit, address)"
+    return sys.intern(value) if value is not None else None
+
+class CompactRecord(ABC):
+    """
+    Record of the api stored in __slots__ instead of a dictionary: the hashes are bytes, the amounts are int and the repeated IDs are interned.
+    to_record() give back the dictionary returned by the api.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def from_record(cls, record: dict) -> 'CompactRecord':
+        "Convert a record of the api"
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> list:
+        """
+        Convert several records.
+
+        :param records: Records of the api
+        :return: List of compact records
+        """
+        return [cls.from_record(record) for record in records]
+
+    @abstractmethod
+    def to_record(self) -> dict:
+        "Give back the record of the api"
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(type(self).__name__, ', '.join('{}={!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+class AssetAmount(CompactRecord):
+    "Quantity of a unit, lovelace or asset (concatenation of the policy_id and hex-encoded asset_name)"
+
+    __slots__ = ('unit', 'quantity')
+
+    def __init__(self, unit: str, quantity: int):
+        self.unit = intern(unit)
+        self.quantity = quantity
+
+    @property
+    def policy_id(self) -> Optional[str]:
+        "Policy of the asset, None for lovelace"
+        return self.unit[:56] if self.unit != 'lovelace' else None
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'AssetAmount':
+        return cls(record['unit'], to_int(record['quantity']))
+
+    def to_record(self) -> dict:
+        return {'unit': self.unit, 'quantity': str(self.quantity)}
+
+class Tx(CompactRecord):
+    "Transaction of an address or an asset"
+
+    __slots__ = ('tx_hash', 'tx_index', 'block_height', 'block_time')
+
+    def __init__(self, tx_hash: bytes, tx_index: int, block_height: int, block_time: int):
+        self.tx_hash = tx_hash
+        self.tx_index = tx_index
+        self.block_height = block_height
+        self.block_time = block_time
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'Tx':
+        return cls(hex_to_bytes(record['tx_hash']), record.get('tx_index'), record.get('block_height'), record.get('block_time'))
+
+    def to_record(self) -> dict:
+        return {'tx_hash': bytes_to_hex(self.tx_hash), 'tx_index': self.tx_index, 'block_height': self.block_height, 'block_time': self.block_time}
+
+class Utxo(CompactRecord):
+    "Unspent output of an address"
+
+    __slots__ = ('address', 'tx_hash', 'output_index', 'amount', 'block', 'data_hash', 'inline_datum', 'reference_script_hash')
+
+    def __init__(self, address: str, tx_hash: bytes, output_index: int, amount: tuple, block: bytes, data_hash: bytes=None, inline_datum: str=None, reference_script_hash: bytes=None):
+        self.address = intern(address)
+        self.tx_hash = tx_hash
+        self.output_index = output_index
+        self.amount = amount
+        self.block = block
+        self.data_hash = data_hash
+        self.inline_datum = inline_datum
+        self.reference_script_hash = reference_script_hash
+
+    @property
+    def lovelace(self) -> int:
+        "Amount of lovelace of the output"
+        return sum(asset.quantity for asset in self.amount if asset.unit == 'lovelace')
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'Utxo':
+        return cls(record.get('address'), hex_to_bytes(record['tx_hash']), record['output_index'], tuple(AssetAmount.from_record(asset) for asset in record['amount']),
+                   hex_to_bytes(record.get('block')), hex_to_bytes(record.get('data_hash')), record.get('inline_datum'), hex_to_bytes(record.get('reference_script_hash')))
+
+    def to_record(self) -> dict:
+        return {'address': self.address, 'tx_hash': bytes_to_hex(self.tx_hash), 'tx_index': self.output_index, 'output_index': self.output_index,
+                'amount': [asset.to_record() for asset in self.amount], 'block': bytes_to_hex(self.block), 'data_hash': bytes_to_hex(self.data_hash),
+                'inline_datum': self.inline_datum, 'reference_script_hash': bytes_to_hex(self.reference_script_hash)}
+
+class Block(CompactRecord):
+    "Block of the chain"
+
+    __slots__ = ('time', 'height', 'hash', 'slot', 'epoch', 'epoch_slot', 'slot_leader', 'size', 'tx_count', 'output', 'fees',
+                 'block_vrf', 'op_cert', 'op_cert_counter', 'previous_block', 'next_block', 'confirmations')
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'Block':
+        block = cls(**record)
+        block.hash = hex_to_bytes(record['hash'])
+        block.previous_block = hex_to_bytes(record.get('previous_block'))
+        block.next_block = hex_to_bytes(record.get('next_block'))
+        block.op_cert = hex_to_bytes(record.get('op_cert'))
+        block.slot_leader = intern(record.get('slot_leader'))
+        block.output = to_int(record.get('output'))
+        block.fees = to_int(record.get('fees'))
+        block.op_cert_counter = to_int(record.get('op_cert_counter'))
+        return block
+
+    def to_record(self) -> dict:
+        record = {name: getattr(self, name) for name in self.__slots__}
+        for name in ('hash', 'previous_block', 'next_block', 'op_cert'):
+            record[name] = bytes_to_hex(record[name])
+        for name in ('output', 'fees', 'op_cert_counter'):
+            record[name] = str(record[name]) if record[name] is not None else None
+        return record
+
+class RewardEntry(CompactRecord):
+    "Reward of a stake address for an epoch"
+
+    __slots__ = ('epoch', 'amount', 'pool_id', 'type')
+
+    def __init__(self, epoch: int, amount: int, pool_id: str, type: str=None):
+        self.epoch = epoch
+        self.amount = amount
+        self.pool_id = intern(pool_id)
+        self.type = intern(type)
+
+    @classmethod
+    def from_record(cls, record: dict) -> 'RewardEntry':
+        return cls(record['epoch'], to_int(record['amount']), record.get('pool_id'), record.get('type'))
+
+    def to_record(self) -> dict:
+        return {'epoch': self.epoch, 'amount': str(self.amount), 'pool_id': self.pool_id, 'type': self.type}
+
+# Compact record of each endpoint available with the 'typed' output
+bf_record_types = {'/addresses/{id}/utxos': Utxo,
+                   '/addresses/{id}/transactions': Tx,
+                   '/assets/{id}/transactions': Tx,
+                   '/blocks/{id}/next': Block,
+                   '/blocks/{id}/previous': Block,
+                   '/accounts/{id}/rewards': RewardEntry,
+                   '/accounts/{id}/addresses/assets': AssetAmount}
+
+def record_type(query_url: str) -> Type[CompactRecord]:
+    """
+    Get the compact record of an endpoint.
+
+    :param query_url: Query url
+    :return: Class of the compact records
+    """
+    name = endpoint_name(query_url)
+
+    assert(name in bf_record_types), "[ERROR] The output 'typed' is not available for {}, only for {}.".format(name, list(bf_record_types))
+
+    return bf_record_types[name]
+
+def iter_typed_records(records: Iterator[dict], compact_record: Type[CompactRecord]) -> Iterator[CompactRecord]:
+    """
+    Convert each record as soon as it is received.
+
+    :param records: Generator of the records
+    :param compact_record: Class of the compact records
+    :return: Generator of the compact records
+    """
+    for record in records:
+        yield compact_record.from_record(record)
+
+def query_typed_records(pages: Generator[list, None, int], compact_record: Type[CompactRecord]) -> Tuple[list, int]:
+    """
+    Convert the records of each page as soon as the page is received, the dictionaries of a page are released once converted.
+
+    :param pages: Generator of the list of data of each page, returning the number of api calls
+    :param compact_record: Class of the compact records
+    :return: List of the compact records and number of api calls
+    """
+    typed_records = []
+
+    while True:
+        try:
+            typed_records.extend(compact_record.from_records(next(pages)))
+        except StopIteration as e:
+            # The generator return the number of api calls
+            return typed_records, e.value
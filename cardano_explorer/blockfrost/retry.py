@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import random
+from time import time
+from typing import Optional
+from email.utils import parsedate_to_datetime
+from .errors import BlockfrostError
+
+# Status codes of the errors worth retrying: too many requests and server errors
+bf_retry_status_codes = (429, 500, 502, 503, 504)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Convert the Retry-After header in a number of seconds.
+
+    :param value: Retry-After header, a number of seconds or a HTTP date
+    :return: Number of seconds to wait or None
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+class RetryPolicy:
+    """
+    Retry the requests failed because of the rate limit, a server error or a transport error, with a jittered exponential backoff.
+    """
+
+    def __init__(self, max_retries: int=5, backoff_factor: float=0.5, max_backoff: float=60, deadline: float=None, status_codes: tuple=bf_retry_status_codes):
+        """
+        :param max_retries: Optional, maximum number of retries of a request (default: 5)
+        :param backoff_factor: Optional, the backoff is drawn between 0 and backoff_factor * 2 ** retry seconds (default: 0.5)
+        :param max_backoff: Optional, maximum backoff in seconds (default: 60)
+        :param deadline: Optional, maximum time in seconds spent on a request, retries included (default: None, no deadline)
+        :param status_codes: Optional, status codes of the responses to retry
+        """
+        assert(max_retries >= 0), "[ERROR] The parameter 'max_retries' ({}) can't be negative.".format(max_retries)
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.status_codes = status_codes
+
+    def should_retry(self, error: BlockfrostError, attempt: int) -> bool:
+        """
+        Check if a failed request have to be retried.
+
+        :param error: Error of the request
+        :param attempt: Number of retries already done
+        :return: True for retry the request
+        """
+
+        if attempt >= self.max_retries:
+            return False
+
+        return error.retryable or error.status_code in self.status_codes
+
+    def backoff(self, attempt: int, retry_after: float=None) -> float:
+        """
+        Get the time to wait before the next retry.
+        The server Retry-After take precedence when it is longer than the backoff.
+
+        :param attempt: Number of retries already done
+        :param retry_after: Optional, number of seconds to wait asked by the server
+        :return: Number of seconds to wait
+        """
+
+        backoff = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+        return max(backoff, retry_after) if retry_after is not None else backoff
+
+    def remaining_time(self, start_time: float, now: float) -> Optional[float]:
+        """
+        Get the time left before the deadline.
+
+        :param start_time: Time of the first attempt
+        :param now: Current time
+        :return: Number of seconds left or None if there is no deadline
+        """
+
+        if self.deadline is None:
+            return None
+
+        return self.deadline - (now - start_time)
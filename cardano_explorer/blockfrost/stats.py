@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+
+import re
+import threading
+from time import time
+from bisect import bisect_left
+from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Upper bounds of the latency histogram buckets, in seconds
+bf_latency_buckets = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+# Segments of an url identifying a resource (hash, number, bech32 address or ID), replaced in the endpoint name
+bf_url_id_pattern = re.compile(r'\d+|[0-9a-fA-F]{28,}|[a-z_]+1[02-9ac-hj-np-z]{20,}')
+
+def endpoint_name(url: str) -> str:
+    """
+    Get the endpoint of an url, the path without the version prefix, the query string and the IDs.
+    For example https://cardano-mainnet.blockfrost.io/api/v0/accounts/stake1.../rewards?page=2 is /accounts/{id}/rewards.
+
+    :param url: The url
+    :return: Endpoint name
+    """
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+
+    # Remove the prefix of the api (/api/v0)
+    if len(segments) >= 2 and segments[0] == 'api' and re.fullmatch(r'v\d+', segments[1]):
+        segments = segments[2:]
+
+    return '/' + '/'.join('{id}' if bf_url_id_pattern.fullmatch(segment) else segment for segment in segments)
+
+class EndpointStats:
+    "Counters of the requests sent to an endpoint"
+
+    def __init__(self):
+        # Requests sent, each one consume the daily quota
+        self.requests = 0
+        # Number of requests by HTTP status, 'error' for a connection error
+        self.status = {}
+        self.retries = 0
+        self.bytes = 0
+        # Responses served by the memory cache and the persistent cache, without request
+        self.memory_cache_hits = 0
+        self.cache_hits = 0
+        # Number of requests in each latency bucket, and total latency
+        self.latency_buckets = [0] * len(bf_latency_buckets)
+        self.latency_sum = 0.0
+        # Queries of several pages, and pages requested by them
+        self.calls = 0
+        self.pages = 0
+
+    def to_dict(self) -> dict:
+        return {'requests': self.requests,
+                'status': dict(self.status),
+                'retries': self.retries,
+                'bytes': self.bytes,
+                'memory_cache_hits': self.memory_cache_hits,
+                'cache_hits': self.cache_hits,
+                'latency_buckets': dict(zip(bf_latency_buckets, self.latency_buckets)),
+                'latency_sum': self.latency_sum,
+                'latency_mean': self.latency_sum / self.requests if self.requests else None,
+                'calls': self.calls,
+                'pages': self.pages}
+
+class RequestStats:
+    """
+    Metrics of the requests sent by an Auth instance, by endpoint: requests, HTTP status, latency, bytes received, retries and cache hits.
+    Every request sent, failed or not, is counted in the daily quota of the api key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self.started = time()
+
+    def _endpoint(self, url: str) -> EndpointStats:
+        "Get the counters of the endpoint of an url, the lock must be held"
+        name = endpoint_name(url)
+        endpoint = self._endpoints.get(name)
+
+        if endpoint is None:
+            endpoint = self._endpoints[name] = EndpointStats()
+
+        return endpoint
+
+    def record_request(self, url: str, latency: float, nb_bytes: int, status: int=None):
+        """
+        Record a request sent.
+
+        :param url: The url
+        :param latency: Time to get the response, in seconds
+        :param nb_bytes: Size of the response body, in bytes
+        :param status: Optional, HTTP status of the response, None for a connection error
+        """
+        with self._lock:
+            endpoint = self._endpoint(url)
+            endpoint.requests += 1
+            status = status if status is not None else 'error'
+            endpoint.status[status] = endpoint.status.get(status, 0) + 1
+            endpoint.bytes += nb_bytes
+            endpoint.latency_buckets[bisect_left(bf_latency_buckets, latency)] += 1
+            endpoint.latency_sum += latency
+
+    def record_retry(self, url: str):
+        "Record the retry of a failed request"
+        with self._lock:
+            self._endpoint(url).retries += 1
+
+    def record_cache_hit(self, url: str, memory: bool=False):
+        """
+        Record a response served by a cache.
+
+        :param url: The url
+        :param memory: Optional, True for the memory cache (default: the persistent cache)
+        """
+        with self._lock:
+            endpoint = self._endpoint(url)
+            if memory:
+                endpoint.memory_cache_hits += 1
+            else:
+                endpoint.cache_hits += 1
+
+    def record_call(self, url: str, api_calls: int):
+        """
+        Record a query of several pages.
+
+        :param url: The url of the query
+        :param api_calls: Number of pages requested by the query
+        """
+        with self._lock:
+            endpoint = self._endpoint(url)
+            endpoint.calls += 1
+            endpoint.pages += api_calls
+
+    @property
+    def quota_consumed(self) -> int:
+        "Number of requests sent, counted in the daily quota"
+        with self._lock:
+            return sum(endpoint.requests for endpoint in self._endpoints.values())
+
+    def endpoints(self) -> dict:
+        """
+        Get the metrics of each endpoint.
+
+        :return: Dictionary with the metrics of each endpoint
+        """
+        with self._lock:
+            return {name: endpoint.to_dict() for name, endpoint in sorted(self._endpoints.items())}
+
+    def summary(self) -> dict:
+        """
+        Get the metrics of every endpoint together.
+
+        :return: Dictionary with the totals and the metrics of each endpoint
+        """
+        endpoints = self.endpoints()
+        total = lambda name: sum(endpoint[name] for endpoint in endpoints.values())
+
+        requests = total('requests')
+        latency_sum = total('latency_sum')
+
+        return {'quota_consumed': requests,
+                'requests': requests,
+                'retries': total('retries'),
+                'bytes': total('bytes'),
+                'memory_cache_hits': total('memory_cache_hits'),
+                'cache_hits': total('cache_hits'),
+                'calls': total('calls'),
+                'latency_mean': latency_sum / requests if requests else None,
+                'duration': time() - self.started,
+                'endpoints': endpoints}
+
+    def reset(self):
+        "Reset the metrics"
+        with self._lock:
+            self._endpoints = {}
+            self.started = time()
+
+    def to_prometheus(self, prefix: str='blockfrost') -> str:
+        """
+        Export the metrics in the Prometheus text format.
+
+        :param prefix: Optional, prefix of the metric names (default: blockfrost)
+        :return: Metrics in the Prometheus text format
+        """
+        endpoints = self.endpoints()
+        lines = []
+
+        def metric(name: str, metric_type: str, help: str, samples: list):
+            lines.append('# HELP {}_{} {}'.format(prefix, name, help))
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, metric_type))
+            for suffix, labels, value in samples:
+                labels = ','.join('{}="{}"'.format(key, str(label).replace('\\', '\\\\').replace('"', '\\"')) for key, label in labels.items())
+                lines.append('{}_{}{}{{{}}} {}'.format(prefix, name, suffix, labels, value))
+
+        metric('requests_total', 'counter', 'Requests sent, counted in the daily quota.',
+               [('', {'endpoint': name, 'status': status}, count) for name, endpoint in endpoints.items() for status, count in sorted(endpoint['status'].items(), key=str)])
+        metric('retries_total', 'counter', 'Failed requests retried.',
+               [('', {'endpoint': name}, endpoint['retries']) for name, endpoint in endpoints.items()])
+        metric('response_bytes_total', 'counter', 'Size of the responses received, in bytes.',
+               [('', {'endpoint': name}, endpoint['bytes']) for name, endpoint in endpoints.items()])
+        metric('cache_hits_total', 'counter', 'Responses served by a cache without request.',
+               [('', {'endpoint': name, 'cache': cache}, endpoint[key]) for name, endpoint in endpoints.items() for cache, key in (('memory', 'memory_cache_hits'), ('persistent', 'cache_hits'))])
+
+        # Cumulative buckets of the latency histogram
+        samples = []
+        for name, endpoint in endpoints.items():
+            count = 0
+            for bound, bucket in endpoint['latency_buckets'].items():
+                count += bucket
+                samples.append(('_bucket', {'endpoint': name, 'le': '+Inf' if bound == float('inf') else bound}, count))
+            samples.append(('_sum', {'endpoint': name}, endpoint['latency_sum']))
+            samples.append(('_count', {'endpoint': name}, endpoint['requests']))
+        metric('request_duration_seconds', 'histogram', 'Time to get the responses, in seconds.', samples)
+
+        return '\n'.join(lines) + '\n'
+
+    def start_prometheus_server(self, port: int, address: str='127.0.0.1', prefix: str='blockfrost') -> ThreadingHTTPServer:
+        """
+        Serve the metrics in the Prometheus text format on http://address:port/metrics, in a background thread.
+
+        :param port: Port of the server
+        :param address: Optional, address of the server (default: 127.0.0.1)
+        :param prefix: Optional, prefix of the metric names (default: blockfrost)
+        :return: The server, call shutdown() for stop it
+        """
+        stats = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = stats.to_prometheus(prefix).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
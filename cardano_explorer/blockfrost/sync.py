@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+import json
+import sqlite3
+import threading
+from time import time
+from typing import Optional
+
+# Fields identifying a record of each history synchronized
+bf_sync_keys = {'address_transaction': ('tx_hash',),
+                'asset_transactions': ('tx_hash',),
+                'stake_reward_history': ('epoch', 'type', 'pool_id'),
+                'stake_amount_history': ('active_epoch',)}
+
+def record_mark(record: dict, key_fields: tuple) -> list:
+    """
+    Get the high-water mark of a record, the values of the fields identifying it.
+
+    :param record: The record
+    :param key_fields: Fields identifying the record
+    :return: List of the values
+    """
+    return [record.get(field) for field in key_fields]
+
+class SyncStore:
+    """
+    Local store of the histories synchronized incrementally (transactions, rewards...), in a SQLite file.
+    Each dataset keep its records in ascending order and the high-water mark of its newest record.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the store file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('''CREATE TABLE IF NOT EXISTS records (
+                                        dataset TEXT NOT NULL,
+                                        position INTEGER NOT NULL,
+                                        record TEXT NOT NULL,
+                                        PRIMARY KEY (dataset, position))''')
+        self._connection.execute('''CREATE TABLE IF NOT EXISTS marks (
+                                        dataset TEXT PRIMARY KEY,
+                                        mark TEXT NOT NULL,
+                                        updated REAL NOT NULL)''')
+
+    def get_mark(self, dataset: str) -> Optional[list]:
+        """
+        Get the high-water mark of a dataset.
+
+        :param dataset: The dataset (network, url)
+        :return: The mark of the newest record or None if the dataset was never synchronized
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT mark FROM marks WHERE dataset = ?', (dataset,)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def records(self, dataset: str) -> list:
+        """
+        Get the records of a dataset.
+
+        :param dataset: The dataset (network, url)
+        :return: List of the records in ascending order
+        """
+        with self._lock:
+            rows = self._connection.execute('SELECT record FROM records WHERE dataset = ? ORDER BY position', (dataset,)).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def append(self, dataset: str, records: list, mark: list, replace: bool=False):
+        """
+        Add the new records at the end of a dataset and update its mark, in a single transaction.
+
+        :param dataset: The dataset (network, url)
+        :param records: New records in ascending order
+        :param mark: High-water mark of the newest record
+        :param replace: Optional, True for replace the records of the dataset (default: False)
+        """
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                if replace:
+                    self._connection.execute('DELETE FROM records WHERE dataset = ?', (dataset,))
+
+                first_position = self._connection.execute('SELECT COALESCE(MAX(position) + 1, 0) FROM records WHERE dataset = ?', (dataset,)).fetchone()[0]
+                self._connection.executemany('INSERT INTO records (dataset, position, record) VALUES (?, ?, ?)',
+                                             ((dataset, first_position + i, json.dumps(record, separators=(',', ':'))) for i, record in enumerate(records)))
+
+                self._connection.execute('INSERT OR REPLACE INTO marks (dataset, mark, updated) VALUES (?, ?, ?)', (dataset, json.dumps(mark), time()))
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def clear(self, dataset: str=None):
+        """
+        Delete the records and the mark of a dataset, the next synchronization download the full history.
+
+        :param dataset: Optional, the dataset (default: every dataset)
+        """
+        with self._lock:
+            if dataset is None:
+                self._connection.execute('DELETE FROM records')
+                self._connection.execute('DELETE FROM marks')
+            else:
+                self._connection.execute('DELETE FROM records WHERE dataset = ?', (dataset,))
+                self._connection.execute('DELETE FROM marks WHERE dataset = ?', (dataset,))
+
+    def close(self):
+        "Close the store file"
+        with self._lock:
+            self._connection.close()
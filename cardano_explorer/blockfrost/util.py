@@ -1,12 +1,26 @@
 
 #!/usr/bin/env python
 
-from typing import Union, Optional, List, Dict, Tuple
+import re
+from math import nan
+from typing import Union, Optional, List, Dict, Tuple, TYPE_CHECKING
+from .arrow import bf_lovelace_columns
+
+if TYPE_CHECKING:
+    # Imported when a DataFrame is built
+    import pandas as pd
+
+# Fields of the epochs informations
+bf_epoch_columns = ('epoch', 'start_time', 'end_time', 'first_block_time', 'last_block_time', 'block_count', 'tx_count', 'output', 'fees', 'active_stake')
 
 def convert_hex_to_ascii(hex_string: str) -> str:
     """Convert hex string to ascii format"""
     return bytearray.fromhex(hex_string).decode()
 
+def is_hash(value: str) -> bool:
+    """Check if the value is a hash (block, transaction), and not a number"""
+    return isinstance(value, str) and re.fullmatch('[0-9a-fA-F]{64}', value) is not None
+
 def add_onchain_metadata(asset: dict) -> Dict:
     """
     Create a column for each onchain metadata item.
@@ -31,6 +45,97 @@ def add_onchain_metadata(asset: dict) -> Dict:
     
     return f_assets_data
 
+def records_to_dict(records: list) -> Dict:
+    """
+    Convert a list of records in a dictionary of columns, with the same layout as DataFrame.to_dict() but without building a DataFrame.
+    The columns are in the order of their first appearance, the missing values are NaN and the records which are not dictionaries are the column 0.
+    
+    :param records: List of records
+    :return: Dictionary {column: {index: value}}
+    """
+    
+    columns = {}
+    
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            record = {0: record}
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = {}
+            column[index] = value
+    
+    # Fill the values missing in some records, keeping the index order
+    nb_records = len(records)
+    for key, column in columns.items():
+        if len(column) < nb_records:
+            columns[key] = {index: column.get(index, nan) for index in range(nb_records)}
+    
+    return columns
+
+def import_pandas():
+    "Import pandas, only when a DataFrame is built, the import of the package stay fast without it"
+    import pandas
+
+    return pandas
+
+def progress_bar(iterable, **kwargs):
+    "Show the progress of a loop with tqdm, only imported when a progress bar is shown"
+    from tqdm import tqdm
+
+    return tqdm(iterable, **kwargs)
+
+def typed_dataframe(records: list, columns: tuple=None):
+    """
+    Create a DataFrame from records, the amounts returned as strings are converted to numbers.
+    
+    :param records: List of records
+    :param columns: Optional, columns of the DataFrame when there is no record (default: None)
+    :return: DataFrame
+    """
+    pd = import_pandas()
+    
+    df = pd.DataFrame.from_records(records, columns=columns if len(records) == 0 else None)
+    
+    # Convert each column of amounts at once
+    for column in df.columns.intersection(bf_lovelace_columns):
+        df[column] = pd.to_numeric(df[column])
+    
+    return df
+
+def sum_quantities(amounts: 'pd.DataFrame', by: list) -> 'pd.DataFrame':
+    """
+    Sum the quantities of each group (address, stake address...) and unit at once.
+    The quantities are summed as 64 bits integers, or as Python integers when a sum could exceed them.
+    
+    :param amounts: DataFrame with a column quantity, strings as returned by the api or integers, and the columns of the groups
+    :param by: Columns of the groups, unit included
+    :return: DataFrame with the columns of the groups and the sum of the quantities, in the order of the first amount of each group
+    """
+    quantities = amounts['quantity']
+    
+    # Strings, or Python integers exceeding 64 bits integers
+    if quantities.dtype.kind != 'i':
+        try:
+            quantities = quantities.to_numpy().astype('int64')
+        except OverflowError:
+            quantities = quantities.astype(object).map(int)
+    
+    # Each quantity fit in 64 bits integers but the sum of a group could exceed them
+    if quantities.dtype.kind == 'i' and len(quantities) and quantities.max() > (2 ** 63 - 1) // len(quantities):
+        quantities = quantities.astype(object)
+    
+    return amounts.assign(quantity=quantities).groupby(by, sort=False, as_index=False)['quantity'].sum()
+
+def epochs_to_dataframe(epochs: list):
+    """
+    Create a DataFrame of epochs informations indexed by epoch, the amounts returned as strings are converted to numbers.
+    
+    :param epochs: List of the epochs informations
+    :return: DataFrame
+    """
+    return typed_dataframe(epochs, bf_epoch_columns).set_index('epoch')
+
 def set_query_string_parameter(page: int, data_order: str="") -> str:
     """
     Create the query string to add at the end of the request url.
@@ -1,20 +1,62 @@
 #!/usr/bin/env python
 
 import os
-import pandas as pd
+import warnings
 from .blockfrost.config import *
-from time import sleep
-from tqdm import tqdm
 from .blockfrost.urls import *
-from .blockfrost.util import add_onchain_metadata
-from typing import Union, Optional, List, Dict, Tuple
-from .blockfrost.query import query_blockfrost, query_on_several_pages
+from .blockfrost.util import add_onchain_metadata, is_hash, epochs_to_dataframe, typed_dataframe, import_pandas, progress_bar, sum_quantities
+from typing import Union, Optional, List, Dict, Tuple, Iterator, Iterable, Callable, TYPE_CHECKING
+from .blockfrost.query import query_blockfrost, query_on_several_pages, iter_pages, format_records, create_session, query_raw_pages
+from .blockfrost.parallel import query_in_parallel, bf_max_workers
+from .blockfrost.rate_limit import RateLimiter, bf_rate_limit, bf_burst
+from .blockfrost.retry import RetryPolicy
+from .blockfrost.checkpoint import Checkpoint
+from .blockfrost.sync import SyncStore, bf_sync_keys, record_mark
+from .blockfrost.arrow import record_batch_reader, records_to_table, rename_columns, import_pyarrow
+from .blockfrost.stats import RequestStats
+from .blockfrost.records import record_type, query_typed_records, iter_typed_records
+from .blockfrost.cache import ResponseCache, MemoryCache, bf_cache_forever, bf_cache_disabled, bf_cache_tip_ttl, bf_cache_max_size, epoch_cache_ttl
+
+if TYPE_CHECKING:
+    # Imported when a DataFrame is built
+    import pandas as pd
+    # Optional dependency, only needed for the 'arrow' output
+    import pyarrow
 
 class Auth:
-    def __init__(self, network: str="mainnet", apiKey: str=None,  proxies: dict=None):
+    def __init__(self, network: str="mainnet", apiKey: str=None,  proxies: dict=None, pool_connections: int=10, pool_maxsize: int=10, pool_block: bool=False, keep_alive: bool=True, max_concurrency: int=1, rate_limit: float=bf_rate_limit, burst: int=bf_burst, rate_limit_path: str=None, max_retries: int=5, backoff_factor: float=0.5, deadline: float=None, cache_path: str=None, cache_max_size: int=bf_cache_max_size, memory_cache_size: int=0, sync_path: str=None):
+        # Pool of connections shared by every request of the instance
+        self.session  = create_session(pool_connections, pool_maxsize, pool_block, keep_alive)
         self.network  = network
         self.api_key  = apiKey
         self.proxies  = proxies
+        self.max_concurrency = max_concurrency
+        # Token bucket shared by every request of the instance (and by the processes using the same file), None for no limit
+        self.rate_limiter = RateLimiter(rate_limit, burst, rate_limit_path) if rate_limit else None
+        # Retry of the requests failed because of the rate limit, a server error or a transport error
+        self.retry_policy = RetryPolicy(max_retries, backoff_factor, deadline=deadline)
+        # Persistent cache of the responses, immutable data are cached forever and the others for a limited time
+        self.cache = ResponseCache(cache_path, cache_max_size) if cache_path else None
+        # Cache of the responses in memory, in front of the persistent cache, with the same time to live
+        self.memory_cache = MemoryCache(memory_cache_size) if memory_cache_size else None
+        # Local store of the histories synchronized incrementally
+        self.sync_store = SyncStore(sync_path) if sync_path else None
+        # Metrics of the requests by endpoint: requests, latency, bytes, retries and cache hits
+        self.stats = RequestStats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        "Close the connections of the pool, the cache and the sync store"
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.sync_store is not None:
+            self.sync_store.close()
          
     @property
     def api_key(self):
@@ -27,16 +69,16 @@ class Auth:
         # If the api key is not specidied, look if she is configured in environement variable
         if not value:
             if "mainnet" in network  and os.getenv(bf_osenv_mainnet_apiKey) != None:
-                self._api_key = os.getenv('BLOCKFROST_MAINNET_API_KEY')
+                self._api_key = os.getenv(bf_osenv_mainnet_apiKey)
 
             elif "testnet" in network and os.getenv(bf_osenv_testnet_apiKey) != None:
-                self._api_key = os.getenv('BLOCKFROST_LEGACY_API_KEY')
+                self._api_key = os.getenv(bf_osenv_testnet_apiKey)
 
             elif "preview" in network and os.getenv(bf_osenv_preview_apiKey) != None:
-                self._api_key = os.getenv('BLOCKFROST_PREVIEW_API_KEY')
+                self._api_key = os.getenv(bf_osenv_preview_apiKey)
 
             elif "preprod" in network and os.getenv(bf_osenv_preprod_apiKey) != None:
-                self._api_key = os.getenv('BLOCKFROST_PREPROD_API_KEY')
+                self._api_key = os.getenv(bf_osenv_preprod_apiKey)
 
             else:
                ValueError(f"[ERROR] Your blockfrost api key for the {network} is not configured in your environement path. Create an environement variable name {network} or set it manually using the param 'api_key'")
@@ -52,7 +94,10 @@ class Auth:
     @network.setter
     def network(self, value):
         "Set the network"
-        if 'mainnet' in value:
+        # Url of another server implementing the api (local instance, mock)
+        if value.startswith(('http://', 'https://')):
+            self._network = value if value.endswith('/') else value + '/'
+        elif 'mainnet' in value:
             self._network = bf_url_cardano_mainnet
         elif 'testnet' in value:
             self._network = bf_url_cardano_legacy
@@ -72,6 +117,220 @@ class Auth:
     def proxies(self, value):
         "Set proxies"
         self._proxies = value
+        # Set the proxies once on the session, used by every request
+        self.session.proxies.clear()
+        if value:
+            self.session.proxies.update(value)
+
+    @property
+    def max_concurrency(self):
+        "Get the maximum number of pages requested at the same time"
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        "Set the maximum number of pages requested at the same time"
+        assert(int(value) >= 1), "[ERROR] The parameter 'max_concurrency' ({}) should be greater or equal to 1.".format(value)
+        self._max_concurrency = int(value)
+
+    def _query(self, url: str, cache_ttl: float=bf_cache_disabled) -> dict:
+        """
+        Query the url through the session of the instance.
+        
+        :param url: The url
+        :param cache_ttl: Optional, time to live of the response in the cache, or a function returning it from the response (default: not cached)
+        :return: Dictionary
+        """
+        return query_blockfrost(url, self.api_key, session=self.session, rate_limiter=self.rate_limiter, retry_policy=self.retry_policy, cache=self.cache, cache_ttl=cache_ttl, memory_cache=self.memory_cache, stats=self.stats)
+
+    def _query_pages(self, data_order: str, nb_of_results: int, query_url: str, cache_ttl: float=bf_cache_disabled, pandas: bool=False, output: str=None, checkpoint_path: str=None, max_concurrency: int=None) -> Tuple[Union['pd.DataFrame', dict, 'pyarrow.Table'], int]:
+        """
+        Query several pages through the session of the instance.
+        
+        :param data_order: The data order
+        :param nb_of_results: The number of results wanted
+        :param query_url: Query url
+        :param cache_ttl: Optional, time to live of each page in the cache (default: not cached)
+        :param pandas: Optional, True for build a DataFrame instead of a dictionary (default: False)
+        :param output: Optional, output format, take precedence over pandas, 'typed' for a list of compact records, 'raw' for the list of the body of each page (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received (default: None)
+        :param max_concurrency: Optional, number of pages requested at the same time, 1 when the calls are already sent in parallel (default: max_concurrency of the instance)
+        :return: Dictionary, DataFrame, list or Arrow table with the data and number of api calls
+        """
+        output = output or ('pandas' if pandas else 'dict')
+        max_concurrency = max_concurrency or self.max_concurrency
+        
+        if output == 'raw':
+            assert(checkpoint_path is None), "[ERROR] The output 'raw' can't be saved in a checkpoint, write the pages received instead."
+            response, count_api_calls = query_raw_pages(self._iter_pages(data_order, nb_of_results, query_url, cache_ttl, raw=True, max_concurrency=max_concurrency))
+        elif output == 'typed' and checkpoint_path is not None:
+            records, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, query_url, None, self.session, max_concurrency, self.rate_limiter, self.retry_policy, self.cache, cache_ttl, self.memory_cache, 'records', checkpoint_path, self.stats)
+            response = record_type(query_url).from_records(records)
+        elif output == 'typed':
+            response, count_api_calls = query_typed_records(self._iter_pages(data_order, nb_of_results, query_url, cache_ttl, max_concurrency=max_concurrency), record_type(query_url))
+        else:
+            response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, query_url, None, self.session, max_concurrency, self.rate_limiter, self.retry_policy, self.cache, cache_ttl, self.memory_cache, output, checkpoint_path, self.stats)
+        
+        # The number of api calls of each query is kept in the metrics of the instance
+        self.stats.record_call(query_url, count_api_calls)
+        
+        return response, count_api_calls
+
+    def _iter_pages(self, data_order: str, nb_of_results: int, query_url: str, cache_ttl: float=bf_cache_disabled, raw: bool=False, max_concurrency: int=None) -> Iterator[Union[list, bytes]]:
+        """
+        Iterate over several pages through the session of the instance, each page is yielded as soon as it is received.
+        
+        :param data_order: The data order
+        :param nb_of_results: The number of results wanted
+        :param query_url: Query url
+        :param cache_ttl: Optional, time to live of each page in the cache (default: not cached)
+        :param raw: Optional, True for yield the body of each page without decoding it (default: False)
+        :param max_concurrency: Optional, number of pages requested at the same time (default: max_concurrency of the instance)
+        :return: Generator of the list of data of each page
+        """
+        return iter_pages(self.network, self.api_key, data_order, nb_of_results, query_url, None, self.session, max_concurrency or self.max_concurrency, self.rate_limiter, self.retry_policy, self.cache, cache_ttl, self.memory_cache, stats=self.stats, raw=raw)
+
+    def _sync(self, name: str, query_url: str, output: str) -> Union['pd.DataFrame', dict, list, 'pyarrow.Table']:
+        """
+        Synchronize a history in the sync store and get every record stored.
+        The pages are requested from the newest record until the newest record already stored (high-water mark), the new records are added after the stored ones.
+        When the mark is not found (first synchronization, newest record rolled back), the full history is downloaded and replace the stored one.
+        
+        :param name: Name of the method, for identify the records
+        :param query_url: Query url
+        :param output: 'dict', 'pandas', 'records', 'arrow' or 'typed' for compact records, the sync store hold records so 'raw' raise a ValueError
+        :return: The records in ascending order, in the output format
+        """
+        # Check the output before the requests
+        if output == 'raw':
+            raise ValueError("[ERROR] The output 'raw' is not available with sync=True, the sync store hold records and not the body of the pages.")
+        compact_record = record_type(query_url) if output == 'typed' else None
+        
+        records = self._sync_records(name, query_url)
+        
+        return compact_record.from_records(records) if compact_record is not None else format_records(records, output)
+
+    def _sync_records(self, name: str, query_url: str) -> list:
+        """
+        Synchronize a history in the sync store and get every record stored.
+        
+        :param name: Name of the method, for identify the records
+        :param query_url: Query url
+        :return: List of the records in ascending order
+        """
+        assert(self.sync_store is not None), "[ERROR] The synchronization need a store, set the parameter 'sync_path' of the instance."
+        
+        key_fields = bf_sync_keys[name]
+        dataset = self.network + query_url
+        mark = self.sync_store.get_mark(dataset)
+        
+        new_records = []
+        found = False
+        
+        # Once the history is stored, the first page is usually enough, so the pages are requested one after another
+        pages = iter_pages(self.network, self.api_key, 'desc', None, query_url, None, self.session, self.max_concurrency if mark is None else 1, self.rate_limiter, self.retry_policy, stats=self.stats)
+        try:
+            for page in pages:
+                for record in page:
+                    if mark is not None and record_mark(record, key_fields) == mark:
+                        found = True
+                        break
+                    new_records.append(record)
+                if found:
+                    break
+        finally:
+            # Cancel the pages requested ahead
+            pages.close()
+        
+        if new_records:
+            new_records.reverse()
+            self.sync_store.append(dataset, new_records, record_mark(new_records[-1], key_fields), replace=not found)
+        elif not found and mark is not None:
+            # Every record stored was rolled back
+            self.sync_store.clear(dataset)
+        
+        return self.sync_store.records(dataset)
+
+    def _stream(self, data_order: str, nb_of_results: int, query_url: str, cache_ttl: float=bf_cache_disabled, output: str=None) -> Union[Iterator, 'pyarrow.RecordBatchReader']:
+        """
+        Stream several pages, as records or as Arrow record batches.
+        
+        :param data_order: The data order
+        :param nb_of_results: The number of results wanted
+        :param query_url: Query url
+        :param cache_ttl: Optional, time to live of each page in the cache (default: not cached)
+        :param output: Optional, 'arrow' for an Arrow record batch reader, 'typed' for a generator of compact records, 'raw' for a generator of the body of each page (default: generator of the records)
+        :return: Generator of the records or Arrow record batch reader
+        """
+        if output == 'raw':
+            return self._iter_pages(data_order, nb_of_results, query_url, cache_ttl, raw=True)
+        
+        if output == 'arrow':
+            return record_batch_reader(self._iter_pages(data_order, nb_of_results, query_url, cache_ttl))
+        
+        if output == 'typed':
+            return iter_typed_records(self._iter_records(data_order, nb_of_results, query_url, cache_ttl), record_type(query_url))
+        
+        return self._iter_records(data_order, nb_of_results, query_url, cache_ttl)
+
+    def _iter_records(self, data_order: str, nb_of_results: int, query_url: str, cache_ttl: float=bf_cache_disabled) -> Iterator:
+        """
+        Iterate over the records of several pages, the records of a page are yielded as soon as the page is received.
+        
+        :param data_order: The data order
+        :param nb_of_results: The number of results wanted
+        :param query_url: Query url
+        :param cache_ttl: Optional, time to live of each page in the cache (default: not cached)
+        :return: Generator of the records
+        """
+        for page in self._iter_pages(data_order, nb_of_results, query_url, cache_ttl):
+            yield from page
+ 
+    def _query_keys(self, keys: Iterable[str], key_url: Callable[[str], str], cache_ttl: Union[float, Callable[[str], float]]=bf_cache_disabled, max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Query an endpoint for several keys (transactions, blocks, assets).
+        The keys are requested once, the responses cached are read first and the others are requested in parallel under the rate limiter of the instance.
+        
+        :param keys: Keys to query
+        :param key_url: Function returning the url of a key
+        :param cache_ttl: Optional, time to live of the responses in the cache, or a function returning it from the key (default: not cached)
+        :param max_workers: Optional, number of keys requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the keys failed (default: False, a warning is raised)
+        :return: List of the responses in the order of the keys, None for a key failed, and the dictionary of the keys failed with their error if return_failed
+        """
+        
+        keys = list(keys)
+        unique_keys = list(dict.fromkeys(keys))
+        key_cache_ttl = cache_ttl if callable(cache_ttl) else lambda key: cache_ttl
+        
+        responses = {}
+        failed_keys = {}
+        missing_keys = []
+        
+        # Read the responses cached without using a worker
+        for key in unique_keys:
+            response = self.cache.get(key_url(key)) if self.cache is not None and key_cache_ttl(key) != bf_cache_disabled else None
+            if response is None:
+                missing_keys.append(key)
+            else:
+                self.stats.record_cache_hit(key_url(key))
+                responses[key] = response
+        
+        query_key = lambda key: self._query(key_url(key), key_cache_ttl(key))
+        
+        # The retries are done by the retry policy of the instance
+        for _, key, response, error in query_in_parallel(query_key, missing_keys, max_workers or self.max_concurrency, retries=0):
+            if error is not None:
+                failed_keys[key] = error
+            else:
+                responses[key] = response
+        
+        if failed_keys and not return_failed:
+            warnings.warn('[WARNING] {} keys failed: {}'.format(len(failed_keys), list(failed_keys)))
+        
+        responses = [responses.get(key) for key in keys]
+        
+        return (responses, failed_keys) if return_failed else responses
  
     def stake_informations(self, stake_address: str) -> dict:
         """
@@ -83,11 +342,11 @@ class Auth:
         
         url_stake_info = self.network + bf_stake_url + stake_address
         
-        response = query_blockfrost(url_stake_info, self.api_key, self.proxies)
+        response = self._query(url_stake_info, bf_cache_tip_ttl)
         
         return response
                  
-    def stake_reward_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_reward_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None, sync: bool=False) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain the reward history.
         
@@ -95,6 +354,10 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact RewardEntry records (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :param sync: Optional, True for request only the records newer than the ones in the sync store and return the full history stored, data_order and nb_of_results are ignored (default: False)
         :return: Dictionary or DataFrame of the rewards history 
         """
         
@@ -102,13 +365,17 @@ class Auth:
                                               stake_address,
                                               bf_stake_rewards_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, rewards_history_url, self.proxies)
+        if sync:
+            return self._sync('stake_reward_history', rewards_history_url, output or ('pandas' if pandas else 'dict'))
         
-        #print('[INFO] Function stake_reward_history, {} API calls.'.format(count_api_calls))
+        if stream:
+            return self._stream(data_order, nb_of_results, rewards_history_url, output=output)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        response, _ = self._query_pages(data_order, nb_of_results, rewards_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
+        
+        return response
     
-    def stake_amount_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_amount_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None, sync: bool=False) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain the stake amount history.
         
@@ -117,6 +384,10 @@ class Auth:
         :param nb_of_results: Optional, the number of results wanted
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :param sync: Optional, True for request only the records newer than the ones in the sync store and return the full history stored, data_order and nb_of_results are ignored (default: False)
         :return: Dictionary or DataFrame of the stake amount history
         """
         
@@ -124,13 +395,17 @@ class Auth:
                                                    stake_address,
                                                    bf_stake_amount_history_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_amount_history_url, self.proxies)
+        if sync:
+            return self._sync('stake_amount_history', stake_amount_history_url, output or ('pandas' if pandas else 'dict'))
         
-        #print('[INFO] Function stake_amount_history, {} API calls.'.format(count_api_calls))
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_amount_history_url, output=output)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        response, _ = self._query_pages(data_order, nb_of_results, stake_amount_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
+        
+        return response
          
-    def stake_delegation(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_delegation(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake delegation.
         
@@ -138,6 +413,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake delegation history
         """
         
@@ -145,13 +423,14 @@ class Auth:
                                                stake_address,
                                                bf_stake_delegation_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_delegation_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_delegation_url, output=output)
         
-        #('[INFO] Function stake_delegation, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, stake_delegation_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def stake_registration_deregistrations(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_registration_deregistrations(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake registration et deregistrations.
         
@@ -159,6 +438,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake registration and deregistrations history
         """
         
@@ -166,13 +448,14 @@ class Auth:
                                                  stake_address,
                                                  bf_stake_registration_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_registration_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_registration_url, output=output)
         
-        #print('[INFO] Function stake_registration_deregistrations, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, stake_registration_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def stake_withdrawal_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_withdrawal_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake withdrawal history.
         
@@ -180,6 +463,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake withdrawal history 
         """
         
@@ -187,16 +473,14 @@ class Auth:
                                                        stake_address,
                                                        bf_stake_withdrawal_history_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_withdrawal_history_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_withdrawal_history_url, output=output)
         
-        #print('[INFO] Function stake_withdrawal_history, {} API calls.'.format(count_api_calls))
-        
-        if pandas:
-            return pd.DataFrame.from_dict(response)
+        response, _ = self._query_pages(data_order, nb_of_results, stake_withdrawal_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def stake_mir_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_mir_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake mir history.
         
@@ -204,6 +488,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake mir history
         """
         
@@ -211,13 +498,14 @@ class Auth:
                                                 stake_address,
                                                 bf_stake_mir_history_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_mir_history_url, self.proxies) 
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_mir_history_url, output=output)
         
-        #print('[INFO] Function stake_mir_history, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, stake_mir_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def stake_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake associated addresses.
         
@@ -225,6 +513,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake associated addresses or empty dictionary if the stake address have no stake ADA
         """
         
@@ -232,13 +523,14 @@ class Auth:
                                                          stake_address,
                                                          bf_associated_addresses_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_associated_addresses_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_associated_addresses_url, output=output)
         
-        #print('[INFO] Function stake_associated_addresses, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, stake_associated_addresses_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def stake_assets_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_assets_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain information about the stake assets associated addresses.
         
@@ -246,6 +538,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact AssetAmount records (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the stake associated addresses or empty dictionary if the stake address have no stake ADA
         """
         
@@ -253,11 +548,12 @@ class Auth:
                                                                 stake_address,
                                                                 bf_assets_associated_addresses_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, stake_assets_associated_addresses_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, stake_assets_associated_addresses_url, output=output)
         
-        #print('[INFO] Function stake_assets_associated_addresses, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, stake_assets_associated_addresses_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
     def address_info(self, address: str) -> dict:
         """
@@ -270,7 +566,7 @@ class Auth:
         
         address_info_url = self.network + bf_address_url + address
         
-        response = query_blockfrost(address_info_url, self.api_key, self.proxies)
+        response = self._query(address_info_url, bf_cache_tip_ttl)
         
         return response
     
@@ -284,44 +580,66 @@ class Auth:
         
         address_details_url = self.network + bf_address_url + address + bf_address_details_url
         
-        response = query_blockfrost(address_details_url, self.api_key, self.proxies)
+        response = self._query(address_details_url, bf_cache_tip_ttl)
         
         return response
     
-    def address_utxo(self, address: str, pandas: bool=False) -> dict:
+    def address_utxo(self, address: str, pandas: bool=False, data_order: str='asc', nb_of_results: int=None, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain UTXO of the address.
         
         :param stake_addresse: Address
-        :return: Dictionary with the informations details about the UTXO of an address
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact Utxo records (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :return: List or DataFrame with the informations details about the UTXO of an address
         """
         
-        address_utxo_url = self.network + bf_address_url + address + bf_address_utxo_url
+        address_utxo_url = bf_address_url + address + bf_address_utxo_url
+        
+        if stream:
+            return self._stream(data_order, nb_of_results, address_utxo_url, bf_cache_tip_ttl, output=output)
         
-        response = query_blockfrost(address_utxo_url, self.api_key, self.proxies)
+        response, _ = self._query_pages(data_order, nb_of_results, address_utxo_url, bf_cache_tip_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
     
-    def address_transaction(self, address: str, pandas: bool=False) -> dict:
+    def address_transaction(self, address: str, pandas: bool=False, data_order: str='asc', nb_of_results: int=None, stream: bool=False, output: str=None, checkpoint_path: str=None, sync: bool=False) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Transactions on the address.
         
         :param stake_addresse: Address
-        :return: Dictionary with the informations details about the address transaction
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact Tx records (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :param sync: Optional, True for request only the transactions newer than the ones in the sync store and return every transaction stored, data_order and nb_of_results are ignored (default: False)
+        :return: List or DataFrame with the informations details about the address transaction
         """
         
-        address_transaction_url = self.network + bf_address_url + address + bf_address_transaction_url
+        address_transaction_url = bf_address_url + address + bf_address_transaction_url
+        
+        if sync:
+            return self._sync('address_transaction', address_transaction_url, output or ('pandas' if pandas else 'records'))
         
-        response = query_blockfrost(address_transaction_url, self.api_key, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, address_transaction_url, bf_cache_tip_ttl, output=output)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        response, _ = self._query_pages(data_order, nb_of_results, address_transaction_url, bf_cache_tip_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
+        
+        return response
     
     def network_info(self) -> dict:
         """Return detailed network information."""
         
         network_info_url = self.network + bf_network_informations_url
         
-        response = query_blockfrost(network_info_url, self.api_key, self.proxies)
+        response = self._query(network_info_url, bf_cache_tip_ttl)
         
         return response
     
@@ -330,7 +648,7 @@ class Auth:
         
         latest_epoch_url = self.network + bf_latest_epoch_url
         
-        response = query_blockfrost(latest_epoch_url, self.api_key, self.proxies)
+        response = self._query(latest_epoch_url, bf_cache_tip_ttl)
         
         return response
     
@@ -347,7 +665,7 @@ class Auth:
         
         specific_epoch_url = self.network + bf_epoch_url + str(epoch)
         
-        response = query_blockfrost(specific_epoch_url, self.api_key, self.proxies)
+        response = self._query(specific_epoch_url, epoch_cache_ttl)
         
         return response
     
@@ -356,42 +674,47 @@ class Auth:
         
         address_info_url = self.network + bf_latest_epoch_protocol_parameters_url
         
-        response = query_blockfrost(address_info_url, self.api_key, self.proxies)
+        response = self._query(address_info_url, bf_cache_tip_ttl)
         
         return response
      
-    def epochs_history(self, epochs: list, pandas: bool=False) -> Union[pd.DataFrame, dict]:            
+    def epochs_history(self, epochs: Union[list, range], pandas: bool=False, max_workers: int=None) -> Union['pd.DataFrame', list]:
         """
-        Obtain history about the epochs.
+        Obtain history about the epochs, requested in parallel.
+        The closed epochs are cached forever, with a cache (cache_path) they are requested only once.
         
-        :param epochs: List of the epochs number
-        :pandas: Optional, True for return a pandas dataframe
-        :return: Dictionary or DataFrame of the epochs informations history
+        :param epochs: List or range of the epochs number, the current epoch included
+        :param pandas: Optional, True for return a DataFrame indexed by epoch, with the amounts converted to numbers (default: False)
+        :param max_workers: Optional, number of epochs requested at the same time (default: max_concurrency)
+        :return: List or DataFrame of the epochs informations history
         """
         
-        # Check if the parameter epochs is a list
-        assert(isinstance(epochs, list)), "[ERROR] The parameter 'epochs' should be a list not ({})".format(type(epochs))
-    
-        epochs_history = []
+        # Check if the parameter epochs is a list or a range
+        assert(isinstance(epochs, (list, range))), "[ERROR] The parameter 'epochs' should be a list or a range not ({})".format(type(epochs))
+        
+        if len(epochs) == 0:
+            return epochs_to_dataframe([]) if pandas else []
+        
         last_epoch = self.latest_epoch()['epoch']
         
-        # Value to 1 because of the first call for get the last epoch
-        count_api_calls = 1
-   
-        for epoch in epochs:
-            
-            # check if the epoch number is not inferior than O or greater than the last epoch.
-            assert(epoch > 0), "[ERROR] The number of epoch ({}) can't be inferior than 0.".format(epoch)
-            assert(epoch < last_epoch), "ERROR] The number of epoch can't be greater than the last epoch ({})".format(last_epoch)
-        
-            epochs_history.append(self.specific_epoch(epoch))
-            count_api_calls += 1
-               
-        #print('[INFO] Function epochs_history, {} API calls.'.format(count_api_calls))
-            
-        return pd.DataFrame.from_dict(epochs_history) if pandas else epochs_history
+        # check if the epoch number is not inferior than O or greater than the last epoch.
+        assert(min(epochs) >= 0), "[ERROR] The number of epoch ({}) can't be inferior than 0.".format(min(epochs))
+        assert(max(epochs) <= last_epoch), "[ERROR] The number of epoch ({}) can't be greater than the last epoch ({})".format(max(epochs), last_epoch)
+        
+        # Request each epoch once, the retries are done by the retry policy of the instance
+        unique_epochs = list(dict.fromkeys(epochs))
+        epochs_informations = {}
+        
+        for _, epoch, epoch_informations, error in query_in_parallel(self.specific_epoch, unique_epochs, max_workers or self.max_concurrency, retries=0):
+            if error is not None:
+                raise error
+            epochs_informations[epoch] = epoch_informations
+        
+        epochs_history = [epochs_informations[epoch] for epoch in epochs]
+        
+        return epochs_to_dataframe(epochs_history) if pandas else epochs_history
     
-    def registered_polls(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def registered_polls(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain the list of registered stake pools.
         
@@ -399,17 +722,30 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
-        :return: Dictionary or DataFrame of the registered stake pools
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas', 'records' for the list of the pool IDs or 'arrow' for an Arrow table, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :return: Dictionary, DataFrame or list of the registered stake pools
         """
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, bf_polls_url, self.proxies)
+        if stream:
+            response = self._stream(data_order, nb_of_results, bf_polls_url, output=output)
+            # Rename the column of the pool ID
+            return rename_columns(response, ['registered_polls_id']) if output == 'arrow' and response.schema.names else response
+        
+        output = output or ('pandas' if pandas else 'dict')
+        
+        response, _ = self._query_pages(data_order, nb_of_results, bf_polls_url, output=output, checkpoint_path=checkpoint_path)
         
         # Rename the column of the pool ID
-        response['registered_polls_id'] = response.pop(0)
+        if output == 'arrow':
+            response = rename_columns(response, ['registered_polls_id']) if response.num_columns else response
+        elif output == 'pandas':
+            response = response.rename(columns={0: 'registered_polls_id'})
+        elif output == 'dict':
+            response['registered_polls_id'] = response.pop(0, {})
                   
-        #print('[INFO] Function registered_polls, {} API calls.'.format(count_api_calls))
-                        
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
      
     def pool_informations(self, pool_id: str) -> dict: 
         """
@@ -420,11 +756,11 @@ class Auth:
         """
         
         pool_informations_url = self.network + bf_polls_url + pool_id
-        response = query_blockfrost(pool_informations_url, self.api_key, self.proxies)
+        response = self._query(pool_informations_url)
         
         return response
       
-    def stake_pool_history(self, pool_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_pool_history(self, pool_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain history of stake pool parameters over epochs
         
@@ -432,6 +768,9 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return dict: Dictionary or DataFrame of the history of stake pool parameters over epochs
         """
         
@@ -439,64 +778,251 @@ class Auth:
                                                        pool_id,
                                                        bf_param_stake_pool_history_url)
         
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, param_stake_pool_history_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, param_stake_pool_history_url, output=output)
         
-        #print('[INFO] Function param_stake_pool_history, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, param_stake_pool_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
  
-    def stake_rewards_corr(self, stake_address: str, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def stake_rewards_corr(self, stake_address: Union[str, list], pandas: bool=False, max_workers: int=None, return_failed: bool=False) -> Union['pd.DataFrame', dict, Tuple[Union['pd.DataFrame', dict], list]]:
         """
         Create a dataframe with explanatory variables of the stake rewards for each epochs.
+        The histories are requested in parallel, each pool and each epoch are requested once for every stake address,
+        the rewards of each epoch are joined with the history of the pool which paid them.
 
-        :param stake_address: Stake address
-        :pandas: Optional, True for return a pandas dataframe
-        :return: Dictionary or DataFrame about informations on the rewards history
-        """
-
-        # Get the rewards history
-        df_rewards_hist = self.stake_reward_history(stake_address, pandas=True).rename({'amount': 'rewards_amount'}, axis=1)
-        epoch_reward_list = df_rewards_hist['epoch'].tolist()
-        pool_id = df_rewards_hist['pool_id'][0]
-
-        # Get the stake amount history
-        df_amount_hist = self.stake_amount_history(stake_address, pandas=True).rename({'amount': 'stake_amount'}, axis=1)
-
-        # Get the pool informations
-        df_stake_pool_hist = self.stake_pool_history(pool_id, pandas=True)
-        # Replace the column names
-        df_stake_pool_hist_col_name = {name:'stake_pool_{}'.format(name) for name in df_stake_pool_hist.columns.tolist()}
-        df_stake_pool_hist = df_stake_pool_hist.rename(columns=df_stake_pool_hist_col_name)
-
-        # Get the epochs information
-        df_epochs_hist = self.epochs_history(epoch_reward_list, pandas=True)
-        # Replace the column names
-        df_epochs_hist_col_name = {name:'epoch_{}'.format(name) for name in df_epochs_hist.columns.tolist()}
-        df_epochs_hist = df_epochs_hist.rename(columns=df_epochs_hist_col_name)
+        :param stake_address: Stake address or list of stake addresses
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param max_workers: Optional, number of requests sent at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the list of the stake addresses failed (default: False, a warning is raised)
+        :return: Dictionary or DataFrame about informations on the rewards history, with a column stake_address for a list of stake addresses, and the list of the stake addresses failed if return_failed
+        """
+        
+        stake_addresses = [stake_address] if isinstance(stake_address, str) else list(dict.fromkeys(stake_address))
+        max_workers = max_workers or self.max_concurrency
+        
+        # Get the rewards history and the stake amount history of every stake address at the same time
+        histories = {}
+        failed_addresses = []
+        
+        query_history = lambda item: (self.stake_reward_history if item[1] == 'rewards' else self.stake_amount_history)(item[0], output='records')
+        
+        for _, (address, history), records, error in query_in_parallel(query_history, [(address, history) for address in stake_addresses for history in ('rewards', 'amount')], max_workers, retries=0):
+            if error is not None:
+                # A single stake address without return_failed raises the error
+                if isinstance(stake_address, str) and not return_failed:
+                    raise error
+                if address not in failed_addresses:
+                    failed_addresses.append(address)
+                continue
+            histories[address, history] = records
+        
+        stake_addresses = [address for address in stake_addresses if address not in failed_addresses]
+        
+        # Pools and epochs of every rewards
+        pool_ids = list(dict.fromkeys(reward['pool_id'] for address in stake_addresses for reward in histories[address, 'rewards']))
+        epochs = sorted({reward['epoch'] for address in stake_addresses for reward in histories[address, 'rewards']})
+        
+        # Get the pools history and the epochs information at the same time
+        queries = {'pool': lambda pool_id: self.stake_pool_history(pool_id, nb_of_results=None, output='records'),
+                   'epoch': self.specific_epoch}
+        
+        pools_history = []
+        epochs_informations = {}
+        failed_keys = set()
+        tasks = [('pool', pool_id) for pool_id in pool_ids] + [('epoch', epoch) for epoch in epochs]
+        
+        for _, (query, key), response, error in query_in_parallel(lambda task: queries[task[0]](task[1]), tasks, max_workers, retries=0):
+            if error is not None:
+                # A single stake address without return_failed raises the error
+                if isinstance(stake_address, str) and not return_failed:
+                    raise error
+                failed_keys.add((query, key))
+                continue
+            if query == 'pool':
+                pools_history.extend(dict(record, pool_id=key) for record in response)
+            else:
+                epochs_informations[key] = response
+        
+        # The stake addresses paid by a failed pool or in a failed epoch are failed, the others continue
+        for address in stake_addresses:
+            if any(('pool', reward['pool_id']) in failed_keys or ('epoch', reward['epoch']) in failed_keys for reward in histories[address, 'rewards']):
+                failed_addresses.append(address)
+        
+        stake_addresses = [address for address in stake_addresses if address not in failed_addresses]
+        
+        df_epochs_hist = epochs_to_dataframe([epochs_informations[epoch] for epoch in epochs if epoch in epochs_informations]).add_prefix('epoch_')
+        
+        # Pools history indexed by epoch and pool
+        df_stake_pool_hist = typed_dataframe(pools_history, ('epoch', 'pool_id')).rename(columns=lambda name: name if name == 'pool_id' else 'stake_pool_{}'.format(name))
+        df_stake_pool_hist = df_stake_pool_hist.set_index(['stake_pool_epoch', 'pool_id'])
+        
+        dfs = []
+        for address in stake_addresses:
+            df_rewards_hist = typed_dataframe(histories[address, 'rewards'], ('epoch', 'amount', 'pool_id')).rename({'amount': 'rewards_amount'}, axis=1)
+            df_amount_hist = typed_dataframe(histories[address, 'amount'], ('active_epoch', 'amount')).rename({'amount': 'stake_amount'}, axis=1)
+            
+            # Concatenate the data into a unique dataframe
+            df = df_rewards_hist[['epoch','rewards_amount']].join(df_amount_hist.set_index('active_epoch')[['stake_amount']], on='epoch')
+            df['pool_id'] = df_rewards_hist['pool_id']
+            df = df.join(df_epochs_hist, on='epoch')
+            df = df.join(df_stake_pool_hist, on=['epoch', 'pool_id'])
+            
+            if not isinstance(stake_address, str):
+                df.insert(0, 'stake_address', address)
+            dfs.append(df)
+        
+        pd = import_pandas()
+        df = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0] if dfs else pd.DataFrame()
+        
+        if failed_addresses and not return_failed:
+            warnings.warn('[WARNING] {} stake addresses failed: {}'.format(len(failed_addresses), failed_addresses))
+        
+        df = df if pandas else df.to_dict()
+        
+        return (df, failed_addresses) if return_failed else df
 
-        # Concatenate the data into a unique dataframe
-        df = df_rewards_hist[['epoch','rewards_amount']].join(df_amount_hist.set_index('active_epoch'), on='epoch')
-        df = df.join(df_epochs_hist.set_index('epoch_epoch'), on='epoch')
-        df = df.join(df_stake_pool_hist.set_index('stake_pool_epoch'), on='epoch')
+    def portfolio(self, stake_address: Union[str, list], utxos: bool=True, pandas: bool=False, max_workers: int=None, return_failed: bool=False) -> Union['pd.DataFrame', dict, list, Tuple[Union['pd.DataFrame', dict, list], list]]:
+        """
+        Obtain the holdings of a stake account: the informations of the account and the quantity of each unit (lovelace or asset) held by its addresses.
+        Every request is sent in parallel, with a list of stake addresses the requests of every stake address share the workers
+        and the quantities of every stake address are summed at once.
 
-        return df if pandas else df.to_dict()
+        :param stake_address: Stake address or list of stake addresses
+        :param utxos: Optional, True for sum the UTXOs of each associated address, which also give the holdings of each address. False for use the assets associated to the stake address, 2 requests by stake address instead of 2 plus 1 by address (default: True)
+        :param pandas: Optional, True for return a pandas dataframe of the holdings, with a column stake_address for a list of stake addresses (default: False)
+        :param max_workers: Optional, number of requests sent at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the list of the stake addresses failed (default: False, a warning is raised)
+        :return: Dictionary with the informations of the stake account, the quantity of each unit in 'holdings' and of each address in 'addresses' with utxos, a list of dictionaries for a list of stake addresses, or DataFrame of the holdings, and the list of the stake addresses failed if return_failed
+        """
+        
+        stake_addresses = [stake_address] if isinstance(stake_address, str) else list(dict.fromkeys(stake_address))
+        max_workers = max_workers or self.max_concurrency
+        
+        failed_addresses = []
+        
+        def add_failed(address: str, error: Exception):
+            # A single stake address without return_failed raises the error
+            if isinstance(stake_address, str) and not return_failed:
+                raise error
+            if address not in failed_addresses:
+                failed_addresses.append(address)
+        
+        # The lists are usually a single page, their pages are requested one after another and the workers are shared by the stake addresses
+        query_records = lambda query_url, cache_ttl=bf_cache_disabled: self._query_pages('asc', None, query_url, cache_ttl, output='records', max_concurrency=1)[0]
+        
+        # Get the informations and the addresses or the assets of every stake address at the same time
+        queries = {'informations': self.stake_informations,
+                   'addresses': lambda address: query_records(bf_stake_url + address + bf_associated_addresses_url),
+                   'assets': lambda address: query_records(bf_stake_url + address + bf_assets_associated_addresses_url)}
+        
+        responses = {}
+        tasks = [(address, query) for address in stake_addresses for query in ('informations', 'addresses' if utxos else 'assets')]
+        
+        for _, (address, query), response, error in query_in_parallel(lambda task: queries[task[1]](task[0]), tasks, max_workers, retries=0):
+            if error is not None:
+                add_failed(address, error)
+                continue
+            responses[address, query] = response
+        
+        stake_addresses = [address for address in stake_addresses if address not in failed_addresses]
+        
+        # Amounts to sum, a row by unit of each UTXO or of each stake address
+        keys, units, quantities = [], [], []
+        
+        if utxos:
+            owners = {record['address']: address for address in stake_addresses for record in responses[address, 'addresses']}
+            
+            # Get the UTXOs of every address at the same time, the amounts are flattened as soon as the UTXOs of an address are received
+            query_utxos = lambda address: query_records(bf_address_url + address + bf_address_utxo_url, bf_cache_tip_ttl)
+            
+            for _, address, records, error in query_in_parallel(query_utxos, list(owners), max_workers, retries=0):
+                if error is not None:
+                    add_failed(owners[address], error)
+                    continue
+                for utxo in records:
+                    for amount in utxo['amount']:
+                        keys.append(address)
+                        units.append(amount['unit'])
+                        quantities.append(amount['quantity'])
+            
+            stake_addresses = [address for address in stake_addresses if address not in failed_addresses]
+        else:
+            for address in stake_addresses:
+                informations = responses[address, 'informations']
+                # The controlled amount include the rewards not withdrawn, which are not held by the addresses
+                keys.append(address)
+                units.append('lovelace')
+                quantities.append(int(informations['controlled_amount']) - int(informations['withdrawable_amount']))
+                for amount in responses[address, 'assets']:
+                    keys.append(address)
+                    units.append(amount['unit'])
+                    quantities.append(amount['quantity'])
+        
+        pd = import_pandas()
+        
+        if utxos:
+            amounts = pd.DataFrame({'address': keys, 'unit': units, 'quantity': quantities})
+            amounts.insert(0, 'stake_address', amounts['address'].map(owners))
+            # The amounts received before another address of their stake address failed are dropped
+            amounts = amounts[~amounts['stake_address'].isin(failed_addresses)]
+            
+            # Sum the quantities by address and unit, then by stake address and unit
+            df_addresses = sum_quantities(amounts, ['stake_address', 'address', 'unit'])
+            df_holdings = sum_quantities(df_addresses, ['stake_address', 'unit'])
+        else:
+            df_holdings = sum_quantities(pd.DataFrame({'stake_address': keys, 'unit': units, 'quantity': quantities}), ['stake_address', 'unit'])
+        
+        # The holdings in the order of the stake addresses, the amounts are received in any order
+        order = {address: i for i, address in enumerate(stake_addresses)}
+        df_holdings = df_holdings.sort_values('stake_address', key=lambda column: column.map(order), kind='stable', ignore_index=True)
+        
+        if failed_addresses and not return_failed:
+            warnings.warn('[WARNING] {} stake addresses failed: {}'.format(len(failed_addresses), failed_addresses))
+        
+        if pandas:
+            df_holdings = df_holdings.drop(columns='stake_address') if isinstance(stake_address, str) else df_holdings
+            return (df_holdings, failed_addresses) if return_failed else df_holdings
+        
+        # Informations of each stake account with its holdings, the quantities are integers
+        portfolios = {address: dict(responses[address, 'informations'], holdings={}) for address in stake_addresses}
+        
+        for address, unit, quantity in zip(df_holdings['stake_address'].tolist(), df_holdings['unit'].tolist(), df_holdings['quantity'].tolist()):
+            portfolios[address]['holdings'][unit] = quantity
+        
+        if utxos:
+            for address in stake_addresses:
+                portfolios[address]['addresses'] = {record['address']: {} for record in responses[address, 'addresses']}
+            for address, unit, quantity in zip(df_addresses['address'].tolist(), df_addresses['unit'].tolist(), df_addresses['quantity'].tolist()):
+                portfolios[owners[address]]['addresses'][address][unit] = quantity
+        
+        portfolios = list(portfolios.values())
+        
+        if isinstance(stake_address, str):
+            portfolios = portfolios[0] if portfolios else None
+        
+        return (portfolios, failed_addresses) if return_failed else portfolios
 
-    def assets(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def assets(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of assets.
         
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the assets
         """
         
 
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, bf_assets_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, bf_assets_url, output=output)
         
-        #print('[INFO] Function assets, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, bf_assets_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
 
     def specific_asset(self, asset: str) -> dict: 
         """
@@ -508,11 +1034,24 @@ class Auth:
         
         specific_asset_url = self.network + bf_assets_url + asset
 
-        response = query_blockfrost(specific_asset_url, self.api_key, self.proxies)
+        response = self._query(specific_asset_url)
         
         return response
  
-    def asset_history(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+
+    def specific_assets(self, assets: Iterable[str], max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Obtain information about several assets, requested in parallel.
+        
+        :param assets: Assets (Concatenation of the policy_id and hex-encoded asset_name)
+        :param max_workers: Optional, number of assets requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the assets failed with their error (default: False, a warning is raised)
+        :return: List with the info about each asset in the order of the assets, None for a asset failed, and the dictionary of the assets failed if return_failed
+        """
+        
+        return self._query_keys(assets, lambda asset: self.network + bf_assets_url + asset, max_workers=max_workers, return_failed=return_failed)
+
+    def asset_history(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         Obtain the history of a specific asset.
         
@@ -520,18 +1059,22 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the assets
         """
         
         assets_history_url = bf_assets_url + asset + bf_asset_history_url
 
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, assets_history_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, assets_history_url, output=output)
         
-        #print('[INFO] Function asset_history, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, assets_history_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
 
-    def asset_transactions(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def asset_transactions(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None, sync: bool=False) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of a specific asset transactions.
         
@@ -539,18 +1082,26 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact Tx records (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
+        :param sync: Optional, True for request only the records newer than the ones in the sync store and return the full history stored, data_order and nb_of_results are ignored (default: False)
         :return: Dictionary or DataFrame of the assets
         """
         
         assets_transactions_url = bf_assets_url + asset + bf_asset_transactions_url
 
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, assets_transactions_url, self.proxies)
+        if sync:
+            return self._sync('asset_transactions', assets_transactions_url, output or ('pandas' if pandas else 'dict'))
         
-        #print('[INFO] Function asset_transactions, {} API calls.'.format(count_api_calls))
+        if stream:
+            return self._stream(data_order, nb_of_results, assets_transactions_url, output=output)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        response, _ = self._query_pages(data_order, nb_of_results, assets_transactions_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
+        
+        return response
      
-    def asset_addresses(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def asset_addresses(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of a addresses containing a specific asset.
         
@@ -558,17 +1109,21 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the assets
         """
         
         assets_addresses_url = bf_assets_url + asset + bf_asset_addresses_url
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, assets_addresses_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, assets_addresses_url, output=output)
         
-        #print('[INFO] Function asset_addresses, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, assets_addresses_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
 
-    def assets_policy(self, policy_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def assets_policy(self, policy_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of asset minted under a specific policy.
         
@@ -576,41 +1131,165 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the assets
         """
         
         assets_policy_url = bf_assets_url + bf_assets_policy_url + policy_id
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, assets_policy_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, assets_policy_url, output=output)
         
-        #print('[INFO] Function assets_policy, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, assets_policy_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
 
-    def assets_policy_info(self, policy_id: str, nb_of_results: int=None, pandas: bool=False) -> Union[pd.DataFrame, list]:
+    def assets_policy_info(self, policy_id: str, nb_of_results: int=None, pandas: bool=False, max_workers: int=None, return_failed: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, 'pyarrow.Table', Tuple[Union['pd.DataFrame', list, 'pyarrow.Table'], list]]:
         '''
         Obtain informations about the assets minted under a specific policy ID.
+        The assets are requested in parallel under the rate limiter of the instance, an asset still failing after the retries of the retry policy doesn't stop the others.
 
         :param policy_id: Policy ID
         :nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: None)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
-        :return: Dict or DataFrame with the informations on each asset under the policy and the list ofbthe asset not found
+        :param max_workers: Optional, number of assets requested at the same time (default: the greatest of max_concurrency and 8)
+        :param return_failed: Optional, True for return also the list of the assets failed (default: False, a warning is raised)
+        :param output: Optional, 'list', 'pandas' or 'arrow' for an Arrow table with typed quantities, the metadata mixing several types are JSON strings (default: 'pandas' if pandas else 'list')
+        :param checkpoint_path: Optional, file saving the list of the assets and the assets received, an interrupted call started again with the same file only request the assets missing (default: None)
+        :return: List, DataFrame or Arrow table with the informations on each asset under the policy, and the list of the assets failed if return_failed
         '''
         
-        assets_informations = []
+        output = output or ('pandas' if pandas else 'list')
+        assert(output in ('list', 'pandas', 'arrow')), "[ERROR] The parameter 'output' ({}) should be 'list', 'pandas' or 'arrow'.".format(output)
+        if output == 'arrow':
+            # Check the optional dependency before requesting the assets
+            import_pyarrow()
         
-        #print('[INFO] Get the asset names minted under the policy ID: {}'.format(policy_id))
-        asset_minted_names = self.assets_policy(policy_id, pandas=True, nb_of_results=nb_of_results)['asset'].tolist()
+        if checkpoint_path is not None:
+            assets_informations, failed_assets = self._assets_policy_info_with_checkpoint(policy_id, nb_of_results, max_workers, checkpoint_path)
+        else:
+            assets_informations = []
+            failed_assets = []
+            
+            asset_minted_names = self._assets_policy_names(policy_id, nb_of_results)
+            
+            for asset, asset_informations, error in progress_bar(self._iter_assets_info(asset_minted_names, max_workers, ordered=True), total=len(asset_minted_names)):
+                if error is not None:
+                    failed_assets.append(asset)
+                    continue
+                assets_informations.append(asset_informations)
 
-        #print('[INFO] Get the information about the assets.'.format(policy_id))
-        for asset in tqdm(asset_minted_names):
-            response = self.specific_asset(asset)
+        if failed_assets and not return_failed:
+            warnings.warn('[WARNING] {} assets of the policy {} failed: {}'.format(len(failed_assets), policy_id, failed_assets))
         
-            # Add the asset data info to the list of assets
-            assets_informations.append(add_onchain_metadata(response))
+        if output == 'pandas':
+            assets_informations = import_pandas().DataFrame.from_dict(assets_informations)
+        elif output == 'arrow':
+            assets_informations = records_to_table(assets_informations)
 
-        #print('[INFO] Function specific_asset, {} API calls.'.format(len(assets_data)))
+        return (assets_informations, failed_assets) if return_failed else assets_informations
 
-        return pd.DataFrame.from_dict(assets_informations) if pandas else assets_informations
+    def _assets_policy_info_with_checkpoint(self, policy_id: str, nb_of_results: int, max_workers: int, checkpoint_path: str) -> Tuple[list, list]:
+        '''
+        Obtain informations about the assets minted under a specific policy ID, saving the assets received in a checkpoint.
+        The list of the assets is saved first, then the assets received by batch of 100. The checkpoint is removed once every asset is received,
+        it is kept when some assets failed for request only them again.
+
+        :param policy_id: Policy ID
+        :param nb_of_results: Number of results wanted
+        :param max_workers: Number of assets requested at the same time
+        :param checkpoint_path: File saving the progress
+        :return: List with the informations on each asset in the order of the policy, and the list of the assets failed
+        '''
+        
+        failed_assets = []
+        
+        # The checkpoint can only be resumed for the same policy
+        key = '{}{}|assets_policy_info|{}'.format(self.network, policy_id, nb_of_results)
+        
+        with Checkpoint(checkpoint_path, key) as checkpoint:
+            if checkpoint.items is None:
+                checkpoint.set_items(self._assets_policy_names(policy_id, nb_of_results))
+            
+            asset_minted_names = checkpoint.items
+            missing_assets = [asset for asset in asset_minted_names if asset not in checkpoint.completed]
+            
+            try:
+                for nb_assets, (asset, asset_informations, error) in enumerate(progress_bar(self._iter_assets_info(missing_assets, max_workers, ordered=True), total=len(asset_minted_names), initial=len(asset_minted_names) - len(missing_assets)), 1):
+                    if error is not None:
+                        failed_assets.append(asset)
+                        continue
+                    checkpoint.add_items([asset], [asset_informations], save=nb_assets % 100 == 0)
+            finally:
+                # Save the assets received since the last save, also when the call is interrupted
+                checkpoint.save()
+            
+            # Keep the order of the policy, the assets failed in a previous call are at the end of the file
+            order = {asset: index for index, asset in enumerate(asset_minted_names)}
+            assets_informations = sorted(checkpoint.records(), key=lambda asset_informations: order.get(asset_informations.get('asset'), len(order)))
+            
+            if not failed_assets:
+                checkpoint.remove()
+        
+        return assets_informations, failed_assets
+
+    def iter_assets_policy_info(self, policy_id: str, nb_of_results: int=None, max_workers: int=None, ordered: bool=False):
+        '''
+        Stream the informations about the assets minted under a specific policy ID, as soon as they are available.
+
+        :param policy_id: Policy ID
+        :nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: None)
+        :param max_workers: Optional, number of assets requested at the same time (default: the greatest of max_concurrency and 8)
+        :param ordered: Optional, True for yield the assets in the order of the policy (default: False, order of completion)
+        :return: Generator of (asset, informations about the asset or None, exception or None)
+        '''
+        
+        asset_minted_names = self._assets_policy_names(policy_id, nb_of_results)
+        
+        return self._iter_assets_info(asset_minted_names, max_workers, ordered)
+
+    def _assets_policy_names(self, policy_id: str, nb_of_results: int=None) -> list:
+        '''
+        Obtain the names of the assets minted under a specific policy ID.
+
+        :param policy_id: Policy ID
+        :nb_of_results: Optional, Number of results wanted
+        :return: List of the assets
+        '''
+        
+        assets_policy = self.assets_policy(policy_id, nb_of_results=nb_of_results)
+        
+        return list(assets_policy['asset'].values()) if assets_policy else []
+
+    def _iter_assets_info(self, assets: list, max_workers: int=None, ordered: bool=False):
+        '''
+        Request the informations about the assets in parallel, under the rate limiter and the retry policy of the instance.
+
+        :param assets: List of the assets
+        :param max_workers: Optional, number of assets requested at the same time (default: the greatest of max_concurrency and 8)
+        :param ordered: Optional, True for yield the assets in the order of the list (default: False, order of completion)
+        :return: Generator of (asset, informations about the asset or None, exception or None)
+        '''
+        
+        max_workers = max_workers or max(self.max_concurrency, bf_max_workers)
+        
+        query_asset = lambda asset: add_onchain_metadata(self.specific_asset(asset))
+        
+        # Results received before the next asset in the order of the list
+        waiting_results = {}
+        next_index = 0
+        
+        # The retries are done by the retry policy of the instance
+        for index, asset, asset_informations, error in query_in_parallel(query_asset, assets, max_workers, retries=0):
+            if not ordered:
+                yield asset, asset_informations, error
+                continue
+            
+            waiting_results[index] = (asset, asset_informations, error)
+            while next_index in waiting_results:
+                yield waiting_results.pop(next_index)
+                next_index += 1
 
     def specific_tx(self, txs_hash: str) -> dict: 
         """
@@ -622,10 +1301,22 @@ class Auth:
         
         specific_tx_url = self.network + bf_tx_url + txs_hash
 
-        response = query_blockfrost(specific_tx_url, self.api_key, self.proxies)
+        response = self._query(specific_tx_url, bf_cache_forever)
         
         return response
 
+    def specific_txs(self, txs_hashes: Iterable[str], max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Obtain the content of several transactions, requested in parallel.
+        
+        :param txs_hashes: Transaction hashes
+        :param max_workers: Optional, number of transactions requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the transactions failed with their error (default: False, a warning is raised)
+        :return: List with the info about the content of each transaction in the order of the hashes, None for a transaction failed, and the dictionary of the transactions failed if return_failed
+        """
+        
+        return self._query_keys(txs_hashes, lambda txs_hash: self.network + bf_tx_url + txs_hash, bf_cache_forever, max_workers, return_failed)
+
     def tx_utxos(self, txs_hash: str) -> dict: 
         """
         Return the inputs and UTXOs of the specific transaction.
@@ -636,10 +1327,22 @@ class Auth:
         
         specific_tx_utxos_url = self.network + bf_tx_url + txs_hash + bf_tx_utxos_url
 
-        response = query_blockfrost(specific_tx_utxos_url, self.api_key, self.proxies)
+        response = self._query(specific_tx_utxos_url, bf_cache_forever)
         
         return response
 
+    def txs_utxos(self, txs_hashes: Iterable[str], max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Return the inputs and UTXOs of several transactions, requested in parallel.
+        
+        :param txs_hashes: Transaction hashes
+        :param max_workers: Optional, number of transactions requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the transactions failed with their error (default: False, a warning is raised)
+        :return: List with the info about the inputs and UTXOs of each transaction in the order of the hashes, None for a transaction failed, and the dictionary of the transactions failed if return_failed
+        """
+        
+        return self._query_keys(txs_hashes, lambda txs_hash: self.network + bf_tx_url + txs_hash + bf_tx_utxos_url, bf_cache_forever, max_workers, return_failed)
+
     def tx_stake_address_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
         Obtain information about (de)registration of stake addresses within a transaction.
@@ -650,9 +1353,9 @@ class Auth:
         
         stake_address_certificates_url = self.network + bf_tx_url + txs_hash + bf_stake_address_certificates_url
 
-        response = query_blockfrost(stake_address_certificates_url, self.api_key, self.proxies)
+        response = self._query(stake_address_certificates_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_delegation_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -664,9 +1367,9 @@ class Auth:
         
         tx_delegation_certificates_url = self.network + bf_tx_url + txs_hash + bf_tx_delegation_certificates_url
 
-        response = query_blockfrost(tx_delegation_certificates_url, self.api_key, self.proxies)
+        response = self._query(tx_delegation_certificates_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_withdrawal_url(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -678,9 +1381,9 @@ class Auth:
         
         tx_withdrawal_url = self.network + bf_tx_url + txs_hash + bf_tx_withdrawal_url
 
-        response = query_blockfrost(tx_withdrawal_url, self.api_key, self.proxies)
+        response = self._query(tx_withdrawal_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_transaction_mirs(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -692,9 +1395,9 @@ class Auth:
         
         tx_transaction_mirs = self.network + bf_tx_url + txs_hash + bf_tx_transaction_mirs_url
 
-        response = query_blockfrost(tx_transaction_mirs, self.api_key, self.proxies)
+        response = self._query(tx_transaction_mirs, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_stake_pool_update(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -706,9 +1409,9 @@ class Auth:
         
         tx_stake_pool_update_url = self.network + bf_tx_url + txs_hash + bf_tx_stake_pool_update_url
 
-        response = query_blockfrost(tx_stake_pool_update_url, self.api_key, self.proxies)
+        response = self._query(tx_stake_pool_update_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_stake_pool_retirement_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -720,9 +1423,9 @@ class Auth:
         
         tx_stake_pool_retirement_cert_url = self.network + bf_tx_url + txs_hash + bf_tx_stake_pool_retirement_cert_url
 
-        response = query_blockfrost(tx_stake_pool_retirement_cert_url , self.api_key, self.proxies)
+        response = self._query(tx_stake_pool_retirement_cert_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_metadata(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -734,9 +1437,21 @@ class Auth:
         
         tx_metadata_url = self.network + bf_tx_url + txs_hash + bf_tx_metadata_url
 
-        response = query_blockfrost(tx_metadata_url , self.api_key, self.proxies)
+        response = self._query(tx_metadata_url, bf_cache_forever)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    def txs_metadata(self, txs_hashes: Iterable[str], max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Obtain the metadata of several transactions, requested in parallel.
+        
+        :param txs_hashes: Transaction hashes
+        :param max_workers: Optional, number of transactions requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the transactions failed with their error (default: False, a warning is raised)
+        :return: List with the metadata of each transaction in the order of the hashes, None for a transaction failed, and the dictionary of the transactions failed if return_failed
+        """
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return self._query_keys(txs_hashes, lambda txs_hash: self.network + bf_tx_url + txs_hash + bf_tx_metadata_url, bf_cache_forever, max_workers, return_failed)
 
     def tx_cbor_metadata(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -748,9 +1463,9 @@ class Auth:
         
         tx_cbor_metadata_url = self.network + bf_tx_url + txs_hash + bf_tx_cbor_metadata_url
 
-        response = query_blockfrost(tx_cbor_metadata_url, self.api_key, self.proxies)
+        response = self._query(tx_cbor_metadata_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
     def tx_redeemers(self, txs_hash: str, pandas: bool=False) -> dict: 
         """
@@ -762,26 +1477,29 @@ class Auth:
         
         tx_redeemers_url = self.network + bf_tx_url + txs_hash + bf_tx_redeemers_url
 
-        response = query_blockfrost(tx_redeemers_url, self.api_key, self.proxies)
+        response = self._query(tx_redeemers_url, bf_cache_forever)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
 
-    def scripts_list(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def scripts_list(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of scripts.
         
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the scripts hash
         """
         
-        scripts_url = bf_assets_url + bf_scripts_url
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, bf_scripts_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, bf_scripts_url, output=output)
         
-        #print('[INFO] Function script_list, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, bf_scripts_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
 
     def specific_script(self, script_hash: str) -> dict: 
         """
@@ -793,11 +1511,11 @@ class Auth:
         
         specific_script_url = self.network + bf_specific_script_url + script_hash
 
-        response = query_blockfrost(specific_script_url, self.api_key, self.proxies)
+        response = self._query(specific_script_url, bf_cache_forever)
         
         return response
 
-    def redeem_specific_script(self, script_hash: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union[pd.DataFrame, dict]:
+    def redeem_specific_script(self, script_hash: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', dict, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']:
         """
         List of redeemers of a specific script.
         
@@ -805,27 +1523,36 @@ class Auth:
         :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
         :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
         :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'dict')
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: Dictionary or DataFrame of the redeemers of a specific script
         """
         
         redeem_specific_script_url = bf_specific_script_url + script_hash + bf_redeem_specific_script_url
-        response, count_api_calls = query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, redeem_specific_script_url, self.proxies)
+        if stream:
+            return self._stream(data_order, nb_of_results, redeem_specific_script_url, output=output)
         
-        #print('[INFO] Function redeem_specific_script, {} API calls.'.format(count_api_calls))
+        response, _ = self._query_pages(data_order, nb_of_results, redeem_specific_script_url, pandas=pandas, output=output, checkpoint_path=checkpoint_path)
         
-        return pd.DataFrame.from_dict(response) if pandas else response
+        return response
+
 
+    def latest_block(self, cached: bool=True) -> dict:
+        """
+        Get the latest block available to the backends, also known as the tip of the blockchain.
 
-    def latest_block(self) -> dict:
-        """Get the latest block available to the backends, also known as the tip of the blockchain."""
+        :param cached: Optional, False for always request the tip instead of the response cached for 20 seconds (default: True)
+        :return: Dictionary with the block informations.
+        """
         url = self.network + bf_blocks_url + bf_blocks_latest_url
-        return query_blockfrost(url, self.api_key, self.proxies)
+        return self._query(url, bf_cache_tip_ttl if cached else bf_cache_disabled)
 
     
     def latest_block_tx(self) -> dict:
         """Get the transactions within the latest block."""
         url = self.network + bf_blocks_url + bf_blocks_latest_url + bf_blocks_tx_url
-        return query_blockfrost(url, self.api_key, self.proxies)
+        return self._query(url, bf_cache_tip_ttl)
 
 
     def specific_block(self, block_hash_or_nb: str) -> dict: 
@@ -836,28 +1563,67 @@ class Auth:
         :return: Dictionary with the block informations.
         """
         url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb)
-        return query_blockfrost(url, self.api_key, self.proxies)
+        return self._query(url, bf_cache_forever if is_hash(block_hash_or_nb) else bf_cache_disabled)
 
     
-    def next_blocks(self, block_hash_or_nb: str) -> dict: 
+    def specific_blocks(self, blocks_hash_or_nb: Iterable[str], max_workers: int=None, return_failed: bool=False) -> Union[list, Tuple[list, dict]]:
+        """
+        Get information about several blocks, requested in parallel.
+        
+        :param  blocks_hash_or_nb: Block hashes or block numbers
+        :param max_workers: Optional, number of blocks requested at the same time (default: max_concurrency)
+        :param return_failed: Optional, True for also return the blocks failed with their error (default: False, a warning is raised)
+        :return: List with the informations of each block in the order of the blocks, None for a block failed, and the dictionary of the blocks failed if return_failed
+        """
+        
+        return self._query_keys(blocks_hash_or_nb, lambda block_hash_or_nb: self.network + bf_blocks_url + "/{}".format(block_hash_or_nb),
+                                lambda block_hash_or_nb: bf_cache_forever if is_hash(block_hash_or_nb) else bf_cache_disabled, max_workers, return_failed)
+
+    def next_blocks(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']: 
         """
         Get the list of blocks following a specific block.
         
         :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact Block records (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: List with the information about all the folowing block.
         """
-        url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_next_blocks_url
-        return query_blockfrost(url, self.api_key, self.proxies)
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_next_blocks_url
+        cache_ttl = bf_cache_disabled
+        
+        if stream:
+            return self._stream(data_order, nb_of_results, url, cache_ttl, output=output)
+        
+        response, _ = self._query_pages(data_order, nb_of_results, url, cache_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
+        
+        return response
 
-    def previous_blocks(self, block_hash_or_nb: str) -> dict: 
+    def previous_blocks(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']: 
         """
         Get the list of blocks preceding a specific block.
         
         :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True, 'typed' for compact Block records (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: List with the information about all the previous block.
         """
-        url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_pevious_block_url
-        return query_blockfrost(url, self.api_key, self.proxies)
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_pevious_block_url
+        cache_ttl = bf_cache_disabled
+        
+        if stream:
+            return self._stream(data_order, nb_of_results, url, cache_ttl, output=output)
+        
+        response, _ = self._query_pages(data_order, nb_of_results, url, cache_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
+        
+        return response
 
     def specific_block_slot(self, slot_number: int) -> dict: 
         """
@@ -867,7 +1633,7 @@ class Auth:
         :return: Dictionary with the information about the block.
         """
         url = self.network + bf_blocks_url + bf_blocks_slot_url + "/{}".format(slot_number)
-        return query_blockfrost(url, self.api_key, self.proxies)
+        return self._query(url)
 
 
     def specific_block_epoch_slot(self, epoch_number: int, slot_number: int) -> dict: 
@@ -879,31 +1645,51 @@ class Auth:
         :return: Dictionary with the information about the block.
         """
         url = self.network + bf_blocks_url + bf_blocks_epoch + "/{}".format(epoch_number) + bf_blocks_slot_url + "/{}".format(slot_number)
-        return query_blockfrost(url, self.api_key, self.proxies)
+        return self._query(url)
 
 
-    def block_transaction(self, block_hash_or_nb: str) -> dict: 
+    def block_transaction(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']: 
         """
         Get the transactions within the block.
         
         :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: List with the transactions hashes.
         """
-        url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_tx_url
-        return query_blockfrost(url, self.api_key, self.proxies)
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_tx_url
+        cache_ttl = bf_cache_forever if is_hash(block_hash_or_nb) else bf_cache_disabled
+        
+        if stream:
+            return self._stream(data_order, nb_of_results, url, cache_ttl, output=output)
+        
+        response, _ = self._query_pages(data_order, nb_of_results, url, cache_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
+        
+        return response
 
-    def block_addresses_tx(self, block_hash_or_nb: str) -> dict: 
+    def block_addresses_tx(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False, stream: bool=False, output: str=None, checkpoint_path: str=None) -> Union['pd.DataFrame', list, Iterator, 'pyarrow.Table', 'pyarrow.RecordBatchReader']: 
         """
         Get a list of addresses affected in the specified block with additional information.
         
         :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param stream: Optional, True for return a generator yielding each record as soon as its page is received, instead of waiting for every page (default: False)
+        :param output: Optional, 'records', 'dict', 'pandas' or 'arrow' for an Arrow table with typed amounts, an Arrow record batch reader with stream=True (default: 'pandas' if pandas else 'records', the list of records)
+        :param checkpoint_path: Optional, file saving the pages received, an interrupted call started again with the same file resume after the last page saved (default: None)
         :return: List with the addresses and transation related.
         """
-        url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_addresses_url
-        return query_blockfrost(url, self.api_key, self.proxies)
-
-    
-
-
-    
-      
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_addresses_url
+        cache_ttl = bf_cache_forever if is_hash(block_hash_or_nb) else bf_cache_disabled
+        
+        if stream:
+            return self._stream(data_order, nb_of_results, url, cache_ttl, output=output)
+        
+        response, _ = self._query_pages(data_order, nb_of_results, url, cache_ttl, output=output or ('pandas' if pandas else 'records'), checkpoint_path=checkpoint_path)
+        
+        return response
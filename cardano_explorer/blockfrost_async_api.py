@@ -0,0 +1,997 @@
+#!/usr/bin/env python
+
+import os
+import asyncio
+import warnings
+from .blockfrost.config import *
+from .blockfrost.urls import *
+from .blockfrost.util import add_onchain_metadata, epochs_to_dataframe, import_pandas
+from typing import Union, Optional, List, Dict, Tuple, TYPE_CHECKING
+from .blockfrost.rate_limit import RateLimiter, bf_rate_limit, bf_burst
+from .blockfrost.retry import RetryPolicy
+from .blockfrost.stats import RequestStats
+from .blockfrost.async_query import async_query_blockfrost, async_query_on_several_pages, create_async_session
+
+if TYPE_CHECKING:
+    # Imported when a DataFrame is built
+    import pandas as pd
+
+class AsyncAuth:
+    """
+    Non-blocking client of the Blockfrost API, with the same methods as blockfrost_api.Auth.
+    Each method is a coroutine to await inside a running event loop.
+    """
+    
+    def __init__(self, network: str="mainnet", apiKey: str=None,  proxies: dict=None, pool_maxsize: int=100, pool_maxsize_per_host: int=0, keep_alive: bool=True, max_concurrency: int=1, rate_limit: float=bf_rate_limit, burst: int=bf_burst, rate_limit_path: str=None, max_retries: int=5, backoff_factor: float=0.5, deadline: float=None):
+        self.network  = network
+        self.api_key  = apiKey
+        self.proxies  = proxies
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.pool_maxsize_per_host = pool_maxsize_per_host
+        self.keep_alive = keep_alive
+        # Token bucket shared by every request of the instance (and by the processes using the same file), None for no limit
+        self.rate_limiter = RateLimiter(rate_limit, burst, rate_limit_path) if rate_limit else None
+        # Retry of the requests failed because of the rate limit, a server error or a transport error
+        self.retry_policy = RetryPolicy(max_retries, backoff_factor, deadline=deadline)
+        # Metrics of the requests by endpoint: requests, latency, bytes and retries
+        self.stats = RequestStats()
+        # The session is created in the event loop, at the first request
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        "Close the connections of the pool"
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self):
+        "Get the session, create it if needed"
+        if self._session is None or self._session.closed:
+            self._session = create_async_session(self.pool_maxsize, self.pool_maxsize_per_host, self.keep_alive)
+        return self._session
+         
+    @property
+    def api_key(self):
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value):
+        network = self._network 
+        
+        # If the api key is not specidied, look if she is configured in environement variable
+        if not value:
+            if "mainnet" in network  and os.getenv(bf_osenv_mainnet_apiKey) != None:
+                self._api_key = os.getenv(bf_osenv_mainnet_apiKey)
+
+            elif "testnet" in network and os.getenv(bf_osenv_testnet_apiKey) != None:
+                self._api_key = os.getenv(bf_osenv_testnet_apiKey)
+
+            elif "preview" in network and os.getenv(bf_osenv_preview_apiKey) != None:
+                self._api_key = os.getenv(bf_osenv_preview_apiKey)
+
+            elif "preprod" in network and os.getenv(bf_osenv_preprod_apiKey) != None:
+                self._api_key = os.getenv(bf_osenv_preprod_apiKey)
+
+            else:
+                raise ValueError(f"[ERROR] Your blockfrost api key for the {network} is not configured in your environement path. Create an environement variable name {network} or set it manually using the param 'api_key'")
+        # Else, use the api key set manually
+        else:
+            self._api_key = value
+
+    @property
+    def network(self):
+        "Get the network"
+        return self._network
+
+    @network.setter
+    def network(self, value):
+        "Set the network"
+        # Url of another server implementing the api (local instance, mock)
+        if value.startswith(('http://', 'https://')):
+            self._network = value if value.endswith('/') else value + '/'
+        elif 'mainnet' in value:
+            self._network = bf_url_cardano_mainnet
+        elif 'testnet' in value:
+            self._network = bf_url_cardano_legacy
+        elif 'preprod' in value:
+            self._network = bf_url_cardano_preprod
+        elif 'preview' in value:
+            self._network = bf_url_cardano_preview
+        else:
+            raise ValueError('{} is not a valid network'.format(value))
+
+    @property
+    def proxies(self):
+        "Get proxies"
+        return self._proxies
+
+    @proxies.setter
+    def proxies(self, value):
+        "Set proxies"
+        self._proxies = value
+
+    @property
+    def max_concurrency(self):
+        "Get the maximum number of pages requested at the same time"
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        "Set the maximum number of pages requested at the same time"
+        assert(int(value) >= 1), "[ERROR] The parameter 'max_concurrency' ({}) should be greater or equal to 1.".format(value)
+        self._max_concurrency = int(value)
+
+    def _proxy(self) -> Optional[str]:
+        "Get the proxy url for the network, aiohttp use one proxy per request"
+        if not self.proxies:
+            return None
+        return self.proxies.get('https' if self.network.startswith('https') else 'http')
+
+    async def _query(self, url: str) -> dict:
+        """
+        Query the url through the session of the instance.
+        
+        :param url: The url
+        :return: Dictionary
+        """
+        return await async_query_blockfrost(url, self.api_key, self.session, self._proxy(), self.rate_limiter, self.retry_policy, self.stats)
+
+    async def _query_pages(self, data_order: str, nb_of_results: int, query_url: str, pandas: bool=False, output: str=None) -> Tuple[Union['pd.DataFrame', dict, list], int]:
+        """
+        Query several pages through the session of the instance.
+        
+        :param data_order: The data order
+        :param nb_of_results: The number of results wanted
+        :param query_url: Query url
+        :param pandas: Optional, True for build a DataFrame instead of a dictionary (default: False)
+        :param output: Optional, output format, take precedence over pandas (default: 'pandas' if pandas else 'dict')
+        :return: Dictionary, DataFrame or list with the data and number of api calls
+        """
+        output = output or ('pandas' if pandas else 'dict')
+        response, count_api_calls = await async_query_on_several_pages(self.network, self.api_key, data_order, nb_of_results, query_url, self.session, self.max_concurrency, self._proxy(), self.rate_limiter, self.retry_policy, output, self.stats)
+        
+        # The number of api calls of each query is kept in the metrics of the instance
+        self.stats.record_call(query_url, count_api_calls)
+        
+        return response, count_api_calls
+ 
+    async def stake_informations(self, stake_address: str) -> dict:
+        """
+        Obtain informations about a stake account.
+        
+        :param stake_address: The stake addresse
+        :return: Dictionary with the informations about a specific stake account
+        """
+        
+        url_stake_info = self.network + bf_stake_url + stake_address
+        
+        response = await self._query(url_stake_info)
+        
+        return response
+                 
+    async def stake_reward_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain the reward history.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the rewards history 
+        """
+        
+        rewards_history_url = "{}{}{}".format(bf_stake_url,
+                                              stake_address,
+                                              bf_stake_rewards_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, rewards_history_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_amount_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain the stake amount history.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, the number of results wanted
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake amount history
+        """
+        
+        stake_amount_history_url = "{}{}{}".format(bf_stake_url,
+                                                   stake_address,
+                                                   bf_stake_amount_history_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_amount_history_url, pandas=pandas)
+        
+        return response
+         
+    async def stake_delegation(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake delegation.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake delegation history
+        """
+        
+        stake_delegation_url = "{}{}{}".format(bf_stake_url,
+                                               stake_address,
+                                               bf_stake_delegation_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_delegation_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_registration_deregistrations(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake registration et deregistrations.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake registration and deregistrations history
+        """
+        
+        stake_registration_url = "{}{}{}".format(bf_stake_url,
+                                                 stake_address,
+                                                 bf_stake_registration_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_registration_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_withdrawal_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake withdrawal history.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake withdrawal history 
+        """
+        
+        stake_withdrawal_history_url = "{}{}{}".format(bf_stake_url,
+                                                       stake_address,
+                                                       bf_stake_withdrawal_history_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_withdrawal_history_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_mir_history(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake mir history.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake mir history
+        """
+        
+        stake_mir_history_url = "{}{}{}".format(bf_stake_url,
+                                                stake_address,
+                                                bf_stake_mir_history_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_mir_history_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake associated addresses.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake associated addresses or empty dictionary if the stake address have no stake ADA
+        """
+        
+        stake_associated_addresses_url = "{}{}{}".format(bf_stake_url,
+                                                         stake_address,
+                                                         bf_associated_addresses_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_associated_addresses_url, pandas=pandas)
+        
+        return response
+    
+    async def stake_assets_associated_addresses(self, stake_address: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain information about the stake assets associated addresses.
+        
+        :param stake_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the stake associated addresses or empty dictionary if the stake address have no stake ADA
+        """
+        
+        stake_assets_associated_addresses_url = "{}{}{}".format(bf_stake_url,
+                                                                stake_address,
+                                                                bf_assets_associated_addresses_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, stake_assets_associated_addresses_url, pandas=pandas)
+        
+        return response
+    
+    async def address_info(self, address: str) -> dict:
+        """
+        Obtain informations about an address.
+        
+        :param stake_addresse: Address
+        :return: Dictionary or DataFrame with the informations about the address
+        
+        """
+        
+        address_info_url = self.network + bf_address_url + address
+        
+        response = await self._query(address_info_url)
+        
+        return response
+    
+    async def address_details(self, address: str) -> dict:
+        """
+        Obtain details information about an address.
+        
+        :param stake_addresse: Address
+        :return: Dictionary with the informations details about the address
+        """
+        
+        address_details_url = self.network + bf_address_url + address + bf_address_details_url
+        
+        response = await self._query(address_details_url)
+        
+        return response
+    
+    async def address_utxo(self, address: str, pandas: bool=False, data_order: str='asc', nb_of_results: int=None) -> Union['pd.DataFrame', list]:
+        """
+        Obtain UTXO of the address.
+        
+        :param stake_addresse: Address
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :return: List or DataFrame with the informations details about the UTXO of an address
+        """
+        
+        address_utxo_url = bf_address_url + address + bf_address_utxo_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, address_utxo_url, output='pandas' if pandas else 'records')
+        
+        return response
+    
+    async def address_transaction(self, address: str, pandas: bool=False, data_order: str='asc', nb_of_results: int=None) -> Union['pd.DataFrame', list]:
+        """
+        Transactions on the address.
+        
+        :param stake_addresse: Address
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :return: List or DataFrame with the informations details about the address transaction
+        """
+        
+        address_transaction_url = bf_address_url + address + bf_address_transaction_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, address_transaction_url, output='pandas' if pandas else 'records')
+        
+        return response
+    
+    async def network_info(self) -> dict:
+        """Return detailed network information."""
+        
+        network_info_url = self.network + bf_network_informations_url
+        
+        response = await self._query(network_info_url)
+        
+        return response
+    
+    async def latest_epoch(self) -> dict:
+        """Return the information about the latest, therefore current, epoch."""
+        
+        latest_epoch_url = self.network + bf_latest_epoch_url
+        
+        response = await self._query(latest_epoch_url)
+        
+        return response
+    
+    async def specific_epoch(self, epoch: int) -> dict:
+        """
+        Obtain information about a specific epocht.
+        
+        :param epoch: The number of the epoch
+        :return: Dictionary with information about a specific epoch
+        """
+        
+        # Check if the epoch is greater than 0
+        assert(int(epoch) >= 0), "[ERROR] The number of epoch can't be negatif."
+        
+        specific_epoch_url = self.network + bf_epoch_url + str(epoch)
+        
+        response = await self._query(specific_epoch_url)
+        
+        return response
+    
+    async def latest_epoch_protocol_parameters(self) -> dict:
+        """Return the protocol parameters for the latest epoch."""
+        
+        address_info_url = self.network + bf_latest_epoch_protocol_parameters_url
+        
+        response = await self._query(address_info_url)
+        
+        return response
+     
+    async def epochs_history(self, epochs: Union[list, range], pandas: bool=False) -> Union['pd.DataFrame', list]:            
+        """
+        Obtain history about the epochs.
+        
+        :param epochs: List or range of the epochs number, the current epoch included
+        :param pandas: Optional, True for return a DataFrame indexed by epoch, with the amounts converted to numbers (default: False)
+        :return: List or DataFrame of the epochs informations history
+        """
+        
+        # Check if the parameter epochs is a list or a range
+        assert(isinstance(epochs, (list, range))), "[ERROR] The parameter 'epochs' should be a list or a range not ({})".format(type(epochs))
+        
+        if len(epochs) == 0:
+            return epochs_to_dataframe([]) if pandas else []
+    
+        last_epoch = (await self.latest_epoch())['epoch']
+        
+        # check if the epoch number is not inferior than O or greater than the last epoch.
+        assert(min(epochs) >= 0), "[ERROR] The number of epoch ({}) can't be inferior than 0.".format(min(epochs))
+        assert(max(epochs) <= last_epoch), "[ERROR] The number of epoch ({}) can't be greater than the last epoch ({})".format(max(epochs), last_epoch)
+        
+        # Request each epoch once, at the same time
+        unique_epochs = list(dict.fromkeys(epochs))
+        epochs_informations = dict(zip(unique_epochs, await asyncio.gather(*[self.specific_epoch(epoch) for epoch in unique_epochs])))
+        
+        epochs_history = [epochs_informations[epoch] for epoch in epochs]
+            
+        return epochs_to_dataframe(epochs_history) if pandas else epochs_history
+    
+    async def registered_polls(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain the list of registered stake pools.
+        
+        :param reward_address: The stake address
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the registered stake pools
+        """
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, bf_polls_url, pandas=pandas)
+        
+        # Rename the column of the pool ID
+        if pandas:
+            response = response.rename(columns={0: 'registered_polls_id'})
+        else:
+            response['registered_polls_id'] = response.pop(0)
+                  
+        return response
+     
+    async def pool_informations(self, pool_id: str) -> dict: 
+        """
+        Obtain Pool information.
+        
+        :param pool_id: The id of the pool
+        :return: Dictionary with the informations about a pool
+        """
+        
+        pool_informations_url = self.network + bf_polls_url + pool_id
+        response = await self._query(pool_informations_url)
+        
+        return response
+      
+    async def stake_pool_history(self, pool_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain history of stake pool parameters over epochs
+        
+        :param pool_id: The id of the pool
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return dict: Dictionary or DataFrame of the history of stake pool parameters over epochs
+        """
+        
+        param_stake_pool_history_url = "{}{}{}".format(bf_polls_url,
+                                                       pool_id,
+                                                       bf_param_stake_pool_history_url)
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, param_stake_pool_history_url, pandas=pandas)
+        
+        return response
+ 
+    async def stake_rewards_corr(self, stake_address: str, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Create a dataframe with explanatory variables of the stake rewards for each epochs.
+        The rewards of each epoch are joined with the history of the pool which paid them.
+
+        :param stake_address: Stake address
+        :pandas: Optional, True for return a pandas dataframe
+        :return: Dictionary or DataFrame about informations on the rewards history
+        """
+
+        # Get the rewards history and the stake amount history at the same time
+        df_rewards_hist, df_amount_hist = await asyncio.gather(self.stake_reward_history(stake_address, pandas=True),
+                                                               self.stake_amount_history(stake_address, pandas=True))
+        df_rewards_hist = df_rewards_hist.rename({'amount': 'rewards_amount'}, axis=1)
+        df_amount_hist = df_amount_hist.rename({'amount': 'stake_amount'}, axis=1)
+        epoch_reward_list = sorted(set(df_rewards_hist['epoch'].tolist()))
+        pool_ids = list(dict.fromkeys(df_rewards_hist['pool_id'].tolist()))
+
+        # Get the history of every pool which paid rewards and the epochs information at the same time
+        *pools_hist, df_epochs_hist = await asyncio.gather(*[self.stake_pool_history(pool_id, nb_of_results=None, pandas=True) for pool_id in pool_ids],
+                                                           self.epochs_history(epoch_reward_list, pandas=True))
+        pd = import_pandas()
+        df_stake_pool_hist = pd.concat([df_pool_hist.assign(pool_id=pool_id) for pool_id, df_pool_hist in zip(pool_ids, pools_hist)], ignore_index=True) if pool_ids else pd.DataFrame(columns=['epoch', 'pool_id'])
+        # Replace the column names
+        df_stake_pool_hist_col_name = {name:'stake_pool_{}'.format(name) for name in df_stake_pool_hist.columns.tolist() if name != 'pool_id'}
+        df_stake_pool_hist = df_stake_pool_hist.rename(columns=df_stake_pool_hist_col_name)
+
+        # Replace the column names, the epochs are indexed by epoch
+        df_epochs_hist = df_epochs_hist.add_prefix('epoch_')
+
+        # Concatenate the data into a unique dataframe, the rewards are joined with the history of the pool which paid them
+        df = df_rewards_hist[['epoch','rewards_amount']].join(df_amount_hist.set_index('active_epoch')[['stake_amount']], on='epoch')
+        df['pool_id'] = df_rewards_hist['pool_id']
+        df = df.join(df_epochs_hist, on='epoch')
+        df = df.join(df_stake_pool_hist.set_index(['stake_pool_epoch', 'pool_id']), on=['epoch', 'pool_id'])
+
+        return df if pandas else df.to_dict()
+
+    async def assets(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of assets.
+        
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the assets
+        """
+        
+
+        response, _ = await self._query_pages(data_order, nb_of_results, bf_assets_url, pandas=pandas)
+        
+        return response
+
+    async def specific_asset(self, asset: str) -> dict: 
+        """
+        Obtain information about a specific asset.
+        
+        :param assets: Assets (Concatenation of the policy_id and hex-encoded asset_name)
+        :return: Dictionary with the info about the asset
+        """
+        
+        specific_asset_url = self.network + bf_assets_url + asset
+
+        response = await self._query(specific_asset_url)
+        
+        return response
+ 
+    async def asset_history(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        Obtain the history of a specific asset.
+        
+        :param assets: Assets (Concatenation of the policy_id and hex-encoded asset_name)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the assets
+        """
+        
+        assets_history_url = bf_assets_url + asset + bf_asset_history_url
+
+        response, _ = await self._query_pages(data_order, nb_of_results, assets_history_url, pandas=pandas)
+        
+        return response
+
+    async def asset_transactions(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of a specific asset transactions.
+        
+        :param assets: Assets (Concatenation of the policy_id and hex-encoded asset_name)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the assets
+        """
+        
+        assets_transactions_url = bf_assets_url + asset + bf_asset_transactions_url
+
+        response, _ = await self._query_pages(data_order, nb_of_results, assets_transactions_url, pandas=pandas)
+        
+        return response
+     
+    async def asset_addresses(self, asset: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of a addresses containing a specific asset.
+        
+        :param assets: Assets (Concatenation of the policy_id and hex-encoded asset_name)
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the assets
+        """
+        
+        assets_addresses_url = bf_assets_url + asset + bf_asset_addresses_url
+        response, _ = await self._query_pages(data_order, nb_of_results, assets_addresses_url, pandas=pandas)
+        
+        return response
+
+    async def assets_policy(self, policy_id: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of asset minted under a specific policy.
+        
+        :param policy_id: Policy ID of the asset
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the assets
+        """
+        
+        assets_policy_url = bf_assets_url + bf_assets_policy_url + policy_id
+        response, _ = await self._query_pages(data_order, nb_of_results, assets_policy_url, pandas=pandas)
+        
+        return response
+
+    async def assets_policy_info(self, policy_id: str, nb_of_results: int=None, pandas: bool=False, max_workers: int=None, return_failed: bool=False) -> Union['pd.DataFrame', list, Tuple[Union['pd.DataFrame', list], list]]:
+        '''
+        Obtain informations about the assets minted under a specific policy ID.
+        The assets are requested at the same time under the rate limiter of the instance, an asset still failing after the retries of the retry policy doesn't stop the others.
+
+        :param policy_id: Policy ID
+        :nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: None)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :param max_workers: Optional, number of assets requested at the same time (default: pool size)
+        :param return_failed: Optional, True for return also the list of the assets failed (default: False, a warning is raised)
+        :return: List or DataFrame with the informations on each asset under the policy, and the list of the assets failed if return_failed
+        '''
+        
+        assets_policy = await self.assets_policy(policy_id, nb_of_results=nb_of_results)
+        asset_minted_names = list(assets_policy['asset'].values()) if assets_policy else []
+
+        semaphore = asyncio.Semaphore(max_workers if max_workers else self.pool_maxsize)
+
+        async def query_asset(asset: str) -> dict:
+            # The retries are done by the retry policy of the instance
+            async with semaphore:
+                return add_onchain_metadata(await self.specific_asset(asset))
+
+        responses = await asyncio.gather(*[query_asset(asset) for asset in asset_minted_names], return_exceptions=True)
+        
+        assets_informations = [response for response in responses if not isinstance(response, Exception)]
+        failed_assets = [asset for asset, response in zip(asset_minted_names, responses) if isinstance(response, Exception)]
+
+        if failed_assets and not return_failed:
+            warnings.warn('[WARNING] {} assets of the policy {} failed: {}'.format(len(failed_assets), policy_id, failed_assets))
+
+        assets_informations = import_pandas().DataFrame.from_dict(assets_informations) if pandas else assets_informations
+
+        return (assets_informations, failed_assets) if return_failed else assets_informations
+
+    async def specific_tx(self, txs_hash: str) -> dict: 
+        """
+        Obtain the content of the requested transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about the content of the transaction
+        """
+        
+        specific_tx_url = self.network + bf_tx_url + txs_hash
+
+        response = await self._query(specific_tx_url)
+        
+        return response
+
+    async def tx_utxos(self, txs_hash: str) -> dict: 
+        """
+        Return the inputs and UTXOs of the specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about the inputs and UTXOs of the specific transaction
+        """
+        
+        specific_tx_utxos_url = self.network + bf_tx_url + txs_hash + bf_tx_utxos_url
+
+        response = await self._query(specific_tx_utxos_url)
+        
+        return response
+
+    async def tx_stake_address_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about (de)registration of stake addresses within a transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about (de)registration of stake addresses within a transaction
+        """
+        
+        stake_address_certificates_url = self.network + bf_tx_url + txs_hash + bf_stake_address_certificates_url
+
+        response = await self._query(stake_address_certificates_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_delegation_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about delegation certificates of a specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about delegation certificates of a specific transaction
+        """
+        
+        tx_delegation_certificates_url = self.network + bf_tx_url + txs_hash + bf_tx_delegation_certificates_url
+
+        response = await self._query(tx_delegation_certificates_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_withdrawal_url(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about withdrawals of a specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about withdrawals of a specific transaction
+        """
+        
+        tx_withdrawal_url = self.network + bf_tx_url + txs_hash + bf_tx_withdrawal_url
+
+        response = await self._query(tx_withdrawal_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_transaction_mirs(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about withdrawals of a specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about withdrawals of a specific transaction
+        """
+        
+        tx_transaction_mirs = self.network + bf_tx_url + txs_hash + bf_tx_transaction_mirs_url
+
+        response = await self._query(tx_transaction_mirs)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_stake_pool_update(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about stake pool registration and update certificates of a specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about stake pool registration and update certificates of a specific transaction
+        """
+        
+        tx_stake_pool_update_url = self.network + bf_tx_url + txs_hash + bf_tx_stake_pool_update_url
+
+        response = await self._query(tx_stake_pool_update_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_stake_pool_retirement_cert(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain information about stake pool retirements within a specific transaction.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about stake pool retirements within a specific transaction
+        """
+        
+        tx_stake_pool_retirement_cert_url = self.network + bf_tx_url + txs_hash + bf_tx_stake_pool_retirement_cert_url
+
+        response = await self._query(tx_stake_pool_retirement_cert_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_metadata(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain the transaction metadata.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about the transaction metadata
+        """
+        
+        tx_metadata_url = self.network + bf_tx_url + txs_hash + bf_tx_metadata_url
+
+        response = await self._query(tx_metadata_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_cbor_metadata(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain the transaction metadata in CBOR.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about the transaction metadata in CBOR
+        """
+        
+        tx_cbor_metadata_url = self.network + bf_tx_url + txs_hash + bf_tx_cbor_metadata_url
+
+        response = await self._query(tx_cbor_metadata_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def tx_redeemers(self, txs_hash: str, pandas: bool=False) -> dict: 
+        """
+        Obtain the transaction redeemers.
+        
+        :param txs_hash: Transaction hash
+        :return: Dictionary with the info about the transaction redeemers.
+        """
+        
+        tx_redeemers_url = self.network + bf_tx_url + txs_hash + bf_tx_redeemers_url
+
+        response = await self._query(tx_redeemers_url)
+        
+        return import_pandas().DataFrame.from_dict(response) if pandas else response
+
+    async def scripts_list(self, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of scripts.
+        
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the scripts hash
+        """
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, bf_scripts_url, pandas=pandas)
+        
+        return response
+
+    async def specific_script(self, script_hash: str) -> dict: 
+        """
+        Information about a specific script.
+        
+        :param script_hash: Script hash
+        :return: Dictionary with the info about a specific script.
+        """
+        
+        specific_script_url = self.network + bf_specific_script_url + script_hash
+
+        response = await self._query(specific_script_url)
+        
+        return response
+
+    async def redeem_specific_script(self, script_hash: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', dict]:
+        """
+        List of redeemers of a specific script.
+        
+        :param script_hash: Script hash
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, Number of results wanted. The api return 100 results at a time (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: Dictionary or DataFrame of the redeemers of a specific script
+        """
+        
+        redeem_specific_script_url = bf_specific_script_url + script_hash + bf_redeem_specific_script_url
+        response, _ = await self._query_pages(data_order, nb_of_results, redeem_specific_script_url, pandas=pandas)
+        
+        return response
+
+
+    async def latest_block(self) -> dict:
+        """Get the latest block available to the backends, also known as the tip of the blockchain."""
+        url = self.network + bf_blocks_url + bf_blocks_latest_url
+        return await self._query(url)
+
+    
+    async def latest_block_tx(self) -> dict:
+        """Get the transactions within the latest block."""
+        url = self.network + bf_blocks_url + bf_blocks_latest_url + bf_blocks_tx_url
+        return await self._query(url)
+
+
+    async def specific_block(self, block_hash_or_nb: str) -> dict: 
+        """
+        Get information about a specific script.
+        
+        :param  block_hash_or_nb: Block hash or block number
+        :return: Dictionary with the block informations.
+        """
+        url = self.network + bf_blocks_url + "/{}".format(block_hash_or_nb)
+        return await self._query(url)
+
+    
+    async def next_blocks(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', list]: 
+        """
+        Get the list of blocks following a specific block.
+        
+        :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: List with the information about all the folowing block.
+        """
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_next_blocks_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, url, output='pandas' if pandas else 'records')
+        
+        return response
+
+    async def previous_blocks(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=100, pandas: bool=False) -> Union['pd.DataFrame', list]: 
+        """
+        Get the list of blocks preceding a specific block.
+        
+        :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: 100)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: List with the information about all the previous block.
+        """
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_pevious_block_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, url, output='pandas' if pandas else 'records')
+        
+        return response
+
+    async def specific_block_slot(self, slot_number: int) -> dict: 
+        """
+        Get the content of a requested block for a specific slot.
+        
+        :param  slot_number: Slot number
+        :return: Dictionary with the information about the block.
+        """
+        url = self.network + bf_blocks_url + bf_blocks_slot_url + "/{}".format(slot_number)
+        return await self._query(url)
+
+
+    async def specific_block_epoch_slot(self, epoch_number: int, slot_number: int) -> dict: 
+        """
+        Get the content of a requested block for a specific slot in an epoch.
+        
+        :param  epoch_number: Epoch number
+        :param  slot_number: Slot number
+        :return: Dictionary with the information about the block.
+        """
+        url = self.network + bf_blocks_url + bf_blocks_epoch + "/{}".format(epoch_number) + bf_blocks_slot_url + "/{}".format(slot_number)
+        return await self._query(url)
+
+
+    async def block_transaction(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', list]: 
+        """
+        Get the transactions within the block.
+        
+        :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: List with the transactions hashes.
+        """
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_tx_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, url, output='pandas' if pandas else 'records')
+        
+        return response
+
+    async def block_addresses_tx(self, block_hash_or_nb: str, data_order: str='asc', nb_of_results: int=None, pandas: bool=False) -> Union['pd.DataFrame', list]: 
+        """
+        Get a list of addresses affected in the specified block with additional information.
+        
+        :param  block_hash_or_nb: Block hash or block number
+        :param data_order: Optional, use 'desc' if you want reverse the data order (default: Ascending)
+        :param nb_of_results: Optional, number of results wanted. The api return 100 results at a time. None for return all the data (default: None)
+        :param pandas: Optional, True for return a pandas dataframe (default: False)
+        :return: List with the addresses and transation related.
+        """
+        url = bf_blocks_url + "/{}".format(block_hash_or_nb) + bf_blocks_addresses_url
+        
+        response, _ = await self._query_pages(data_order, nb_of_results, url, output='pandas' if pandas else 'records')
+        
+        return response
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+import warnings
+import threading
+from time import time
+from collections import deque
+from typing import Callable, Iterator, Optional
+from .blockfrost_api import Auth
+from .blockfrost.errors import BlockfrostError, TruncatedResultWarning
+
+# Average time between two blocks, in seconds
+bf_block_time = 20
+
+class ChainFollower:
+    """
+    Follow the tip of the chain and yield an event for each new block, with its transactions, and for each rollback.
+    The tip is polled at the time the next block is expected, the blocks missed after a gap are requested by batches of 100 with next_blocks.
+    The blocks yielded are chained by their previous_block hash, a rollback is detected when the last block yielded is no longer on the chain.
+
+    Events:
+        {'type': 'block', 'block': block informations, 'transactions': list of the transaction hashes}
+        {'type': 'rollback', 'block': block on the chain from which the blocks are yielded again, 'rolled_back': list of the blocks rolled back, newest first}
+    """
+
+    def __init__(self, auth: Auth, start: str=None, transactions: bool=True, poll_interval: float=bf_block_time, min_interval: float=2, max_interval: float=60, max_rollback: int=100):
+        """
+        :param auth: Auth instance used to send the requests
+        :param start: Optional, hash or number of the last block already processed, the blocks after it are yielded (default: None, start after the current tip)
+        :param transactions: Optional, False for not request the transactions of each block (default: True)
+        :param poll_interval: Optional, expected time between two blocks in seconds (default: 20)
+        :param min_interval: Optional, minimum time between two polls of the tip in seconds (default: 2)
+        :param max_interval: Optional, maximum time between two polls of the tip in seconds (default: 60)
+        :param max_rollback: Optional, number of blocks kept for find the block from which the chain was rolled back (default: 100)
+        """
+        assert(0 < min_interval <= max_interval), "[ERROR] The parameter 'min_interval' ({}) should be greater than 0 and lower or equal to 'max_interval' ({}).".format(min_interval, max_interval)
+        assert(max_rollback >= 1), "[ERROR] The parameter 'max_rollback' ({}) should be greater or equal to 1.".format(max_rollback)
+
+        self.auth = auth
+        self.start = start
+        self.transactions = transactions
+        self.poll_interval = poll_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # Last block yielded
+        self.tip = None
+        # Blocks yielded, newest last, for find the fork point of a rollback
+        self._blocks = deque(maxlen=max_rollback)
+        # Number of polls in a row without a new block
+        self._missed_polls = 0
+        self._stop = threading.Event()
+
+    def stop(self):
+        "Stop following the chain, the generator returns after the event in progress"
+        self._stop.set()
+
+    def _next_poll_delay(self) -> float:
+        """
+        Get the time to wait before polling the tip again.
+        Before the next block is expected, wait until it is expected, then poll more and more often until it arrives.
+
+        :return: Number of seconds to wait
+        """
+        expected_delay = self.tip['time'] + self.poll_interval - time()
+
+        if expected_delay > 0:
+            delay = expected_delay
+        else:
+            delay = self.poll_interval / 2 ** (self._missed_polls + 1)
+
+        return min(self.max_interval, max(self.min_interval, delay))
+
+    def _block_event(self, block: dict) -> dict:
+        "Create the event of a new block, with its transactions"
+        transactions = []
+
+        if self.transactions and block.get('tx_count'):
+            transactions = self.auth.block_transaction(block['hash'])
+
+        return {'type': 'block', 'block': block, 'transactions': transactions}
+
+    def _rollback(self) -> dict:
+        """
+        Find the newest block yielded still on the chain and go back to it.
+
+        :return: The rollback event
+        """
+        rolled_back = []
+
+        while self._blocks:
+            block = self._blocks[-1]
+            try:
+                chain_block = self.auth.specific_block(block['height'])
+            except BlockfrostError as e:
+                if e.status_code != 404:
+                    raise
+                chain_block = None
+
+            if chain_block is not None and chain_block['hash'] == block['hash']:
+                self.tip = block
+                return {'type': 'rollback', 'block': block, 'rolled_back': rolled_back}
+
+            rolled_back.append(self._blocks.pop())
+
+        raise BlockfrostError('[ERROR] The chain was rolled back further than the {} blocks kept (max_rollback).'.format(self._blocks.maxlen))
+
+    def _catch_up(self) -> Iterator[dict]:
+        """
+        Yield the blocks following the tip, by batches of 100, until the tip of the chain.
+        """
+        while not self._stop.is_set():
+            try:
+                # A full batch is expected while catching up, the next one follow
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', TruncatedResultWarning)
+                    blocks = self.auth.next_blocks(self.tip['hash'])
+            except BlockfrostError as e:
+                # The last block yielded doesn't exist anymore
+                if e.status_code != 404:
+                    raise
+                yield self._rollback()
+                continue
+
+            for block in blocks:
+                if block['previous_block'] != self.tip['hash']:
+                    yield self._rollback()
+                    break
+
+                event = self._block_event(block)
+                self.tip = block
+                self._blocks.append(block)
+                yield event
+
+                if self._stop.is_set():
+                    return
+            else:
+                # The last batch reached the tip of the chain
+                if len(blocks) < 100:
+                    return
+
+    def follow(self) -> Iterator[dict]:
+        """
+        Follow the chain until stop() is called.
+
+        :return: Generator of the events
+        """
+        self._stop.clear()
+
+        if self.tip is None:
+            self.tip = self.auth.specific_block(self.start) if self.start is not None else self.auth.latest_block(cached=False)
+            self._blocks.append(self.tip)
+
+        while not self._stop.is_set():
+            latest_block = self.auth.latest_block(cached=False)
+
+            if latest_block['hash'] == self.tip['hash']:
+                self._missed_polls += 1
+            else:
+                self._missed_polls = 0
+                yield from self._catch_up()
+
+            self._stop.wait(self._next_poll_delay())
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.follow()
+
+    def run(self, callback: Callable[[dict], None], stop_event: Optional[threading.Event]=None):
+        """
+        Follow the chain and call the callback with each event, until stop() is called or the stop event is set.
+
+        :param callback: Function called with each event
+        :param stop_event: Optional, event stopping the follower when it is set (default: None)
+        """
+        if stop_event is not None:
+            threading.Thread(target=lambda: (stop_event.wait(), self.stop()), daemon=True).start()
+
+        for event in self.follow():
+            callback(event)
@@ -1 +1,2 @@
-repo_url = 'https://api.github.com/repos/Cardano-NFTs/policyIDs/contents/'
\ No newline at end of file
+repo_url = 'https://api.github.com/repos/Cardano-NFTs/policyIDs/contents/'
+archive_url = 'https://api.github.com/repos/Cardano-NFTs/policyIDs/tarball'
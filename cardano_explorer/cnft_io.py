@@ -1,11 +1,332 @@
 #!/usr/bin/env python
 
 
+import io
+import os
+import copy
 import json
 import base64
+import hashlib
+import tarfile
+import threading
 import requests
-import pandas as pd
-from .cnft.urls import repo_url
+from time import time
+from typing import Optional, Tuple, Dict, Iterable
+from .cnft.urls import repo_url, archive_url
+from .blockfrost.parallel import query_in_parallel
+from .blockfrost.util import import_pandas
+
+# Time before checking if the verified list changed, in seconds
+cnft_cache_ttl = 3600
+
+# Number of project files requested at the same time
+cnft_max_workers = 8
+
+class VerifiedPolicyIndex:
+    """
+    Index of the projects and policies verified by cnft.io, loaded once and shared by every function of the module.
+    The index hold a map project -> policies and a map policy -> project, for check many policies without request.
+    It is optionally saved in a JSON file and the list is refreshed with a conditional request (ETag / If-None-Match):
+    an unchanged list cost a 304 response, and only the project files whose sha changed in the list are requested again.
+    The files of every project are received at once in an archive of the repository, the GitHub API allow 60 requests per hour without token.
+    """
+
+    def __init__(self, path: str=None, max_age: float=cnft_cache_ttl, max_workers: int=cnft_max_workers, token: str=None):
+        """
+        :param path: Optional, JSON file saving the index between the sessions (default: None, kept in memory)
+        :param max_age: Optional, time in seconds before checking if the verified list changed (default: 3600)
+        :param max_workers: Optional, number of project files requested at the same time (default: 8)
+        :param token: Optional, GitHub token for the higher rate limit of the authenticated requests (default: None)
+        """
+        self.path = path
+        self.max_age = max_age
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        if token is not None:
+            self.session.headers['Authorization'] = 'token {}'.format(token)
+        # The lock protect the state of the index, the requests are sent without it
+        self._lock = threading.RLock()
+
+        # Verified list: an entry by project file of the repository, and its ETag
+        self._listing = None
+        self._project_names = set()
+        self._listing_etag = None
+        self._refreshed = 0
+        # Project files received, by project name, with their content decoded
+        self._projects = {}
+        # Maps project -> policies and policy -> project, the policies of a project are known once its file is received
+        self._policies = {}
+        self._policy_project = {}
+
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    def _request(self, url: str, etag: str=None) -> Tuple[Optional[dict], Optional[str]]:
+        """
+        Request the repository, with the ETag of the previous response.
+
+        :param url: The url
+        :param etag: Optional, ETag of the previous response
+        :return: The response and its ETag, None if the response didn't change
+        """
+        headers = {'If-None-Match': etag} if etag else {}
+        req = self.session.get(url, headers=headers)
+
+        if req.status_code == requests.codes.not_modified:
+            return None, etag
+
+        if req.status_code != requests.codes.ok:
+            raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
+
+        return req.json(), req.headers.get('ETag')
+
+    def _request_archive(self) -> bytes:
+        "Request the archive of the repository, a single API call for every project file"
+        req = self.session.get(archive_url)
+
+        if req.status_code != requests.codes.ok:
+            raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
+
+        return req.content
+
+    def _load(self):
+        "Load the index saved in the file"
+        with open(self.path) as f:
+            state = json.load(f)
+
+        self._listing = state['listing']
+        self._project_names = {project['name'] for project in self._listing}
+        self._listing_etag = state['listing_etag']
+        self._refreshed = state['refreshed']
+        for project_name, project in state['projects'].items():
+            self._add_project(project_name, project)
+
+    def save(self):
+        "Save the index in its file, replaced atomically"
+        if self.path is None:
+            return
+
+        with self._lock:
+            state = json.dumps({'listing': self._listing, 'listing_etag': self._listing_etag, 'refreshed': self._refreshed, 'projects': self._projects})
+
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as f:
+            f.write(state)
+        os.replace(temporary_path, self.path)
+
+    def _add_project(self, project_name: str, project: dict):
+        "Add a project file in the maps, the content is decoded"
+        self._remove_project(project_name)
+
+        self._projects[project_name] = project
+        self._policies[project_name] = list(project['content'].get('policies', []))
+        for policy_id in self._policies[project_name]:
+            self._policy_project[policy_id] = project_name
+
+    def _remove_project(self, project_name: str):
+        "Remove a project file from the maps"
+        self._projects.pop(project_name, None)
+        for policy_id in self._policies.pop(project_name, []):
+            if self._policy_project.get(policy_id) == project_name:
+                del self._policy_project[policy_id]
+
+    def refresh(self, force: bool=False) -> bool:
+        """
+        Check if the verified list changed, with a conditional request, once max_age is elapsed.
+        The projects removed from the list are removed from the index, the projects whose file changed are requested again when needed.
+
+        :param force: Optional, True for check even if max_age isn't elapsed (default: False)
+        :return: True if the list changed
+        """
+        with self._lock:
+            if not force and self._listing is not None and time() - self._refreshed < self.max_age:
+                return False
+            listing_etag = self._listing_etag
+
+        listing, listing_etag = self._request(repo_url, listing_etag)
+
+        with self._lock:
+            self._listing_etag = listing_etag
+            self._refreshed = time()
+
+            if listing is not None:
+                self._listing = listing
+                self._project_names = {project['name'] for project in listing}
+                # Forget the projects removed or changed since their file was received
+                shas = {project['name']: project['sha'] for project in listing}
+                for project_name in list(self._projects):
+                    if shas.get(project_name) != self._projects[project_name]['sha']:
+                        self._remove_project(project_name)
+
+        self.save()
+
+        return listing is not None
+
+    def listing(self) -> list:
+        """
+        Get the verified list, an entry by project file.
+
+        :return: List of the entries
+        """
+        self.refresh()
+        return self._listing
+
+    def project_names(self) -> set:
+        "Get the names of the verified projects"
+        self.refresh()
+        return self._project_names
+
+    def project_exist(self, project_name: str) -> bool:
+        """
+        Check if the project have been verified by cnft.io.
+
+        :param project_name: Name of the project
+        :return: True if verified
+        """
+        return project_name in self.project_names()
+
+    def _request_project(self, project_name: str) -> dict:
+        "Request the file of a project, its content is decoded"
+        response, _ = self._request(repo_url + project_name)
+        response['content'] = json.loads(base64.b64decode(response['content']))
+
+        return response
+
+    def _load_projects(self, project_names: list):
+        "Request the files of the projects missing in the index, at the same time"
+        with self._lock:
+            missing_projects = [project_name for project_name in project_names if project_name not in self._projects]
+
+        if not missing_projects:
+            return
+
+        for _, project_name, project, error in query_in_parallel(self._request_project, missing_projects, self.max_workers, retries=1):
+            if error is not None:
+                raise error
+            with self._lock:
+                self._add_project(project_name, project)
+
+        self.save()
+
+    def project_info(self, project_name: str) -> dict:
+        """
+        Obtain informations about a verified project.
+
+        :param project_name: Name of the project
+        :return: The file of the project, with its content decoded
+        """
+        if not self.project_exist(project_name):
+            raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
+
+        self._load_projects([project_name])
+
+        return copy.deepcopy(self._projects[project_name])
+
+    def policies(self, project_name: str) -> list:
+        """
+        Obtain the verified policy ids of a project.
+
+        :param project_name: Name of the project
+        :return: List of the policy ids
+        """
+        if not self.project_exist(project_name):
+            raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
+
+        self._load_projects([project_name])
+
+        return list(self._policies[project_name])
+
+    def is_verified(self, policy_id: str, project_name: str=None) -> bool:
+        """
+        Check if a policy id is verified.
+
+        :param policy_id: Policy ID
+        :param project_name: Optional, name of the project of the policy (default: any project)
+        :return: True if verified
+        """
+        if project_name is None:
+            return self.project_of(policy_id) is not None
+
+        if not self.project_exist(project_name):
+            raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
+
+        self._load_projects([project_name])
+
+        return policy_id in self._policies[project_name]
+
+    @staticmethod
+    def _read_archive(archive: bytes, entries: list) -> Dict[str, dict]:
+        """
+        Read the project files of the verified list in an archive of the repository.
+
+        :param archive: The archive, a gzipped tarball with the files under a root directory
+        :param entries: The entries of the verified list wanted
+        :return: Dictionary with the file of each project found, with its content decoded
+        """
+        entries = {entry['name']: entry for entry in entries}
+        projects = {}
+
+        with tarfile.open(fileobj=io.BytesIO(archive), mode='r:gz') as tar:
+            for member in tar:
+                # Only the files at the root of the repository, under the directory of the archive
+                path = member.name.split('/')
+                if not member.isfile() or len(path) != 2 or path[1] not in entries:
+                    continue
+
+                data = tar.extractfile(member).read()
+                # Git sha of the file, compared with the verified list at the next refresh
+                sha = hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+                projects[path[1]] = dict(entries[path[1]], sha=sha, size=len(data), content=json.loads(data))
+
+        return projects
+
+    def load_all(self):
+        "Request the files of every verified project missing in the index, needed for find the project of a policy"
+        entries = [project for project in self.listing() if project.get('type', 'file') == 'file']
+
+        with self._lock:
+            missing_entries = [project for project in entries if project['name'] not in self._projects]
+
+        if len(missing_entries) <= 1:
+            self._load_projects([project['name'] for project in missing_entries])
+            return
+
+        # Every missing project from one archive instead of a request by file
+        projects = self._read_archive(self._request_archive(), missing_entries)
+        with self._lock:
+            for project_name, project in projects.items():
+                self._add_project(project_name, project)
+
+        # The files missing in the archive are requested one by one
+        self._load_projects([project['name'] for project in missing_entries if project['name'] not in projects])
+        self.save()
+
+    def project_of(self, policy_id: str) -> Optional[str]:
+        """
+        Find the verified project of a policy.
+
+        :param policy_id: Policy ID
+        :return: Name of the project or None if the policy isn't verified
+        """
+        self.load_all()
+        return self._policy_project.get(policy_id)
+
+    def projects_of(self, policy_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Find the verified project of several policies, the index is loaded once then each policy is a lookup.
+
+        :param policy_ids: Policy IDs
+        :return: Dictionary with the name of the project of each policy, None if the policy isn't verified
+        """
+        self.load_all()
+        policy_project = self._policy_project
+        return {policy_id: policy_project.get(policy_id) for policy_id in policy_ids}
+
+    def __contains__(self, policy_id: str) -> bool:
+        return self.is_verified(policy_id)
+
+# Index shared by every function of the module, replace it for save the index in a file: cnft_io.cnft_index = VerifiedPolicyIndex(path)
+cnft_index = VerifiedPolicyIndex()
 
 def verified_policies(pandas: bool=False) -> list:
     """
@@ -15,15 +336,9 @@ def verified_policies(pandas: bool=False) -> list:
     :return the list of the verified cnft projects
     """
 
-    url = repo_url
-    req = requests.get(url)
-    
-    if req.status_code == requests.codes.ok:
-        req = req.json() 
-    else:
-        raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
+    listing = cnft_index.listing()
         
-    return pd.DataFrame.from_dict(req).sort_values(by='name') if pandas else req 
+    return import_pandas().DataFrame.from_dict(listing).sort_values(by='name') if pandas else copy.deepcopy(listing)
 
 
 def project_exist(project_name: str) -> bool:
@@ -32,9 +347,7 @@ def project_exist(project_name: str) -> bool:
 
     :param project_name: Name of the project
     """
-    project_names = verified_policies(pandas=True)['name'].tolist()
-
-    return True if project_name in project_names else False
+    return cnft_index.project_exist(project_name)
 
 
 def check_policy_id(policy_id: str, project_name: str) -> bool:
@@ -45,22 +358,8 @@ def check_policy_id(policy_id: str, project_name: str) -> bool:
     :param polict_name: Name of the project
     :return True if verified
     """
-
-    # Check if the project name have been verified by cnft.io
-    if not project_exist(project_name):
-        raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
-    
-    url = repo_url + project_name 
-    
-    req = requests.get(url)
-    if req.status_code == requests.codes.ok:
-        req = req.json()  # the response is a JSON
-        content = json.loads(base64.b64decode(req['content']))
-    else:
-        raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
-        
         
-    return True if policy_id in content['policies'] else False
+    return cnft_index.is_verified(policy_id, project_name)
 
 
 def get_policy_id(project_name: str) -> str:
@@ -70,21 +369,8 @@ def get_policy_id(project_name: str) -> str:
     :param polict_name: Name of the project
     :return the policy id of the project
     """
-    
-    # Check if the project name have been verified by cnft.io
-    if not project_exist(project_name):
-        raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
-    
-    url = repo_url + project_name
-    req = requests.get(url)
-
-    if req.status_code == requests.codes.ok:
-        req = req.json()
-        content = json.loads(base64.b64decode(req['content']))
-    else:
-        raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
-            
-    return content['policies']
+        
+    return cnft_index.policies(project_name)
 
 
 def get_project_info(project_name: str) -> dict:
@@ -93,21 +379,16 @@ def get_project_info(project_name: str) -> dict:
 
     :param project_name: Name of the project
     """
-    
-    # Check if the project name have been verified by cnft.io
-    if not project_exist(project_name):
-        raise ValueError('This project ({}) has not been verified by cnft.io or the project name is incorect.'.format(project_name))
 
-    url = repo_url + project_name
-    req = requests.get(url)
+    return cnft_index.project_info(project_name)
 
-    if req.status_code == requests.codes.ok:
-        req = req.json()
-        decode_content = json.loads(base64.b64decode(req['content']))
-        req['content'] = decode_content
-    else:
-        raise requests.ConnectionError('[ERROR {}] Request failed. {}'.format(req.status_code, req.text))
 
-    return req
+def get_policies_project(policy_ids: list) -> dict:
+    """
+    Find the verified project of several policies.
 
+    :param policy_ids: List of policy IDs
+    :return: Dictionary with the name of the project of each policy, None if the policy isn't verified
+    """
 
+    return cnft_index.projects_of(policy_ids)
@@ -21,6 +21,7 @@ setuptools.setup(
     keywords = ['CARDANO', 'API', 'WRAPPER', 'BLOCKCHAIN', 'BLOCKFROST'],
     license='MIT',
     install_requires=['pandas>=1.3.2', 'requests>=2.26.0', 'typing>=3.7.4.3', 'numpy==1.21.2', 'tqdm>=4.62.2'],
+    extras_require={'async': ['aiohttp>=3.8.1'], 'arrow': ['pyarrow>=8.0.0'], 'fast': ['orjson>=3.6.0']},
     tests_require=['pytest>=6.2.5', 'pytest-runner>=5.3.1', 'tqdm>=4.62.2'],
     test_suite='tests',
     classifiers=[
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+import asyncio
+import unittest
+import pandas as pd
+from cardano_explorer import blockfrost_async_api
+
+stake_address = 'stake1u8uzevd539lxn40jt60g72a649zdphe9e8hrye4nf5jv0js9uzhzg'
+policy_id = '40fa2aa67258b4ce7b5782f74831d46a84c59a0ff0c28262fab21728'
+tx_hash = '117f97ccf6e98a16697e7cc205daf2d0bfe83d849a63df2f40d10bef235848e7'
+
+async def run(method, *args, **kwargs):
+    async with blockfrost_async_api.AsyncAuth(network="mainnet", max_concurrency=4) as cardano_mainnet:
+        return await getattr(cardano_mainnet, method)(*args, **kwargs)
+
+class TEST_BLOCKFROST_ASYNC_API(unittest.TestCase):
+
+    def test_stake(self):
+        self.assertTrue(isinstance(asyncio.run(run('stake_informations', stake_address)), dict))
+        self.assertTrue(isinstance(asyncio.run(run('stake_reward_history', stake_address)), dict))
+        self.assertTrue(isinstance(asyncio.run(run('stake_reward_history', stake_address, pandas=True)), pd.DataFrame))
+
+    def test_epoch(self):
+        self.assertTrue(isinstance(asyncio.run(run('latest_epoch')), dict))
+        self.assertTrue(isinstance(asyncio.run(run('epochs_history', [270, 271])), list))
+
+    def test_asset(self):
+        self.assertTrue(isinstance(asyncio.run(run('assets_policy', policy_id)), dict))
+        self.assertTrue(isinstance(asyncio.run(run('assets_policy_info', policy_id, nb_of_results=100)), list))
+
+    def test_transaction(self):
+        self.assertTrue(isinstance(asyncio.run(run('specific_tx', tx_hash)), dict))
+
+    def test_blocks(self):
+        self.assertTrue(isinstance(asyncio.run(run('latest_block')), dict))
+
+
+if __name__ == '__main__':
+    unittest.main()
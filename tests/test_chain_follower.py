@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import unittest
+from time import time
+from cardano_explorer.chain_follower import ChainFollower
+from cardano_explorer.blockfrost.errors import BlockfrostError
+
+class Chain:
+    "Chain in memory answering the block requests of the follower"
+
+    def __init__(self, nb_blocks: int):
+        self.blocks = []
+        self.extend(nb_blocks)
+
+    def extend(self, nb_blocks: int, fork: str=''):
+        for _ in range(nb_blocks):
+            height = len(self.blocks)
+            previous_block = self.blocks[-1]['hash'] if self.blocks else None
+            self.blocks.append({'height': height, 'hash': '{}{}'.format(fork, height), 'previous_block': previous_block, 'time': time(), 'tx_count': 0})
+
+    def rollback(self, nb_blocks: int, fork: str):
+        del self.blocks[-nb_blocks:]
+        self.extend(nb_blocks + 1, fork)
+
+    def latest_block(self, cached: bool=True) -> dict:
+        return self.blocks[-1]
+
+    def specific_block(self, block_hash_or_nb) -> dict:
+        for block in self.blocks:
+            if block_hash_or_nb in (block['height'], block['hash']):
+                return block
+        raise BlockfrostError('[ERROR 404] Not Found.', 404)
+
+    def next_blocks(self, block_hash_or_nb) -> list:
+        height = self.specific_block(block_hash_or_nb)['height']
+        return self.blocks[height + 1:height + 101]
+
+class TEST_CHAIN_FOLLOWER(unittest.TestCase):
+
+    def test_catch_up(self):
+        chain = Chain(250)
+        follower = ChainFollower(chain, start=10, transactions=False)
+        events = follower.follow()
+        heights = [next(events)['block']['height'] for _ in range(239)]
+        self.assertEqual(heights, list(range(11, 250)))
+        self.assertEqual(follower.tip['hash'], '249')
+
+    def test_rollback(self):
+        chain = Chain(20)
+        follower = ChainFollower(chain, start=15, transactions=False)
+        events = follower.follow()
+        self.assertEqual([next(events)['block']['height'] for _ in range(4)], [16, 17, 18, 19])
+        chain.rollback(3, fork='b')
+        rollback, *blocks = list(follower._catch_up())
+        self.assertEqual(rollback['type'], 'rollback')
+        self.assertEqual(rollback['block']['height'], 16)
+        self.assertEqual([block['height'] for block in rollback['rolled_back']], [19, 18, 17])
+        self.assertEqual([event['block']['hash'] for event in blocks], ['b17', 'b18', 'b19', 'b20'])
+
+    def test_poll_delay(self):
+        chain = Chain(1)
+        follower = ChainFollower(chain, poll_interval=20, min_interval=2, max_interval=60)
+        follower.tip = dict(chain.blocks[-1], time=time() - 5)
+        self.assertAlmostEqual(follower._next_poll_delay(), 15, places=0)
+        follower.tip['time'] = time() - 30
+        follower._missed_polls = 3
+        self.assertEqual(follower._next_poll_delay(), 2)
+        self.assertRaises(AssertionError, ChainFollower, chain, min_interval=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+import io
+import os
+import json
+import tarfile
+import tempfile
+import unittest
+from time import time
+from cardano_explorer import cnft_io
+
+policy_id = '40fa2aa67258b4ce7b5782f74831d46a84c59a0ff0c28262fab21728'
+
+class TEST_CNFT_INDEX(unittest.TestCase):
+
+    def test_policy_index(self):
+        # Index saved in a file and not expired, loaded without request
+        index_path = os.path.join(tempfile.mkdtemp(), 'cnft_index.json')
+        with open(index_path, 'w') as f:
+            json.dump({'listing': [{'name': 'Project', 'sha': '1'}], 'listing_etag': '"1"', 'refreshed': time(),
+                       'projects': {'Project': {'name': 'Project', 'sha': '1', 'content': {'policies': [policy_id]}}}}, f)
+
+        index = cnft_io.VerifiedPolicyIndex(index_path)
+        self.assertTrue(index.project_exist('Project'))
+        self.assertTrue(index.is_verified(policy_id, 'Project'))
+        self.assertEqual(index.policies('Project'), [policy_id])
+        self.assertEqual(index.projects_of([policy_id, 'hgvgy']), {policy_id: 'Project', 'hgvgy': None})
+        self.assertRaises(ValueError, index.policies, 'hgvgy')
+
+        index.save()
+        self.assertEqual(cnft_io.VerifiedPolicyIndex(index_path).project_of(policy_id), 'Project')
+
+    def test_archive(self):
+        # Archive of the repository, the files are under a root directory
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode='w:gz') as tar:
+            for name, data in (('Project', json.dumps({'policies': [policy_id]}).encode()), ('Other', b'{}')):
+                member = tarfile.TarInfo('Cardano-NFTs-policyIDs-1a2b3c/' + name)
+                member.size = len(data)
+                tar.addfile(member, io.BytesIO(data))
+
+        projects = cnft_io.VerifiedPolicyIndex._read_archive(archive.getvalue(), [{'name': 'Project', 'sha': '1', 'type': 'file'}])
+        self.assertEqual(list(projects), ['Project'])
+        self.assertEqual(projects['Project']['content'], {'policies': [policy_id]})
+        # Git sha of the file, as in the verified list
+        self.assertEqual(projects['Project']['sha'], '2fae34fc400780ef8e0f294147fe6e839e548d3a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+from time import sleep
+from cardano_explorer import blockfrost_api
+from cardano_explorer.blockfrost.errors import BlockfrostError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from mock_server import MockBlockfrost
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Offline tests of the client against the local stand-in of the Blockfrost API used by the benchmarks
+
+asset = 'a0028f350aaabe0545fdcb56b039bfb08e4bb4d8c4d7c3c7d481c235484f534b59'
+address = 'addr1q8z24xgrlj3m2qjh2vxyqg2fh33y3tegufkll5c4lu8u35gkhpw3h4yhn93ve2whllg0wjazjs5jj8332mgqe332f3uq8m7m6h'
+stake_addresses = ['stake1u9mock0001', 'stake1u9mock0002', 'stake1u9mock0003']
+
+def create_auth(mock: MockBlockfrost, **kwargs) -> blockfrost_api.Auth:
+    "Client of the mock, without client rate limit"
+    return blockfrost_api.Auth(network=mock.url, apiKey='test', rate_limit=None, **kwargs)
+
+class TEST_MOCK_SERVER(unittest.TestCase):
+
+    def test_pager_order(self):
+        with MockBlockfrost(nb_transactions=1050) as mock, create_auth(mock, max_concurrency=8) as auth:
+            txs = auth.asset_transactions(asset, nb_of_results=None, output='records')
+            self.assertEqual([tx['block_height'] for tx in txs], list(range(7000000, 7001050)))
+            txs = auth.asset_transactions(asset, data_order='desc', nb_of_results=None, output='records')
+            self.assertEqual([tx['block_height'] for tx in txs], list(range(7001049, 6999999, -1)))
+            self.assertEqual(len(list(auth.asset_transactions(asset, nb_of_results=None, stream=True))), 1050)
+            # The api calls of each query are kept in the metrics
+            self.assertEqual(auth.stats.summary()['calls'], 2)
+            # pandas stay the second positional parameter
+            self.assertEqual(auth.address_transaction(address, True)['block_height'].tolist(), list(range(7000000, 7001050)))
+
+    def test_pager_cancel(self):
+        with MockBlockfrost(latency=0.01, nb_transactions=10000) as mock, create_auth(mock, max_concurrency=4) as auth:
+            txs = auth.asset_transactions(asset, nb_of_results=None, stream=True)
+            next(txs)
+            txs.close()
+            sleep(0.1)
+            # The first page and the pages requested ahead, not the 100 pages
+            self.assertLessEqual(mock.requests, 1 + 2 * 4)
+
+    def test_retry_429(self):
+        with MockBlockfrost(nb_transactions=1000, rate_limit_every=4, retry_after=0.01) as mock, create_auth(mock, max_concurrency=4) as auth:
+            txs = auth.asset_transactions(asset, nb_of_results=None, output='records')
+            self.assertEqual(len(txs), 1000)
+            self.assertTrue(mock.rate_limited > 0)
+            self.assertEqual(auth.stats.summary()['retries'], mock.rate_limited)
+
+    def test_checkpoint_resume(self):
+        checkpoint_path = os.path.join(tempfile.mkdtemp(), 'export.json')
+        with MockBlockfrost(nb_transactions=1050, fail_from_page=4) as mock, create_auth(mock, max_retries=0) as auth:
+            self.assertRaises(BlockfrostError, auth.asset_transactions, asset, nb_of_results=None, output='records', checkpoint_path=checkpoint_path)
+            self.assertTrue(os.path.exists(checkpoint_path))
+            mock.fail_from_page = 0
+            mock.reset_counters()
+            txs = auth.asset_transactions(asset, nb_of_results=None, output='records', checkpoint_path=checkpoint_path)
+            self.assertEqual([tx['block_height'] for tx in txs], list(range(7000000, 7001050)))
+            # Only the pages from the 4th to the 12th, the empty page after the last one
+            self.assertEqual(mock.requests, 9)
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+    def test_sync(self):
+        sync_path = os.path.join(tempfile.mkdtemp(), 'sync.sqlite')
+        with MockBlockfrost(nb_transactions=250) as mock, create_auth(mock, sync_path=sync_path) as auth:
+            self.assertEqual(len(auth.address_transaction(address, sync=True)), 250)
+            mock.nb_transactions = 280
+            mock.reset_counters()
+            txs = auth.address_transaction(address, sync=True)
+            self.assertEqual([tx['block_height'] for tx in txs], list(range(7000000, 7000280)))
+            # The newest page hold the new transactions and the mark
+            self.assertEqual(mock.requests, 1)
+            # The typed output convert the records stored, the raw output is rejected before any request
+            self.assertEqual([tx.block_height for tx in auth.address_transaction(address, sync=True, output='typed')], list(range(7000000, 7000280)))
+            mock.reset_counters()
+            self.assertRaises(ValueError, auth.address_transaction, address, sync=True, output='raw')
+            self.assertEqual(mock.requests, 0)
+
+    def test_stake_rewards_corr_failed_pool(self):
+        stake_addresses_batch = ['stake1u9mock{:04d}'.format(i) for i in range(10)]
+        with MockBlockfrost(missing_keys=('pool1mock0003',)) as mock, create_auth(mock, max_concurrency=4, max_retries=0) as auth:
+            paid_by_pool = [stake_address for stake_address in stake_addresses_batch
+                            if any(reward['pool_id'] == 'pool1mock0003' for reward in auth.stake_reward_history(stake_address, output='records'))]
+            self.assertTrue(0 < len(paid_by_pool) < len(stake_addresses_batch))
+            # Only the stake addresses paid by the pool failed are failed
+            df, failed_addresses = auth.stake_rewards_corr(stake_addresses_batch, pandas=True, return_failed=True)
+            self.assertEqual(sorted(failed_addresses), paid_by_pool)
+            self.assertEqual(sorted(df['stake_address'].unique()), [stake_address for stake_address in stake_addresses_batch if stake_address not in paid_by_pool])
+            self.assertRaises(BlockfrostError, auth.stake_rewards_corr, paid_by_pool[0])
+
+    def test_stake_rewards_corr_failed_epoch(self):
+        stake_addresses_batch = ['stake1u9mock{:04d}'.format(i) for i in range(10)]
+        with MockBlockfrost(missing_keys=('260',)) as mock, create_auth(mock, max_concurrency=4, max_retries=0) as auth:
+            rewarded_in_epoch = [stake_address for stake_address in stake_addresses_batch
+                                 if any(reward['epoch'] == 260 for reward in auth.stake_reward_history(stake_address, output='records'))]
+            self.assertTrue(0 < len(rewarded_in_epoch) < len(stake_addresses_batch))
+            # Only the stake addresses rewarded in the epoch failed are failed, the histories of the others are kept
+            df, failed_addresses = auth.stake_rewards_corr(stake_addresses_batch, pandas=True, return_failed=True)
+            self.assertEqual(sorted(failed_addresses), rewarded_in_epoch)
+            self.assertEqual(sorted(df['stake_address'].unique()), [stake_address for stake_address in stake_addresses_batch if stake_address not in rewarded_in_epoch])
+            self.assertTrue(df['epoch_block_count'].notna().all())
+            self.assertRaises(BlockfrostError, auth.stake_rewards_corr, rewarded_in_epoch[0])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_address_utxo_arrow(self):
+        with MockBlockfrost() as mock, create_auth(mock) as auth:
+            utxos = auth.address_utxo(address)
+            # The amounts of each UTXO are a list of units with their quantity
+            amounts = [[(amount['unit'], int(amount['quantity'])) for amount in utxo['amount']] for utxo in utxos]
+            table = auth.address_utxo(address, output='arrow')
+            self.assertEqual(table.schema.field('amount').type, pyarrow.list_(pyarrow.struct([('unit', pyarrow.string()), ('quantity', pyarrow.decimal128(38, 0))])))
+            self.assertEqual([[(amount['unit'], int(amount['quantity'])) for amount in utxo] for utxo in table.column('amount').to_pylist()], amounts)
+            table = auth.address_utxo(address, stream=True, output='arrow').read_all()
+            self.assertEqual(table.column('tx_hash').to_pylist(), [utxo['tx_hash'] for utxo in utxos])
+
+    def test_registered_polls(self):
+        pool_ids = ['pool1mock{:04d}'.format(i) for i in range(30)]
+        with MockBlockfrost(nb_pools=30, page_size=20) as mock, create_auth(mock) as auth:
+            self.assertEqual(list(auth.registered_polls(nb_of_results=None)['registered_polls_id'].values()), pool_ids)
+            self.assertEqual(auth.registered_polls(nb_of_results=None, pandas=True)['registered_polls_id'].tolist(), pool_ids)
+            self.assertEqual(auth.registered_polls(nb_of_results=None, output='records'), pool_ids)
+            self.assertEqual(list(auth.registered_polls(nb_of_results=None, stream=True)), pool_ids)
+            if pyarrow is not None:
+                self.assertEqual(auth.registered_polls(nb_of_results=None, output='arrow').column('registered_polls_id').to_pylist(), pool_ids)
+                self.assertEqual(auth.registered_polls(nb_of_results=None, stream=True, output='arrow').read_all().column('registered_polls_id').to_pylist(), pool_ids)
+        with MockBlockfrost(nb_pools=0) as mock, create_auth(mock) as auth:
+            self.assertEqual(auth.registered_polls(), {'registered_polls_id': {}})
+
+    def test_query_keys(self):
+        txs_hashes = ['{:064x}'.format(i) for i in range(1, 6)]
+        with MockBlockfrost(missing_keys=(txs_hashes[2],)) as mock, create_auth(mock, max_concurrency=4, max_retries=0) as auth:
+            expected = [auth.specific_tx(txs_hash) for txs_hash in txs_hashes[:2]]
+            mock.reset_counters()
+            # Each key is requested once, the responses are in the order of the keys and None for a key failed
+            txs, failed_txs = auth.specific_txs(txs_hashes + txs_hashes[:2], return_failed=True)
+            self.assertEqual(mock.requests, 5)
+            self.assertEqual(txs[:2] + txs[5:], expected * 2)
+            self.assertIsNone(txs[2])
+            self.assertEqual(list(failed_txs), [txs_hashes[2]])
+            self.assertEqual(failed_txs[txs_hashes[2]].status_code, 404)
+            # Without return_failed a warning lists the keys failed
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                utxos = auth.txs_utxos(txs_hashes)
+            self.assertEqual([tx_utxos and tx_utxos['hash'] for tx_utxos in utxos], txs_hashes[:2] + [None] + txs_hashes[3:])
+            self.assertEqual(len(caught), 1)
+            self.assertIn(txs_hashes[2], str(caught[0].message))
+            metadata, failed_txs = auth.txs_metadata(txs_hashes[3:], return_failed=True)
+            self.assertEqual((len(metadata), failed_txs), (2, {}))
+            blocks = auth.specific_blocks(['7000002', txs_hashes[0], '7000001'])
+            self.assertEqual([block['height'] for block in blocks[::2]], [7000002, 7000001])
+            self.assertEqual(blocks[1]['hash'], txs_hashes[0])
+            assets = [asset[:56] + '{:08x}'.format(i) for i in range(3)]
+            self.assertEqual([informations['asset'] for informations in auth.specific_assets(assets[::-1])], assets[::-1])
+
+    def test_assets_policy_info(self):
+        policy_id = asset[:56]
+        assets = [policy_id + '{:08x}'.format(i) for i in range(250)]
+        failed_asset = assets[17]
+        checkpoint_path = os.path.join(tempfile.mkdtemp(), 'assets.checkpoint')
+        with MockBlockfrost(nb_assets=250, missing_keys=(failed_asset,)) as mock, create_auth(mock, max_concurrency=4, max_retries=0) as auth:
+            # The assets are in the order of the policy, the assets failed are returned apart
+            assets_informations, failed_assets = auth.assets_policy_info(policy_id, return_failed=True)
+            self.assertEqual([informations['asset'] for informations in assets_informations], [item for item in assets if item != failed_asset])
+            self.assertEqual(failed_assets, [failed_asset])
+            with self.assertWarns(UserWarning) as caught:
+                self.assertEqual(len(auth.assets_policy_info(policy_id, pandas=True)), 249)
+            self.assertIn(failed_asset, str(caught.warning))
+            if pyarrow is not None:
+                table, _ = auth.assets_policy_info(policy_id, output='arrow', return_failed=True)
+                self.assertEqual(table.column('asset').to_pylist(), [item for item in assets if item != failed_asset])
+                self.assertEqual(table.schema.field('quantity').type, pyarrow.decimal128(38, 0))
+            # The checkpoint is kept while an asset failed, the next call only request it
+            _, failed_assets = auth.assets_policy_info(policy_id, return_failed=True, checkpoint_path=checkpoint_path)
+            self.assertEqual(failed_assets, [failed_asset])
+            self.assertTrue(os.path.exists(checkpoint_path))
+            mock.missing_keys.clear()
+            mock.reset_counters()
+            assets_informations, failed_assets = auth.assets_policy_info(policy_id, return_failed=True, checkpoint_path=checkpoint_path)
+            self.assertEqual(mock.requests, 1)
+            self.assertEqual(([informations['asset'] for informations in assets_informations], failed_assets), (assets, []))
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+    def test_portfolio(self):
+        with MockBlockfrost() as mock, create_auth(mock, max_concurrency=4) as auth:
+            portfolio = auth.portfolio(stake_addresses[0])
+            self.assertEqual(portfolio['stake_address'], stake_addresses[0])
+            self.assertEqual(portfolio['holdings'], auth.portfolio(stake_addresses[0], utxos=False)['holdings'])
+            # The holdings are the sum of the holdings of the addresses
+            lovelace = sum(holdings.get('lovelace', 0) for holdings in portfolio['addresses'].values())
+            self.assertEqual(portfolio['holdings']['lovelace'], lovelace)
+            self.assertEqual(portfolio['holdings']['lovelace'], int(portfolio['controlled_amount']) - int(portfolio['withdrawable_amount']))
+            portfolios = auth.portfolio(stake_addresses)
+            self.assertEqual([portfolio['stake_address'] for portfolio in portfolios], stake_addresses)
+            df = auth.portfolio(stake_addresses, pandas=True)
+            self.assertEqual(list(df.columns), ['stake_address', 'unit', 'quantity'])
+            self.assertEqual(df['stake_address'].unique().tolist(), stake_addresses)
+
+    def test_portfolio_failed_address(self):
+        # The UTXOs of the second address of the 3rd stake address fail, its other addresses are received
+        with MockBlockfrost(missing_keys=('addr1mock000301',)) as mock, create_auth(mock, max_concurrency=4, max_retries=0) as auth:
+            expected = {portfolio['stake_address']: portfolio['holdings'] for portfolio in auth.portfolio(stake_addresses[:2])}
+            portfolios, failed_addresses = auth.portfolio(stake_addresses, return_failed=True)
+            self.assertEqual(failed_addresses, [stake_addresses[2]])
+            self.assertEqual({portfolio['stake_address']: portfolio['holdings'] for portfolio in portfolios}, expected)
+            df, failed_addresses = auth.portfolio(stake_addresses, pandas=True, return_failed=True)
+            self.assertEqual(failed_addresses, [stake_addresses[2]])
+            self.assertEqual(df['stake_address'].unique().tolist(), stake_addresses[:2])
+            self.assertRaises(BlockfrostError, auth.portfolio, stake_addresses[2])
+
+
+if __name__ == '__main__':
+    unittest.main()